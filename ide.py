@@ -234,6 +234,12 @@ file_is_modified = False
 saved_as_file = False
 current_file_name = None
 
+# Tokens from the last lexical analysis, and the span of the editor text
+# changed since then as (start, end, length change)
+lexed_tokens = None
+lexed_errors = None
+edited_span = None
+
 if __name__ == "__main__":
 
     cwd = os.getcwd()
@@ -358,7 +364,7 @@ if __name__ == "__main__":
         # Clear the table
         token_table.setRowCount(0)
 
-        tokens, _ = ic.run_lexical(current_file_name, code)
+        tokens, _ = lex_document(code)
         print(f"DEBUG: {tokens}")
         for token in tokens:
             row_pos = token_table.rowCount()
@@ -373,6 +379,34 @@ if __name__ == "__main__":
         terminalIO.write(clear_command)
         terminalIO.write(f"ic {current_file_name} -m lexical -v\r".encode("utf-8"))
 
+    def record_edit(position, removed, added):
+        global edited_span
+        if edited_span is None:
+            edited_span = (position, position + added, added - removed)
+            return
+
+        # Grow the span to cover both edits, in current text positions
+        start, end, delta = edited_span
+        end = max(end, position + removed) + added - removed
+        edited_span = (min(start, position), end, delta + added - removed)
+
+    def lex_document(code):
+        global lexed_tokens, lexed_errors, edited_span
+
+        if (
+            lexed_tokens is None
+            or lexed_tokens.source.fn != current_file_name
+            or edited_span is not None and len(code) != len(lexed_tokens.source.text) + edited_span[2]
+        ):
+            lexed_tokens, lexed_errors = ic.run_lexical(current_file_name, code)
+        elif edited_span is not None:
+            start, end, delta = edited_span
+            edit = (start, end - start - delta, code[start:end])
+            lexed_tokens, lexed_errors = ic.rerun_lexical(lexed_tokens, lexed_errors, edit)
+
+        edited_span = None
+        return lexed_tokens, lexed_errors
+
     def analyze_syntax():
         global current_file_name
 
@@ -388,7 +422,7 @@ if __name__ == "__main__":
         # Clear the table
         token_table.setRowCount(0)
 
-        tokens, _ = ic.run_lexical(current_file_name, code)
+        tokens, _ = lex_document(code)
         for token in tokens:
             row_pos = token_table.rowCount()
             token_table.insertRow(row_pos)
@@ -510,6 +544,7 @@ if __name__ == "__main__":
     text_edit.lineNumberArea.setObjectName("line_number_area")
     text_edit.setObjectName("text_editor")
     text_edit.setPlaceholderText("Enter code here...")
+    text_edit.document().contentsChange.connect(record_edit)
 
     # SECTION - Console
     terminal = Terminal(500, 300)
@@ -1,7 +1,8 @@
 import argparse
 import datetime
 import os
-from .compiler import run_lexical, run_syntax
+from .compiler import LEXER_ENGINES, check_syntax, run_lexical, run_semantic, run_syntax, stream_lexical, stream_syntax
+from .utils.mapped_file import MappedFile
 import time
 
 
@@ -14,7 +15,33 @@ def main():
         "file", nargs="?", type=str, help="The .ic file to run.", default=""
     )
     parser.add_argument(
-        "--mode", "-m", choices=["lexical", "syntax"], help="Mode to run."
+        "--mode", "-m", choices=["lexical", "syntax", "semantic"], default="semantic",
+        help="Mode to run (default: semantic, which reports syntax errors too)."
+    )
+    parser.add_argument(
+        "--lexer-engine", choices=list(LEXER_ENGINES), default="state",
+        help="Lexer backend to tokenize with."
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=None,
+        help="Processes to lex files of 1 MB and up with (default: 1); in syntax mode "
+        "without -v, also processes to check function bodies with, printing only the errors."
+    )
+    parser.add_argument(
+        "--mmap", action="store_true",
+        help="Map the file into memory and lex it a window at a time."
+    )
+    parser.add_argument(
+        "--lazy-bodies", action="store_true",
+        help="Skip over function bodies in syntax mode instead of checking them."
+    )
+    parser.add_argument(
+        "--cache", action="store_true",
+        help="Reuse the parse of an unchanged file from .ic_cache/."
+    )
+    parser.add_argument(
+        "--optimize", "-O", action="store_true",
+        help="Fold constant expressions and Constants in semantic mode."
     )
     parser.add_argument(
         "--verbose", "-v", help="Run analysis in verbose mode.", action="store_true"
@@ -27,16 +54,13 @@ def main():
     #     cli()
     #     return
 
-    with open(args.file, "r") as file:
-        code = file.read()
-
-    if args.mode == "lexical":
-        _run_lexical(args.file, code)
-    elif args.mode == "syntax":
-        args.verbose = True
-        _run_syntax(args.file, code)
-    # else:
-    #     _run_semantic(args.file, code)
+    with (MappedFile(args.file) if args.mmap else open(args.file, "r")) as file:
+        if args.mode == "lexical":
+            _run_lexical(args.file, file)
+        elif args.mode == "syntax":
+            _run_syntax(args.file, file)
+        else:
+            _run_semantic(args.file, file)
 
 def format_time(seconds):
     if seconds < 1e-6:
@@ -60,9 +84,12 @@ def log_runtime(func):
 
 
 @log_runtime
-def _run_lexical(file_path, code):
+def _run_lexical(file_path, file):
     start_time = time.time()
-    tokens, errors = run_lexical(file_path, code)
+    if args.mmap:
+        tokens, errors = stream_lexical(file_path, file, args.lexer_engine, args.verbose)
+    else:
+        tokens, errors = run_lexical(file_path, file.read(), args.lexer_engine, args.jobs or 1)
 
     if errors:
         if args.verbose:
@@ -76,25 +103,36 @@ def _run_lexical(file_path, code):
         print("Tokens:", tokens)
 
 @log_runtime
-def _run_syntax(file_path, code):
+def _run_syntax(file_path, file):
     start_time = time.time()
-    tokens, ast, errors = run_syntax(file_path, code)
+    # With -j and no -v only the errors are wanted, so function bodies are
+    # checked in worker processes and no tree is built to print
+    check_only = args.jobs not in (None, 1) and not args.verbose and not args.cache and not args.lazy_bodies
+    if check_only:
+        ast, errors = None, check_syntax(file_path, file.read(), args.lexer_engine, args.jobs)
+    elif args.cache and not args.lazy_bodies:
+        _, ast, errors = run_syntax(file_path, file.read(), args.lexer_engine, jobs=args.jobs or 1, cache=True)
+    elif args.jobs not in (None, 1) and not args.lazy_bodies:
+        _, ast, errors = run_syntax(file_path, file.read(), args.lexer_engine, jobs=args.jobs)
+    else:
+        ast, errors = stream_syntax(file_path, file, args.lexer_engine, args.lazy_bodies)
 
     if errors:
         for error in errors:
             print(error.as_string())
-    else:
-        if args.verbose:
-            print("AST:", ast)
+    elif not check_only:
+        print("AST:", ast)
 
 
-# @log_runtime
-# def _run_semantic(file_path, code):
-#     start_time = time.time()
-#     tokens, ast, res, errors = run_semantic(file_path, code)
-#     if errors:
-#         for error in errors:
-#             print(error.as_string())
+@log_runtime
+def _run_semantic(file_path, file):
+    start_time = time.time()
+    tokens, ast, res, errors = run_semantic(file_path, file.read(), args.lexer_engine, args.jobs or 1, args.cache, args.optimize)
+    if errors:
+        for error in errors:
+            print(error.as_string())
+    elif args.verbose:
+        print("AST:", ast)
 
 # def cli():
 #     now = datetime.datetime.now()
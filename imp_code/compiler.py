@@ -1,27 +1,133 @@
 from imp_code.components.lexer2 import *
+from imp_code.components.regex_lexer import RegexLexer
+from imp_code.components.parallel_lexer import PARALLEL_MIN_SIZE, lex_parallel
+from imp_code.components.parallel_parser import parse_parallel
 from imp_code.components.syntax import *
+from imp_code.components.semantic import SemanticAnalyzer
+from imp_code.components.optimizer import ConstantFolder
 from imp_code.utils.nodes import *
 from imp_code.utils.context import *
+from imp_code.utils import compile_cache
 
 #######################################
 # RUN
 #######################################
 
+LEXER_ENGINES = {
+    "state": Lexer,
+    "regex": RegexLexer,
+}
 
-def run_lexical(fn, text):
-    lexer = Lexer(fn, text)
+def run_lexical(fn, text, engine="state", jobs=1):
+    if jobs != 1 and len(text) >= PARALLEL_MIN_SIZE:
+        return lex_parallel(LEXER_ENGINES[engine], fn, text, jobs)
+
+    lexer = LEXER_ENGINES[engine](fn, text)
     tokens, errors = lexer.make_tokens()
     return tokens, errors
 
-def run_syntax(fn, text):
-    lexer = Lexer(fn, text)
-    tokens, errors = lexer.make_tokens()
+def rerun_lexical(tokens, errors, edit, engine="state"):
+    offset, deleted, inserted = edit
+    return LEXER_ENGINES[engine].relex(tokens, errors, offset, deleted, inserted)
+
+def run_syntax(fn, text, engine="state", lazy_bodies=False, jobs=1, cache=False):
+    # A lazy parse would have to parse every body to be cached, so it is not
+    cache = cache and not lazy_bodies
+    if cache:
+        cached = compile_cache.load(fn, text)
+        if cached:
+            tokens, ast = cached
+            return tokens[:-1], ast, None
+
+    tokens, ast, errors = _lex_and_parse(fn, text, engine, lazy_bodies, jobs)
+
+    if cache and ast and not errors:
+        compile_cache.store(fn, text, tokens, ast)
+
+    return tokens[:-1], ast, errors
+
+def _lex_and_parse(fn, text, engine, lazy_bodies, jobs):
+    # The tree is wanted whole, so jobs only goes to the lexer: rebuilding
+    # bodies parsed in other processes costs more than parsing them here
+    tokens, errors = _lex_for_parse(fn, text, engine, jobs)
 
     if errors:
-        return tokens[:-1], None, errors
+        return tokens, None, errors
 
-    parser = Parser(tokens)
+    parser = Parser(tokens, lazy_bodies)
     ast = parser.parse()
 
-    return tokens[:-1], ast.node, [ast.error] if ast.error else None
+    return tokens, ast.node, parser.errors or None
+
+def _lex_for_parse(fn, text, engine, jobs):
+    if jobs != 1 and len(text) >= PARALLEL_MIN_SIZE:
+        return lex_parallel(LEXER_ENGINES[engine], fn, text, jobs, trivia=False)
+
+    lexer = LEXER_ENGINES[engine](fn, text, trivia=False)
+    return lexer.make_tokens()
+
+def check_syntax(fn, text, engine="state", jobs=None):
+    """Returns the syntax errors of text, or None, with function bodies
+    checked in worker processes. For callers that want only the errors,
+    such as a background check in an editor: the bodies are not kept.
+    """
+    tokens, errors = _lex_for_parse(fn, text, engine, jobs)
+
+    if errors:
+        return errors
+
+    _, errors = parse_parallel(tokens, jobs)
+    return errors
+
+def run_semantic(fn, text, engine="state", jobs=1, cache=False, optimize=False):
+    tokens, ast, errors = run_syntax(fn, text, engine, jobs=jobs, cache=cache)
+
+    if errors:
+        return tokens, None, None, errors
+
+    analyzer = SemanticAnalyzer()
+    errors = analyzer.analyze(ast)
+
+    # Folding assumes well-typed operands, so it runs on a checked program
+    if optimize and not errors:
+        errors = ConstantFolder(analyzer).optimize(ast)
+
+    return tokens, ast, analyzer, errors
+
+
+class LexicalErrorFound(Exception):
+    pass
+
+def stop_at_errors(tokens, errors):
+    for token in tokens:
+        if errors:
+            raise LexicalErrorFound()
+        yield token
+
+def stream_lexical(fn, stream, engine="state", keep_tokens=True):
+    errors = []
+    tokens = []
+    for token in LEXER_ENGINES[engine].iter_tokens(fn, stream, errors):
+        if keep_tokens:
+            tokens.append(token)
+    return tokens, errors
+
+def stream_syntax(fn, stream, engine="state", lazy_bodies=False):
+    errors = []
+    tokens = LEXER_ENGINES[engine].iter_tokens(fn, stream, errors, trivia=False)
+
+    try:
+        parser = Parser(stop_at_errors(tokens, errors), lazy_bodies)
+        ast = parser.parse()
+    except LexicalErrorFound:
+        ast = None
+
+    # Lexical errors win over syntax errors, as in run_syntax, so the rest
+    # of the stream is lexed to report all of them
+    for _ in tokens:
+        pass
+
+    if errors:
+        return None, errors
 
+    return ast.node, parser.errors or None
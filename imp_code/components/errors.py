@@ -1,3 +1,5 @@
+from copy import copy
+
 #######################################
 # ERRORS
 #######################################
@@ -45,6 +47,12 @@ class Error:
         result += "\n\n" + string_with_arrows(self.pos_start.ftxt, self.pos_start, self.pos_end)
         return result
 
+    def shift(self, offset_delta, line_delta):
+        error = copy(self)
+        error.pos_start = self.pos_start.shift(offset_delta, line_delta)
+        error.pos_end = self.pos_end.shift(offset_delta, line_delta)
+        return error
+
 
 class IllegalCharError(Error):
     def __init__(self, pos_start, pos_end, details):
@@ -73,3 +81,7 @@ class ExceedDecimalError(Error):
 class InvalidSyntaxError(Error):
     def __init__(self, pos_start, pos_end, details=''):
         super().__init__(pos_start, pos_end, 'Invalid Syntax', details)
+
+class SemanticError(Error):
+    def __init__(self, pos_start, pos_end, details=''):
+        super().__init__(pos_start, pos_end, 'Semantic Error', details)
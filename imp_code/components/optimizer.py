@@ -0,0 +1,323 @@
+import operator
+from fractions import Fraction
+
+from ..utils.nodes import *
+from ..utils.tokens import *
+from ..utils.visitor import NodeTransformer
+from .errors import *
+
+#######################################
+# OPTIMIZER
+#######################################
+
+# The node the parser builds for each literal type
+LITERAL_NODES = {
+    TT_INT_LITERAL: NumeralNode,
+    TT_FLOAT_LITERAL: DecimalNode,
+    TT_TRUE: VeracityNode,
+    TT_FALSE: VeracityNode,
+    TT_NULL: VeracityNode,
+}
+
+COMPARISONS = {
+    TT_EQUALTO: operator.eq,
+    TT_NOTEQUAL: operator.ne,
+    TT_LESSTHAN: operator.lt,
+    TT_GREATERTHAN: operator.gt,
+    TT_LESSTHANEQUAL: operator.le,
+    TT_GREATERTHANEQUAL: operator.ge,
+}
+
+# Digits a value past a limit shows in its error
+REPORTED_DIGITS = 30
+
+ARITHMETIC = {
+    TT_PLUS: operator.add,
+    TT_MINUS: operator.sub,
+    TT_MUL: operator.mul,
+}
+
+
+def literal_value(tok):
+    # The exact value of a literal token: int for a Numeral, Fraction for a
+    # Decimal, bool for a Veracity, None for anything else
+    if tok.type == TT_INT_LITERAL:
+        return int(tok.value)
+    if tok.type == TT_FLOAT_LITERAL:
+        return Fraction(tok.value)
+    if tok.type in VERACITY_LITERALS:
+        return tok.type == TT_TRUE
+    return None
+
+
+def token_of(node):
+    # The token of a literal operand or a variable
+    if isinstance(node, TokenNode):
+        return node.tok
+    if isinstance(node, LiteralNode):
+        return node.token
+    if isinstance(node, AccessNode):
+        return node.id_tok
+    return node
+
+
+def edge_token(node, last=False):
+    # The first token of an expression, or its last
+    return token_of(expression_edge(node, last))
+
+
+def set_operands(node, operands):
+    # node, an operator, over the given operand nodes
+    if isinstance(node, BinOpNode):
+        node.left_node, node.right_node = operands
+    else:
+        node.node, = operands
+    return node
+
+
+def decimal_text(value):
+    # A Decimal rounded to FLOAT_PRECISION_LIM places in fixed point, with
+    # at least one digit after the point, as the lexer writes one
+    whole, fraction = divmod(int(abs(value) * 10 ** FLOAT_PRECISION_LIM), 10 ** FLOAT_PRECISION_LIM)
+    digits = f'{fraction:0{FLOAT_PRECISION_LIM}d}'.rstrip('0') or '0'
+    return f"{'-' if value < 0 else ''}{whole}.{digits}"
+
+
+def reported_value(value):
+    # The text of a value past a limit for its error, cut short when an
+    # exact value has grown too long to show
+    if abs(value) >= 10 ** REPORTED_DIGITS:
+        return f'more than {REPORTED_DIGITS} digits'
+    return decimal_text(value) if isinstance(value, Fraction) else str(value)
+
+
+def literal_token(value, start, end, source):
+    # The token a literal with value would be lexed as, spanning start to end
+    if isinstance(value, bool):
+        return Tokens(TT_TRUE if value else TT_FALSE, TT_TRUE if value else TT_FALSE, start, end, source)
+    if isinstance(value, int):
+        return Tokens(TT_INT_LITERAL, str(value), start, end, source)
+    return Tokens(TT_FLOAT_LITERAL, decimal_text(value), start, end, source)
+
+
+class ConstantFolder(NodeTransformer):
+    """Folds operators whose operands are all known into the literal they
+    evaluate to, and puts the value of a Constant in place of each use of
+    it, once its initializer has folded to a literal.
+
+    Values fold exactly, a Decimal as a Fraction, and only the literal that
+    ends up in the tree keeps to the limits of the literals it stands for:
+    a Numeral has at most INT_LIM digits; a Decimal has at most FLOAT_LIM
+    digits before its point and is rounded to FLOAT_PRECISION_LIM after it.
+    A literal past a limit is reported and its operator is left as it is,
+    over its folded operands. So is a division by zero, while a Decimal
+    that would round to zero is left without a report. Numeral division
+    truncates toward zero.
+
+    Runs on a program the SemanticAnalyzer passed without errors, whose
+    `constants` tell which Constant each use refers to. A folded literal's
+    token spans the expression it replaced; it is not in the program's
+    TokenBuffer.
+    """
+
+    def __init__(self, analyzer):
+        self.constants = analyzer.constants
+        # The value of each Constant whose initializer folded to a literal
+        self.values = {}
+        self.errors = []
+
+    def optimize(self, node):
+        self.visit(node)
+        return self.errors or None
+
+    def visit_DeclareNode(self, node):
+        identifiers = []
+        for id_tok, value, is_array, array_size in node.identifiers:
+            if isinstance(value, list):
+                value = [self.fold(item) for item in value]
+            elif value is not None:
+                value = self.fold(value)
+                symbol = self.constants.get(id_tok)
+                if symbol is not None and not is_array:
+                    self.bind(symbol, value)
+            identifiers.append((id_tok, value, is_array, array_size))
+
+        node.identifiers = identifiers
+        return node
+
+    def bind(self, symbol, value):
+        value = self.constant(value)
+        if value is None:
+            return
+        if symbol.type == TT_FLOAT and not isinstance(value, bool):
+            value = Fraction(value)
+        self.values[symbol] = value
+
+    def visit_BinOpNode(self, node):
+        return self.fold(node)
+
+    visit_UnaryOpNode = visit_AccessNode = visit_BinOpNode
+
+    #######################################
+    # FOLDING
+    #######################################
+
+    def fold(self, node):
+        """The expression node folded as far as it goes."""
+        return self.place(self.evaluate(node))
+
+    def evaluate(self, node):
+        """Evaluates an expression into a (node, value, operands) entry.
+        Operands are evaluated before the operator that joins them, off a
+        stack, so a long chain does not recurse.
+
+        An entry whose value is known leaves its node as it is, and keeps
+        the entries of its operands for place() in case the value turns
+        out past a limit. An operator that cannot fold gets its operands'
+        placed nodes and no value.
+        """
+        results = []
+        stack = [(node, False)]
+
+        while stack:
+            node, operands_evaluated = stack.pop()
+
+            if isinstance(node, BinOpNode):
+                if not operands_evaluated:
+                    stack += [(node, True), (node.right_node, False), (node.left_node, False)]
+                    continue
+                right = results.pop()
+                left = results.pop()
+                results.append(self.fold_binary(node, left, right))
+            elif isinstance(node, UnaryOpNode) and not node.is_post:
+                if not operands_evaluated:
+                    stack += [(node, True), (node.node, False)]
+                    continue
+                results.append(self.fold_unary(node, results.pop()))
+            elif isinstance(node, AccessNode):
+                symbol = self.constants.get(node)
+                results.append((node, self.values.get(symbol), ()))
+            elif isinstance(node, FuncCallNode):
+                node.args = [self.fold(arg) if isinstance(arg, AccessNode) else arg for arg in node.args]
+                results.append((node, None, ()))
+            else:
+                results.append((node, self.constant(node), ()))
+
+        return results[0]
+
+    def place(self, entry):
+        """The node an evaluated expression leaves in the tree: a literal
+        where its value is within the limits, otherwise its own node over
+        its operands' placed nodes. Works off a stack, like evaluate().
+
+        Only the outermost value past a limit is reported; the operands
+        under it that are past it too are left as they are.
+        """
+        results = []
+        stack = [(entry, False, True)]
+
+        while stack:
+            (node, value, operands), operands_placed, report = stack.pop()
+
+            if operands_placed:
+                placed = results[-len(operands):]
+                del results[-len(operands):]
+                results.append(set_operands(node, placed))
+                continue
+
+            if value is not None and self.constant(node) is None:
+                errors = len(self.errors)
+                literal = self.literal(node, value, report)
+                if literal is not None:
+                    results.append(literal)
+                    continue
+                report = report and len(self.errors) == errors
+
+            if not operands:
+                results.append(node)
+                continue
+
+            stack.append(((node, value, operands), True, report))
+            stack += [(operand, False, report) for operand in reversed(operands)]
+
+        return results[0]
+
+    def constant(self, node):
+        # The value of a literal operand, or None when it is not one
+        if isinstance(node, (Tokens, TokenNode, LiteralNode)):
+            return literal_value(token_of(node))
+        return None
+
+    def literal(self, node, value, report=True):
+        # The literal for value over the tokens of node, or None when value
+        # is past a limit, which is reported if report is set, or too small
+        # to round to anything but zero
+        if isinstance(value, Fraction):
+            rounded = round(value, FLOAT_PRECISION_LIM)
+            if rounded == 0 != value:
+                return None
+            value = rounded
+            if abs(value) >= 10 ** FLOAT_LIM:
+                if report:
+                    self.add_error(node, ExceedDecimalError, reported_value(value))
+                return None
+        elif not isinstance(value, bool) and abs(value) >= 10 ** INT_LIM:
+            if report:
+                self.add_error(node, ExceedNumeralError, reported_value(value))
+            return None
+
+        first = edge_token(node)
+        tok = literal_token(value, first.start, edge_token(node, last=True).end, first.source)
+        return LITERAL_NODES[tok.type](tok)
+
+    def unfolded(self, node, *operands):
+        # The entry of an operator that does not fold, over its operands'
+        # placed nodes
+        return set_operands(node, [self.place(operand) for operand in operands]), None, ()
+
+    def fold_unary(self, node, operand):
+        value = operand[1]
+        if value is None or isinstance(value, bool):
+            return self.unfolded(node, operand)
+        if node.op_tok.type == TT_MINUS:
+            value = -value
+        return node, value, (operand,)
+
+    def fold_binary(self, node, left, right):
+        left_value = left[1]
+        right_value = right[1]
+        if left_value is None or right_value is None:
+            return self.unfolded(node, left, right)
+
+        op_type = node.op_tok.type
+        if op_type == TT_AND:
+            value = bool(left_value) and bool(right_value)
+        elif op_type == TT_OR:
+            value = bool(left_value) or bool(right_value)
+        elif op_type in COMPARISONS:
+            value = COMPARISONS[op_type](left_value, right_value)
+        elif isinstance(left_value, bool) or isinstance(right_value, bool):
+            return self.unfolded(node, left, right)
+        else:
+            value = self.arithmetic(node, op_type, left_value, right_value)
+            if value is None:
+                return self.unfolded(node, left, right)
+
+        return node, value, (left, right)
+
+    def arithmetic(self, node, op_type, left, right):
+        # The exact value of a Numeral or Decimal operation, or None when
+        # it divides by zero and is reported instead
+        if op_type != TT_DIV:
+            return ARITHMETIC[op_type](left, right)
+
+        if right == 0:
+            self.add_error(node, SemanticError, "Division by zero")
+            return None
+        if isinstance(left, int) and isinstance(right, int):
+            value = abs(left) // abs(right)
+            return -value if (left < 0) != (right < 0) else value
+        return Fraction(left) / right
+
+    def add_error(self, node, error_class, details=''):
+        self.errors.append(error_class(node.pos_start, node.pos_end, details))
@@ -0,0 +1,114 @@
+import os
+import re
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+from ..utils.position import *
+from ..utils.tokens import *
+from ..utils.token_buffer import TokenBuffer
+
+
+#######################################
+# PARALLEL LEXER
+#######################################
+
+# Below this size the worker processes cost more than they save
+PARALLEL_MIN_SIZE = 1 << 20
+
+# Spans that may hold a newline the lexer does not start a token at
+PRESCAN_PATTERN = re.compile(r'''
+      "(?:[^"\\]|\\[\s\S])*"?
+    | '[\s\S]?(?:'|[^']*'?)
+    | /\*[\s\S]*?(?:\*/|\Z)
+    | //[^\n]*
+''', re.VERBOSE)
+
+
+def split_points(text, parts):
+    """Picks up to parts - 1 newlines, spread evenly through the text, that
+    fall outside missives, letters and comments. Every chunk but the first
+    starts on one of them.
+    """
+    spans = [match.span() for match in PRESCAN_PATTERN.finditer(text)]
+    span_starts = [start for start, _ in spans]
+    points = [0]
+
+    for part in range(1, parts):
+        idx = max(points[-1] + 1, len(text) * part // parts)
+        while True:
+            newline = text.find('\n', idx)
+            if newline < 0:
+                return points
+
+            span = bisect_right(span_starts, newline) - 1
+            if span >= 0 and spans[span][1] > newline:
+                idx = spans[span][1]
+                continue
+            break
+
+        points.append(newline)
+
+    return points
+
+
+def lex_chunk(lexer_class, fn, text, offset, line, column, trivia=True):
+    tokens, errors = lexer_class(fn, text, SourceFile(fn, text, offset, line, column), trivia).make_tokens()
+    # The parent attaches the whole file, so the window is not sent back
+    tokens.source = None
+    return tokens, errors
+
+
+def chunk_args(text, start, end):
+    window = text[start:end + 1] if end is not None else text[start:]
+    line = text.count('\n', 0, start)
+    column = start - text.rfind('\n', 0, start) - 1
+    return window, start, line, column
+
+
+def lex_parallel(lexer_class, fn, text, jobs=None, trivia=True):
+    """Lexes the chunks between split points in worker processes and joins
+    their buffers into the same tokens and errors a single lexer produces.
+
+    A chunk is lexed through the newline that starts the next one. Its last
+    token has to be that newline, or else the pre-scan was fooled (by an
+    unclosed letter, say) and the two chunks are lexed again as one.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    points = split_points(text, jobs)
+    if len(points) == 1:
+        return lexer_class(fn, text, trivia=trivia).make_tokens()
+
+    bounds = list(zip(points, points[1:] + [None]))
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        results = list(executor.map(
+            lex_chunk,
+            *zip(*((lexer_class, fn, *chunk_args(text, start, end), trivia) for start, end in bounds))
+        ))
+
+    newline = TYPE_IDS[TT_NEWLINE]
+    tokens = TokenBuffer(SourceFile(fn, text))
+    errors = []
+    idx = 0
+
+    while idx < len(bounds):
+        start, end = bounds[idx]
+        chunk_tokens, chunk_errors = results[idx]
+
+        if end is None:
+            tokens.extend(chunk_tokens, start)
+            errors.extend(chunk_errors)
+            break
+
+        # The chunk ends with the newline token and then EOF
+        last = len(chunk_tokens) - 2
+        if last >= 0 and chunk_tokens.types[last] == newline and chunk_tokens.starts[last] == end - start:
+            tokens.extend(chunk_tokens, start, last)
+            errors.extend(error for error in chunk_errors if error.pos_start.offset <= end)
+            idx += 1
+            continue
+
+        bounds[idx:idx + 2] = [(start, bounds[idx + 1][1])]
+        results[idx:idx + 2] = [lex_chunk(lexer_class, fn, *chunk_args(text, start, bounds[idx][1]), trivia)]
+
+    return tokens, errors
@@ -0,0 +1,82 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from ..utils.nodes import FuncDefNode
+from .syntax import MAX_SYNTAX_ERRORS, Parser
+
+
+#######################################
+# PARALLEL PARSER
+#######################################
+
+# Below this many body tokens the worker processes cost more than they save
+PARALLEL_MIN_TOKENS = 1 << 16
+
+
+def check_bodies(bodies):
+    # Only the errors are sent back. Rebuilding a body's nodes in the
+    # parent, from pickled nodes or from NodeArena columns, costs about 1.7
+    # times as much as parsing the body there, so a body is parsed again if
+    # it is read
+    return [body()[1] for body in bodies]
+
+
+def body_groups(bodies, parts):
+    """Splits the bodies, in order, into up to `parts` runs of about the
+    same number of tokens.
+    """
+    total = sum(len(body.tokens) for body in bodies)
+    groups = [[]]
+    size = 0
+
+    for body in bodies:
+        if size >= total * len(groups) / parts and len(groups) < parts:
+            groups.append([])
+        groups[-1].append(body)
+        size += len(body.tokens)
+
+    return groups
+
+
+def parse_parallel(tokens, jobs=None):
+    """Parses the program with function bodies skipped, which finds where
+    each top-level definition's body starts and ends, then checks the
+    bodies in worker processes.
+
+    Returns the node, or None when there are syntax errors, and the errors
+    in source order. Bodies checked in a worker are parsed again in this
+    process the first time FuncDefNode.body is read, so this pays only for
+    a check that wants the errors; a caller that reads the whole tree is
+    faster with a plain Parser.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    parser = Parser(tokens, lazy_bodies=True)
+    program = parser.parse().node
+    errors = list(parser.errors)
+    bodies = parser.skipped_bodies
+    results = None
+
+    # Bodies skipped before an error are still checked, so the errors match
+    # a full parse even when there is no program to put them in
+    if jobs == 1 or len(bodies) < 2 or sum(len(body.tokens) for body in bodies) < PARALLEL_MIN_TOKENS:
+        results = [body() for body in bodies]
+        body_errors = [result[1] for result in results]
+    else:
+        groups = body_groups(bodies, jobs)
+        with ProcessPoolExecutor(max_workers=len(groups)) as executor:
+            body_errors = [result for group in executor.map(check_bodies, groups) for result in group]
+
+    for errors_in_body in body_errors:
+        errors.extend(errors_in_body or [])
+
+    if errors:
+        errors.sort(key=lambda error: error.pos_start.offset if error.pos_start else float('inf'))
+        return None, errors[:MAX_SYNTAX_ERRORS]
+
+    if results is not None:
+        parsed = dict(zip(bodies, results))
+        for statement in program.global_statements:
+            if isinstance(statement, FuncDefNode):
+                statement.body = parsed[statement._body][0]
+
+    return program, None
@@ -0,0 +1,159 @@
+import re
+
+from ..utils.position import *
+from ..utils.tokens import *
+from ..utils.token_buffer import TokenBuffer
+from .errors import *
+from .lexer2 import ESCAPE_PATTERN, Lexer, unescape
+
+
+#######################################
+# REGEX LEXER
+#######################################
+
+MASTER_PATTERN = re.compile(r'''
+      (?P<TAB>\t)
+    | (?P<SPACE>\ )
+    | (?P<NEWLINE>\n)
+    | (?P<MISSIVE>"(?:[^"\\]|\\[\s\S])*")
+    | (?P<UNCLOSED_MISSIVE>"[\s\S]*)
+    | (?P<LETTER>'[\s\S]')
+    | (?P<LONG_LETTER>'[\s\S][^']*')
+    | (?P<UNCLOSED_LETTER>'[\s\S]*)
+    | (?P<NUMBER>[0-9]+(?:\.[0-9]*)?)
+    | (?P<IDENTIFIER>[a-z][A-Za-z0-9_]*)
+    | (?P<KEYWORD>[A-Z][A-Za-z]*)
+    | (?P<SLINECOM>//[^\n]*)
+    | (?P<MLINECOM>/\*[\s\S]*?\*/)
+    | (?P<UNCLOSED_MLINECOM>/\*[\s\S]*)
+    | &(?P<ADDRESS>[A-Za-z_][A-Za-z0-9_]*)
+    | (?P<OPERATOR>\+[+=]?|-[-=]?|[*/%=!<>]=?|\|\||&&?|[(){}\[\],.:;])
+    | (?P<ILLEGAL>[\s\S])
+''', re.VERBOSE)
+
+OPERATORS = {
+    '+': TT_PLUS, '-': TT_MINUS, '*': TT_MUL, '/': TT_DIV, '%': TT_MODULO,
+    '&&': TT_AND, '||': TT_OR, '!': TT_NOT,
+    '(': TT_LPAREN, ')': TT_RPAREN, '[': TT_LBRACKET, ']': TT_RBRACKET, '{': TT_LBRACE, '}': TT_RBRACE,
+    '=': TT_EQUAL,
+    '+=': TT_PLUSAND, '-=': TT_MINUSAND, '*=': TT_MULAND, '/=': TT_DIVAND, '%=': TT_MODAND,
+    '++': TT_INC, '--': TT_DEC,
+    '==': TT_EQUALTO, '!=': TT_NOTEQUAL, '<': TT_LESSTHAN, '>': TT_GREATERTHAN, '<=': TT_LESSTHANEQUAL, '>=': TT_GREATERTHANEQUAL,
+    ';': TT_TERMINATE, '.': TT_PERIOD, ':': TT_COLON, ',': TT_COMMA,
+    '&': TT_ADDRESS,
+}
+
+
+class RegexLexer(Lexer):
+    """Produces the same tokens and errors as lexer2.Lexer, matching each
+    lexeme with a single master pattern instead of one character at a time.
+
+    The pattern only classifies ASCII letters and digits, so any other text
+    goes through the character lexer to keep str.isalpha/isdigit semantics.
+    """
+
+    def make_tokens(self):
+        if not self.text.isascii():
+            return super().make_tokens()
+
+        tokens = TokenBuffer(self.source)
+        errors = []
+        text = self.text
+        length = len(text)
+
+        for match in MASTER_PATTERN.finditer(text):
+            kind = match.lastgroup
+            start, end = match.span()
+            lexeme = match.group()
+
+            if kind == 'TAB':
+                continue
+            elif kind == 'SPACE':
+                if self.trivia:
+                    tokens.add(TT_SPACE, None, start, end)
+                continue
+            elif kind == 'NEWLINE':
+                tokens.add(TT_NEWLINE, None, start, end)
+                continue
+            elif kind == 'IDENTIFIER':
+                if len(lexeme) > ID_LIM:
+                    errors.append(IdentifierLimitError(*self.span(start, end), f'"{lexeme}"'))
+                    continue
+                token_type = TT_IDENTIFIER
+            elif kind == 'KEYWORD':
+                token_type = KEYWORDS.get(lexeme)
+                if token_type is None:
+                    matched = start + self.keyword_prefix_len(lexeme)
+                    errors.append(IllegalKeyword(*self.span(matched, max(end, matched + 1)), f"{lexeme}"))
+                    continue
+            elif kind == 'OPERATOR':
+                token_type = OPERATORS[lexeme]
+                if token_type == TT_ADDRESS:
+                    tokens.add(token_type, lexeme, start, end)
+                    continue
+            elif kind == 'NUMBER':
+                token_type, lexeme, error = self.make_number(lexeme, start, end)
+                if error:
+                    errors.append(error)
+                    continue
+            elif kind == 'MISSIVE':
+                if '\\' in lexeme:
+                    lexeme = '"' + ESCAPE_PATTERN.sub(unescape, lexeme[1:-1]) + '"'
+                token_type = TT_STRING_LITERAL
+            elif kind == 'LETTER':
+                token_type = TT_CHAR_LITERAL
+            elif kind == 'SLINECOM':
+                token_type = TT_SLINECOM
+            elif kind == 'MLINECOM':
+                token_type = TT_MLINECOM
+            elif kind == 'ADDRESS':
+                tokens.add(TT_ADDRESS, '&', start, start + 1)
+                identifier = match.group(kind)
+                if len(identifier) > ID_LIM:
+                    errors.append(IdentifierLimitError(*self.span(start + 1, end), f'"{identifier}"'))
+                else:
+                    tokens.add(TT_IDENTIFIER, identifier, start + 1, end)
+                continue
+            elif kind == 'LONG_LETTER':
+                errors.append(IllegalCharError(*self.span(start, start + 2), "Letter must only have 1 character"))
+                continue
+            elif kind == 'UNCLOSED_MISSIVE':
+                errors.append(IllegalCharError(*self.span(start, end), "Unclosed Missive"))
+                continue
+            elif kind == 'UNCLOSED_LETTER':
+                errors.append(IllegalCharError(*self.span(start, end), "Unclosed Letter"))
+                continue
+            elif kind == 'UNCLOSED_MLINECOM':
+                errors.append(IllegalCharError(*self.span(start, end), "Unclosed Multiline Comment"))
+                continue
+            else:
+                errors.append(IllegalCharError(*self.span(start, end), f"'{lexeme}'"))
+                continue
+
+            # The text is ASCII here, so the table alone decides
+            next_char = text[end] if end < length else None
+            if next_char is not None and not DELIM_TABLES[token_type][0][ord(next_char)]:
+                errors.append(IllegalDelimiter(
+                    *self.span(end, end + 1),
+                    f"Unexpected delim {repr(next_char)} after {Tokens(token_type, lexeme)}",
+                ))
+            elif not self.trivia and token_type in (TT_SLINECOM, TT_MLINECOM):
+                tokens.comments.append((start, end))
+            else:
+                tokens.add(token_type, lexeme, start, end)
+
+        self.skip(length - self.idx)
+        tokens.add(TT_EOF, None, length, length + 1)
+
+        return tokens, errors
+
+    def make_number(self, num_str, start, end):
+        if '.' not in num_str:
+            if len(num_str) > INT_LIM:
+                return None, None, ExceedNumeralError(*self.span(start, end), f'{num_str}')
+            return TT_INT_LITERAL, str(int(num_str)), None
+
+        left_digits, right_digits = (len(part) for part in num_str.split('.'))
+        if left_digits > FLOAT_LIM or right_digits > FLOAT_PRECISION_LIM:
+            return None, None, ExceedDecimalError(*self.span(start, end), f'{num_str}')
+        return TT_FLOAT_LITERAL, str(float(num_str)), None
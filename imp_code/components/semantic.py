@@ -0,0 +1,480 @@
+from types import GeneratorType
+
+from ..utils.nodes import *
+from ..utils.tokens import *
+from ..utils.visitor import NodeVisitor
+from .errors import *
+from .syntax import BINARY_OPERATORS
+
+#######################################
+# SEMANTIC
+#######################################
+
+# A run with more errors than this is mostly cascades, so it stops there
+MAX_SEMANTIC_ERRORS = 50
+
+# The data type of each literal
+LITERAL_TYPES = {
+    TT_INT_LITERAL: TT_INT,
+    TT_FLOAT_LITERAL: TT_FLOAT,
+    TT_CHAR_LITERAL: TT_CHAR,
+    TT_STRING_LITERAL: TT_STRING,
+    TT_TRUE: TT_BOOL,
+    TT_FALSE: TT_BOOL,
+    TT_NULL: TT_BOOL,
+}
+
+EQUALITY_OPS = frozenset({TT_EQUALTO, TT_NOTEQUAL})
+CONDITION_TYPES = NUMERIC_TYPES | {TT_BOOL}
+
+
+def assignable(target_type, value_type):
+    # None is the type of a value whose error is already reported. A
+    # Numeral widens to a Decimal; nothing else converts
+    return value_type is None or value_type == target_type or (target_type == TT_FLOAT and value_type == TT_INT)
+
+
+class Symbol:
+    # A declared variable: slot is its index among the variables of the
+    # scope it was declared in, level how deep that scope is nested
+    __slots__ = ('name', 'type', 'level', 'slot', 'is_constant', 'is_array')
+
+    def __init__(self, name, type_, level, slot, is_constant=False, is_array=False):
+        self.name = name
+        self.type = type_
+        self.level = level
+        self.slot = slot
+        self.is_constant = is_constant
+        self.is_array = is_array
+
+    def __repr__(self):
+        return f'{self.type}: {self.name}'
+
+
+class Function:
+    __slots__ = ('name', 'return_type', 'param_types', 'defined')
+
+    def __init__(self, name, return_type, param_types, defined=False):
+        self.name = name
+        self.return_type = return_type
+        self.param_types = param_types
+        self.defined = defined
+
+
+class SymbolTable:
+    """A chain of nested scopes kept as one dict from each name to the
+    symbols declaring it, innermost last, so resolving a name is one lookup
+    however deep the scope using it is. Leaving a scope pops the symbols it
+    declared.
+    """
+
+    def __init__(self):
+        self.bindings = {}
+        # The symbols each open scope declared, outermost first
+        self.scopes = []
+
+    @property
+    def level(self):
+        return len(self.scopes) - 1
+
+    def enter(self):
+        self.scopes.append([])
+
+    def exit(self):
+        # Returns how many slots the scope used
+        scope = self.scopes.pop()
+        for symbol in scope:
+            symbols = self.bindings[symbol.name]
+            symbols.pop()
+            if not symbols:
+                del self.bindings[symbol.name]
+        return len(scope)
+
+    def declare(self, name, type_, is_constant=False, is_array=False):
+        # Returns the new symbol, or None when the scope already has the name
+        symbols = self.bindings.setdefault(name, [])
+        if symbols and symbols[-1].level == self.level:
+            return None
+
+        scope = self.scopes[-1]
+        symbol = Symbol(name, type_, self.level, len(scope), is_constant, is_array)
+        scope.append(symbol)
+        symbols.append(symbol)
+        return symbol
+
+    def resolve(self, name):
+        symbols = self.bindings.get(name)
+        return symbols[-1] if symbols else None
+
+
+class SemanticAnalyzer(NodeVisitor):
+    """Checks declarations, scopes and types in one pass over a program in
+    source order.
+
+    Every block opens a scope: the program's globals, Embark, a function
+    (its parameters and body), the branches of Thou, loop bodies and Shift
+    cases, with a Per's initialization in the scope of its body. A name is
+    usable after its declaration until its scope closes, and a nested scope
+    may shadow it.
+
+    Each variable use is resolved to a (depth, slot) pair, kept in
+    `resolved`: how many scopes out from the use the declaring scope is,
+    and the variable's index in that scope. Uses are keyed by their
+    AccessNode, or by the identifier token where a statement names a
+    variable without one (declarations, assignments and Seek).
+    `scope_sizes` holds the number of slots of the scope each block node
+    opens, so an execution engine can size its frames up front, and
+    `constants` the Symbol of each declaration and use of a Constant, for
+    passes that put its value in place of the name.
+
+    Statement handlers that hold blocks are generators yielding the
+    statements to check, and analyze() runs them off its own stack, so
+    deep nesting does not recurse.
+    """
+
+    def __init__(self):
+        self.symbols = SymbolTable()
+        self.functions = {}
+        self.resolved = {}
+        self.scope_sizes = {}
+        self.constants = {}
+        self.errors = []
+        # The return type of the function being checked, None outside one
+        self.return_type = None
+        self.loops = 0
+        self.shifts = 0
+
+    def analyze(self, node):
+        # Each entry is an iterator over statements left to check
+        stack = [iter((node,))]
+
+        while stack:
+            stmt = next(stack[-1], stack)
+            if stmt is stack:
+                stack.pop()
+            elif isinstance(stmt, list):
+                stack.append(iter(stmt))
+            elif stmt is not None:
+                result = self.visit(stmt)
+                if isinstance(result, GeneratorType):
+                    stack.append(result)
+
+        return self.errors or None
+
+    def add_error(self, node, details):
+        if len(self.errors) < MAX_SEMANTIC_ERRORS:
+            self.errors.append(SemanticError(node.pos_start, node.pos_end, details))
+
+    def declare(self, id_tok, var_type, is_constant=False, is_array=False):
+        symbol = self.symbols.declare(id_tok.value, var_type, is_constant, is_array)
+        if symbol is None:
+            self.add_error(id_tok, f"'{id_tok.value}' is already declared in this scope")
+            return
+        self.resolved[id_tok] = (0, symbol.slot)
+        if is_constant:
+            self.constants[id_tok] = symbol
+
+    def resolve(self, key, id_tok):
+        symbol = self.symbols.resolve(id_tok.value)
+        if symbol is None:
+            self.add_error(id_tok, f"Undeclared variable '{id_tok.value}'")
+            return None
+        self.resolved[key] = (self.symbols.level - symbol.level, symbol.slot)
+        if symbol.is_constant:
+            self.constants[key] = symbol
+        return symbol
+
+    def block(self, node, statements):
+        # Checks statements in a scope of their own, opened by node
+        self.symbols.enter()
+        yield statements
+        self.scope_sizes[node] = self.symbols.exit()
+
+    #######################################
+    # EXPRESSIONS
+    #######################################
+
+    def expr_type(self, node):
+        """The data type of an expression, or None when it has an error
+        that is already reported. Operands are typed before the operator
+        that joins them, off a stack, so a long chain does not recurse.
+        """
+        types = []
+        stack = [(node, False)]
+
+        while stack:
+            node, operands_typed = stack.pop()
+
+            if isinstance(node, BinOpNode):
+                if not operands_typed:
+                    stack += [(node, True), (node.right_node, False), (node.left_node, False)]
+                    continue
+                right_type = types.pop()
+                types.append(self.binary_type(node, types.pop(), right_type))
+            elif isinstance(node, UnaryOpNode):
+                if not operands_typed:
+                    stack += [(node, True), (node.node, False)]
+                    continue
+                types.append(self.unary_type(node, types.pop()))
+            else:
+                types.append(self.operand_type(node))
+
+        return types[0]
+
+    def operand_type(self, node):
+        if isinstance(node, Tokens):
+            return LITERAL_TYPES.get(node.type)
+        if isinstance(node, TokenNode):
+            return LITERAL_TYPES.get(node.tok.type)
+        if isinstance(node, LiteralNode):
+            return LITERAL_TYPES.get(node.token.type)
+        if isinstance(node, AccessNode):
+            symbol = self.resolve(node, node.id_tok)
+            return symbol.type if symbol else None
+        if isinstance(node, FuncCallNode):
+            return self.call_type(node)
+        return None
+
+    def binary_type(self, node, left_type, right_type):
+        op_type = node.op_tok.type
+
+        if op_type in LOGICAL_OPS:
+            valid = left_type in CONDITION_TYPES and right_type in CONDITION_TYPES
+            result_type = TT_BOOL
+        elif op_type in EQUALITY_OPS:
+            valid = left_type == right_type or (left_type in NUMERIC_TYPES and right_type in NUMERIC_TYPES)
+            result_type = TT_BOOL
+        else:
+            valid = left_type in NUMERIC_TYPES and right_type in NUMERIC_TYPES
+            if not BINARY_OPERATORS[op_type][1]:
+                result_type = TT_BOOL
+            else:
+                result_type = TT_FLOAT if TT_FLOAT in (left_type, right_type) else TT_INT
+
+        if left_type is None or right_type is None:
+            return result_type if result_type == TT_BOOL else None
+
+        if not valid:
+            self.add_error(node, f"Type mismatch: Cannot perform '{op_type}' between {left_type} and {right_type}")
+            return result_type if result_type == TT_BOOL else None
+
+        return result_type
+
+    def unary_type(self, node, operand_type):
+        if not node.is_post:
+            if operand_type is not None and operand_type not in NUMERIC_TYPES:
+                self.add_error(node, "+ and - can only be applied to Numeral or Decimal types")
+                return None
+            return operand_type
+
+        # ++ and -- only follow a variable
+        name = node.node.id
+        symbol = self.symbols.resolve(name)
+        if operand_type is not None and operand_type not in NUMERIC_TYPES:
+            self.add_error(node, f"Invalid operation on '{name}': Only Numeral and Decimal types can be updated")
+            return None
+        if symbol is not None and symbol.is_constant:
+            self.add_error(node, f"Cannot update the Constant '{name}'")
+        return operand_type
+
+    def call_type(self, node):
+        function = self.functions.get(node.id)
+        arg_types = [self.operand_type(arg) for arg in node.args]
+
+        if function is None:
+            self.add_error(node.id_tok, f"Undeclared function '{node.id}'")
+            return None
+
+        if len(arg_types) != len(function.param_types):
+            self.add_error(node.id_tok, f"Function '{node.id}' takes {len(function.param_types)} arguments but got {len(arg_types)}")
+            return function.return_type
+
+        for number, (arg, param_type, arg_type) in enumerate(zip(node.args, function.param_types, arg_types), 1):
+            if not assignable(param_type, arg_type):
+                self.add_error(arg, f"Type mismatch: argument {number} of '{node.id}' is {param_type}, but got {arg_type}")
+
+        return function.return_type
+
+    def check_condition(self, node):
+        condition_type = self.expr_type(node)
+        if condition_type is not None and condition_type not in CONDITION_TYPES:
+            self.add_error(node, f"Invalid condition: Expected Veracity, Numeral, or Decimal but got {condition_type}")
+
+    def check_value(self, target_type, value, name):
+        value_type = self.expr_type(value)
+        if not assignable(target_type, value_type):
+            self.add_error(value, f"Type mismatch: '{name}' is {target_type}, but got {value_type}")
+
+    #######################################
+    # STATEMENTS
+    #######################################
+
+    def visit_Node(self, node):
+        # Expression statements
+        self.expr_type(node)
+
+    def visit_ProgramNode(self, node):
+        self.symbols.enter()
+        yield node.global_statements
+        yield node.embark_node
+        self.scope_sizes[node] = self.symbols.exit()
+
+    def visit_EmbarkNode(self, node):
+        yield from self.block(node, node.statements)
+
+    def visit_DeclareNode(self, node):
+        var_type = node.var_type_tok.type
+
+        # A name is declared after its value is checked, so the value cannot
+        # use it
+        for id_tok, value, is_array, array_size in node.identifiers:
+            if is_array:
+                for item in value or ():
+                    if not assignable(var_type, self.operand_type(item)):
+                        self.add_error(item, f"Type mismatch in Ledger '{id_tok.value}', expected {var_type}")
+            elif value is not None:
+                self.check_value(var_type, value, id_tok.value)
+
+            self.declare(id_tok, var_type, node.is_constant, is_array)
+
+    def visit_AssignNode(self, node):
+        id_tok = node.var_name_tok
+        symbol = self.resolve(id_tok, id_tok)
+        value_type = self.expr_type(node.expr)
+
+        if symbol is None:
+            return
+        if symbol.is_constant:
+            self.add_error(id_tok, f"Cannot assign to the Constant '{id_tok.value}'")
+        elif not assignable(symbol.type, value_type):
+            self.add_error(node.expr, f"Type mismatch: '{id_tok.value}' is {symbol.type}, but got {value_type}")
+
+    def visit_CompoundAssignNode(self, node):
+        id_tok = node.var_name_tok
+        symbol = self.resolve(id_tok, id_tok)
+        value_type = self.expr_type(node.id_value)
+
+        if symbol is None:
+            return
+        if symbol.is_constant:
+            self.add_error(id_tok, f"Cannot assign to the Constant '{id_tok.value}'")
+        elif symbol.type not in NUMERIC_TYPES:
+            self.add_error(id_tok, f"Type mismatch: Cannot perform '{node.op_tok.type}' on '{id_tok.value}' of type {symbol.type}")
+        elif value_type is not None and (value_type not in NUMERIC_TYPES or not assignable(symbol.type, value_type)):
+            self.add_error(node.id_value, f"Type mismatch: '{id_tok.value}' is {symbol.type}, but got {value_type}")
+
+    def visit_FuncDecNode(self, node):
+        self.declare_function(node, defined=False)
+
+    def visit_FuncDefNode(self, node):
+        self.declare_function(node, defined=True)
+
+        self.symbols.enter()
+        for type_tok, param_id in node.args:
+            self.declare(param_id, type_tok.type)
+
+        self.return_type = node.return_type.type
+        yield node.body
+        self.return_type = None
+        self.scope_sizes[node] = self.symbols.exit()
+
+    def declare_function(self, node, defined):
+        return_type = node.return_type.type
+        param_types = [type_tok.type for type_tok, param_id in node.args]
+        function = self.functions.get(node.id)
+
+        if function is None:
+            self.functions[node.id] = Function(node.id, return_type, param_types, defined)
+        elif function.return_type != return_type or function.param_types != param_types:
+            self.add_error(node.id_tok, f"Function '{node.id}' does not match its earlier declaration")
+        elif defined and function.defined:
+            self.add_error(node.id_tok, f"Function '{node.id}' is already defined")
+        else:
+            function.defined = function.defined or defined
+
+    def visit_ReturnNode(self, node):
+        value_type = self.expr_type(node.node)
+
+        if self.return_type == TT_VOID:
+            self.add_error(node.return_tok, "A Void function cannot return a value")
+        elif self.return_type is not None and not assignable(self.return_type, value_type):
+            self.add_error(node.node, f"Type mismatch: function returns {self.return_type}, but got {value_type}")
+
+    def visit_ThouNode(self, node):
+        if node.condition is not None:
+            self.check_condition(node.condition)
+        yield from self.block(node, node.statements)
+        yield node.else_stmt
+
+    def visit_PerNode(self, node):
+        self.symbols.enter()
+        yield node.init
+
+        if node.condition is not None:
+            self.check_condition(node.condition)
+        if node.update is not None:
+            self.expr_type(node.update)
+
+        self.loops += 1
+        yield node.statements
+        self.loops -= 1
+        self.scope_sizes[node] = self.symbols.exit()
+
+    def visit_UntilNode(self, node):
+        self.check_condition(node.condition)
+        self.loops += 1
+        yield from self.block(node, node.statements)
+        self.loops -= 1
+
+    def visit_ActNode(self, node):
+        self.loops += 1
+        yield from self.block(node, node.statements)
+        self.loops -= 1
+        self.check_condition(node.condition)
+
+    def visit_ShiftNode(self, node):
+        var_type = self.expr_type(node.condition) if node.condition is not None else None
+        if var_type is not None and var_type not in SHIFT_TYPES:
+            self.add_error(node.condition, f"Invalid Shift argument: Expected Numeral, Decimal, Veracity, or Letter but got {var_type}")
+            var_type = None
+
+        seen = set()
+        self.shifts += 1
+
+        for case_tok, case_expr, statements in node.cases:
+            case = (case_expr.type, case_expr.value)
+            if var_type is not None and not assignable(var_type, LITERAL_TYPES.get(case_expr.type)):
+                self.add_error(case_expr, f"Expected {var_type} literal")
+            elif case in seen:
+                self.add_error(case_expr, f"Duplicate Opt {case_expr.lexeme_str()}")
+            seen.add(case)
+
+            yield from self.block(case_tok, statements)
+
+        if node.default_case is not None:
+            yield from self.block(node.default_tok, node.default_case)
+
+        self.shifts -= 1
+
+    def visit_InputNode(self, node):
+        for id_tok in node.variables:
+            symbol = self.resolve(id_tok, id_tok)
+            if symbol is not None and symbol.is_constant:
+                self.add_error(id_tok, f"Cannot assign to the Constant '{id_tok.value}'")
+
+    def visit_OutputNode(self, node):
+        if node.missive_lit.type == TT_IDENTIFIER:
+            symbol = self.resolve(node.missive_lit, node.missive_lit)
+            if symbol is not None and symbol.type != TT_STRING:
+                self.add_error(node.missive_lit, f"Invalid format '{node.missive_lit.value}': Expected Missive but got {symbol.type}")
+
+        for expr in node.id_exp:
+            self.expr_type(expr)
+
+    def visit_HaltNode(self, node):
+        if not self.loops and not self.shifts:
+            self.add_error(node.type_tok, "'Halt' can only be used inside a loop or Shift")
+
+    def visit_ExtendNode(self, node):
+        if not self.loops:
+            self.add_error(node.type_tok, "'Extend' can only be used inside a loop")
@@ -1,6 +1,10 @@
+from collections import deque
+from types import GeneratorType
+
 from ..utils.position import *
 from ..utils.nodes import *
 from ..utils.tokens import *
+from ..utils.token_buffer import TokenBuffer
 from ..utils.results import *
 from .errors import *
 
@@ -8,182 +12,364 @@ from .errors import *
 # SYNTAX
 #######################################
 
-class Parser:
+LOGIC_OR_PRECEDENCE = 1
+LOGIC_AND_PRECEDENCE = 2
+COMP_PRECEDENCE = 3
+ARITH_PRECEDENCE = 4
+TERM_PRECEDENCE = 5
+
+# Binary operators, by how tightly they bind and whether both operands
+# must be Numeral or Decimal. All of them are left associative.
+BINARY_OPERATORS = {
+    TT_OR: (LOGIC_OR_PRECEDENCE, False),
+    TT_AND: (LOGIC_AND_PRECEDENCE, False),
+    TT_EQUALTO: (COMP_PRECEDENCE, False),
+    TT_NOTEQUAL: (COMP_PRECEDENCE, False),
+    TT_LESSTHAN: (COMP_PRECEDENCE, False),
+    TT_GREATERTHAN: (COMP_PRECEDENCE, False),
+    TT_LESSTHANEQUAL: (COMP_PRECEDENCE, False),
+    TT_GREATERTHANEQUAL: (COMP_PRECEDENCE, False),
+    TT_PLUS: (ARITH_PRECEDENCE, True),
+    TT_MINUS: (ARITH_PRECEDENCE, True),
+    TT_MUL: (TERM_PRECEDENCE, True),
+    TT_DIV: (TERM_PRECEDENCE, True),
+}
+
+# A run with more errors than this is mostly cascades, so it stops there
+MAX_SYNTAX_ERRORS = 50
+
+# Tokens a statement can start with, where recovery resumes parsing
+SYNC_TOKENS = RETURN_TYPES | {
+    TT_CONST, TT_MAIN, TT_RETURN, TT_IF, TT_ELSE, TT_WHILE, TT_FOR, TT_DO,
+    TT_SWITCH, TT_CASE, TT_DEFAULT, TT_INPUT, TT_OUTPUT, TT_BREAK, TT_CONTINUE,
+}
+
+# Where the statements of an Opt or Usual end
+CASE_BODY_ENDS = {TT_CASE, TT_DEFAULT, TT_RBRACE, TT_EOF}
+
+# Where a broken Opt or Usual label is skipped to
+CASE_LABEL_ENDS = CASE_BODY_ENDS | {TT_COLON, TT_TERMINATE}
+
+class ParseAbort(Exception):
+    # Raised with a syntax error; the grammar methods return nodes, and the
+    # block and program loops record the error and recover from it
+    def __init__(self, error):
+        self.error = error
+
+
+class LazyBody:
+    """The tokens of a function body that a lazy parse skipped over. It is
+    parsed the first time FuncDefNode.body is read, and its syntax errors
+    are left in the node's body_errors.
+    """
+
     def __init__(self, tokens):
-        self.tokens = [
-            token
-            for token in tokens
-            if token.type not in (TT_SPACE, TT_SLINECOM, TT_MLINECOM)
-        ]
-        self.token_idx = -1
-        self.symbol_table = {}
+        self.tokens = tokens
+
+    def __call__(self):
+        parser = Parser(self.tokens)
+
+        try:
+            statements = parser.run(parser.func_body())
+
+            if parser.current_token.type != TT_EOF:
+                raise ParseAbort(InvalidSyntaxError(
+                    parser.current_token.pos_start, parser.current_token.pos_end,
+                    f"Unexpected token '{parser.current_token.value}'"
+                ))
+        except ParseAbort as abort:
+            parser.add_error(abort.error)
+            statements = []
+
+        return statements, parser.errors or None
+
+    def __repr__(self):
+        return f'<unparsed body: {len(self.tokens) - 1} tokens>'
+
+
+class Parser:
+    def __init__(self, tokens, lazy_bodies=False):
+        # Tokens are pulled one at a time, so a streamed lexer only has to
+        # stay as far ahead as the lookahead window reaches
+        self.buffer = None
+        if isinstance(tokens, TokenBuffer):
+            # Kept so a lazy parse can skip a function body on its columns
+            self.buffer = tokens
+            tokens = tokens.without(*TRIVIA)
+        else:
+            tokens = (token for token in tokens if token.type not in TRIVIA)
+        self.tokens = iter(tokens)
+        self.lookahead = deque()
+        self.current_token = None
+        # Function bodies are only skipped over, and parsed when read
+        self.lazy_bodies = lazy_bodies
+        self.skipped_bodies = []
+        self.errors = []
+        self.last_error_pos = None
+        # Statements other than declarations and those starting with an
+        # identifier are picked by their first token alone
+        self.statement_handlers = {
+            TT_INT_LITERAL: self.expr_statement,
+            TT_FLOAT_LITERAL: self.expr_statement,
+            TT_LPAREN: self.expr_statement,
+            TT_RETURN: self.return_statement,
+            TT_IF: self.condition_statement,
+            TT_ELSE: self.condition_statement,
+            TT_WHILE: self.loop_statement,
+            TT_FOR: self.loop_statement,
+            TT_DO: self.loop_statement,
+            TT_SWITCH: self.switch_statement,
+            TT_INPUT: self.input_statement,
+            TT_OUTPUT: self.output_statement,
+            TT_BREAK: self.jump_statement,
+            TT_CONTINUE: self.jump_statement,
+        }
         self.advance()
 
     def advance(self):
-        self.token_idx += 1
-        if self.token_idx < len(self.tokens):
-            self.current_token = self.tokens[self.token_idx]
-
-            while self.current_token.type == TT_SPACE:
-                self.token_idx += 1
-                if self.token_idx < len(self.tokens):
-                    self.current_token = self.tokens[self.token_idx]
-                else:
-                    break
+        if self.lookahead:
+            self.current_token = self.lookahead.popleft()
+        else:
+            self.current_token = next(self.tokens, self.current_token)
         return self.current_token
 
     def peek(self, n=1):
-        if self.token_idx + n < len(self.tokens):
-            return self.tokens[self.token_idx + n]
+        # Past the end of the tokens, the EOF token is all there is to see,
+        # as advance() keeps it as the current token
+        while len(self.lookahead) < n:
+            token = next(self.tokens, None)
+            if token is None:
+                return self.lookahead[-1] if self.lookahead else self.current_token
+            self.lookahead.append(token)
+        return self.lookahead[n - 1]
 
     def parse(self):
         res = ParseResult()
-        program = res.register(self.program())
 
-        if res.error:
-            return res
+        try:
+            program = self.run(self.program())
+        except ParseAbort as abort:
+            self.add_error(abort.error)
+
+        # The result keeps the first error; the rest are in self.errors
+        if self.errors:
+            return res.failure(self.errors[0])
 
         return res.success(program)
 
+    def run(self, grammar):
+        """Drives a grammar method written as a generator. Statements that
+        hold a block yield the generator of each nested statement instead of
+        calling it, and get its node back as the value of the yield, so
+        nesting grows this stack and not the Python call stack.
+
+        A ParseAbort from a nested statement is thrown into the one that
+        yielded it, where block_statement and program recover from it.
+        """
+        stack = [grammar]
+        value = None
+        abort = None
+
+        while True:
+            try:
+                if abort is None:
+                    child = stack[-1].send(value)
+                else:
+                    child = stack[-1].throw(abort)
+            except StopIteration as stop:
+                stack.pop()
+                if not stack:
+                    return stop.value
+                value, abort = stop.value, None
+                continue
+            except ParseAbort as raised:
+                stack.pop()
+                if not stack:
+                    raise
+                value, abort = None, raised
+                continue
+
+            stack.append(child)
+            value, abort = None, None
+
+    def add_error(self, error):
+        # An error where the last one was reported is a cascade of it
+        pos = (error.pos_start.ln, error.pos_start.col) if error.pos_start else None
+        if len(self.errors) < MAX_SYNTAX_ERRORS and (not self.errors or pos != self.last_error_pos):
+            self.errors.append(error)
+            self.last_error_pos = pos
+
+    def recover(self, abort, start_tok):
+        """Records a syntax error, then skips tokens until parsing can pick
+        up again: past the next ';' or the block the error ran into, or up
+        to a '}' or the keyword that starts another statement.
+        """
+        self.add_error(abort.error)
+
+        # Nothing follows to recover into, so the abort keeps unwinding
+        if len(self.errors) >= MAX_SYNTAX_ERRORS or self.current_token.type == TT_EOF:
+            raise abort
+
+        depth = 0
+        while self.current_token.type != TT_EOF:
+            token_type = self.current_token.type
+
+            if token_type == TT_LBRACE:
+                depth += 1
+            elif token_type == TT_RBRACE:
+                if depth == 0:
+                    break
+                depth -= 1
+                if depth == 0:
+                    self.advance()
+                    break
+            elif depth == 0:
+                if token_type == TT_TERMINATE:
+                    self.advance()
+                    break
+                if token_type in SYNC_TOKENS and self.current_token is not start_tok:
+                    break
+
+            self.advance()
+
+        # The statement that failed is always left behind, so it cannot
+        # fail again at the same token
+        if self.current_token is start_tok:
+            self.advance()
+
+    def block_statement(self):
+        # A statement between braces; when it fails, the error is recorded
+        # and the rest of the block is still checked
+        start_tok = self.current_token
+        try:
+            return (yield self.statement())
+        except ParseAbort as abort:
+            self.recover(abort, start_tok)
+            return None
+
     def program(self):
-        res = ParseResult()
         global_statements = []
         embark_node = None
+        embark_seen = False
 
         while self.current_token.type != TT_EOF:
             if self.current_token.type == TT_NEWLINE:
-                res.register(self.advance())
-                continue
-
-            is_constant = False
-            constant_tok = None
-            if self.current_token.type == TT_CONST:
-                is_constant = True
-                constant_tok = self.current_token
-                res.register(self.advance())
-
-            if self.current_token.type in (TT_INT, TT_FLOAT, TT_CHAR, TT_STRING, TT_BOOL, TT_VOID):
-                next_token = self.peek(1)
-
-                if next_token and next_token.type == TT_IDENTIFIER:
-                    next_next_token = self.peek(2)
-
-                    if next_next_token and next_next_token.type == TT_LPAREN:
-                        stmt = res.register(self.func_dec_def())
-                        if res.error:
-                            return res
-                        global_statements.append(stmt)
-                        continue
-
-                stmt = res.register(self.global_declaration(is_constant, constant_tok))
-                if res.error:
-                    return res
-                global_statements.append(stmt)
+                self.advance()
                 continue
 
-            if self.current_token.type == TT_MAIN:
-                if embark_node is not None:
-                    return res.failure(InvalidSyntaxError(
-                        self.current_token.pos_start, self.current_token.pos_end,
-                        "Multiple 'Embark()' are not allowed"
-                    ))
+            start_tok = self.current_token
+            try:
+                is_constant = False
+                constant_tok = None
+                if self.current_token.type == TT_CONST:
+                    is_constant = True
+                    constant_tok = self.current_token
+                    self.advance()
+
+                if self.current_token.type in RETURN_TYPES:
+                    next_token = self.peek(1)
+
+                    if next_token and next_token.type == TT_IDENTIFIER:
+                        next_next_token = self.peek(2)
+
+                        if next_next_token and next_next_token.type == TT_LPAREN:
+                            stmt = yield self.func_dec_def()
+                            global_statements.append(stmt)
+                            continue
+
+                    stmt = self.global_declaration(is_constant, constant_tok)
+                    global_statements.append(stmt)
+                    continue
+
+                if self.current_token.type == TT_MAIN:
+                    if embark_seen:
+                        raise ParseAbort(InvalidSyntaxError(
+                            self.current_token.pos_start, self.current_token.pos_end,
+                            "Multiple 'Embark()' are not allowed"
+                        ))
 
-                embark_node = res.register(self.main_prog())
-                if res.error:
-                    return res
-                continue
+                    embark_seen = True
+                    embark_node = yield self.main_prog()
+                    continue
 
-            return res.failure(InvalidSyntaxError(
-                self.current_token.pos_start, self.current_token.pos_end,
-                f"Program must start with Embark(), Global declaration, or Function declaration"
-            ))
+                raise ParseAbort(InvalidSyntaxError(
+                    self.current_token.pos_start, self.current_token.pos_end,
+                    f"Program must start with Embark(), Global declaration, or Function declaration"
+                ))
+            except ParseAbort as abort:
+                self.recover(abort, start_tok)
 
-        if embark_node is None:
-            return res.failure(InvalidSyntaxError(
+        if not embark_seen:
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected 'Embark()'"
             ))
 
-        return res.success(ProgramNode(global_statements, embark_node))
+        return ProgramNode(global_statements, embark_node)
 
     def statement(self):
-        res = ParseResult()
-
         while self.current_token.type == TT_NEWLINE:
-            res.register(self.advance())
+            self.advance()
 
         is_constant = False
         constant_tok = None
         if self.current_token.type == TT_CONST:
             is_constant = True
             constant_tok = self.current_token
-            res.register(self.advance())
+            self.advance()
 
-        if self.current_token.type in (TT_INT, TT_FLOAT, TT_CHAR, TT_STRING, TT_BOOL):  # Declaration
-            if self.token_idx + 1 < len(self.tokens) and self.tokens[self.token_idx + 1].type == TT_IDENTIFIER:
-                    stmt = res.register(self.declaration_statement(is_constant, constant_tok))
+        if self.current_token.type in DATA_TYPES:  # Declaration
+            if self.peek() is not None and self.peek().type == TT_IDENTIFIER:
+                    stmt = self.declaration_statement(is_constant, constant_tok)
             else:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected an identifier"
                 ))
         elif self.current_token.type == TT_IDENTIFIER:  # Assignment or Expression
-            if self.peek(1).type in (TT_EQUAL, TT_PLUSAND, TT_MINUSAND, TT_MULAND, TT_DIVAND, TT_MODAND):
-                stmt = res.register(self.assignment_statement())
+            if self.peek(1).type in ASSIGN_OPS:
+                stmt = self.assignment_statement()
             else:
-                stmt = res.register(self.expr_statement())
-        elif self.current_token.type in (TT_INT_LITERAL, TT_FLOAT_LITERAL): # Expression
-            stmt = res.register(self.expr_statement())
-        elif self.current_token.type == TT_RETURN: # Return statement
-            stmt = res.register(self.return_statement())
-        elif self.current_token.type in (TT_IF, TT_ELSE):  # Conditional statement
-            stmt = res.register(self.condition_statement())
-        elif self.current_token.type in (TT_WHILE, TT_FOR, TT_DO): # Loop statement
-            stmt = res.register(self.loop_statement())
-        elif self.current_token.type == TT_SWITCH: # Switch statement
-            stmt = res.register(self.switch_statement())
-        elif self.current_token.type == TT_INPUT: # Input statement
-            stmt = res.register(self.input_statement())
-        elif self.current_token.type == TT_OUTPUT: # Output statement
-            stmt = res.register(self.output_statement())
-        elif self.current_token.type in (TT_BREAK, TT_CONTINUE):  # Loop control
-            stmt = res.register(self.jump_statement())
-        elif self.current_token.type == TT_LPAREN:
-            stmt = res.register(self.expr_statement())
-        elif self.current_token.type == TT_MAIN:
-            return res.failure(InvalidSyntaxError(
-                self.current_token.pos_start, self.current_token.pos_end,
-                "Unexpected 'Embark()' in statement"
-            ))
+                stmt = self.expr_statement()
         else:
-            return res.failure(InvalidSyntaxError(
-                self.current_token.pos_start, self.current_token.pos_end,
-                f"Unexpected token '{self.current_token.value}'"
-            ))
+            handler = self.statement_handlers.get(self.current_token.type)
+
+            if handler is not None:
+                stmt = handler()
+                if isinstance(stmt, GeneratorType):
+                    stmt = yield stmt
+            elif self.current_token.type == TT_MAIN:
+                raise ParseAbort(InvalidSyntaxError(
+                    self.current_token.pos_start, self.current_token.pos_end,
+                    "Unexpected 'Embark()' in statement"
+                ))
+            else:
+                raise ParseAbort(InvalidSyntaxError(
+                    self.current_token.pos_start, self.current_token.pos_end,
+                    f"Unexpected token '{self.current_token.value}'"
+                ))
 
         if self.current_token.type == TT_TERMINATE:
-            res.register(self.advance())
+            self.advance()
 
-        return res.success(stmt)
+        return stmt
 
     def global_declaration(self, is_constant=False, constant_tok=None):
-        res = ParseResult()
-
         while self.current_token.type == TT_NEWLINE:
-            res.register(self.advance())
+            self.advance()
 
         type_tok = self.current_token
 
-        if type_tok.type not in (TT_INT, TT_FLOAT, TT_CHAR, TT_STRING, TT_BOOL):
-            return res.failure(InvalidSyntaxError(
+        if type_tok.type not in DATA_TYPES:
+            raise ParseAbort(InvalidSyntaxError(
                 type_tok.pos_start, type_tok.pos_end,
                 "Expected data type (Numeral, Decimal, Letter, Missive, Veracity)"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         if self.current_token.type != TT_IDENTIFIER:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 f"Unexpected token '{self.current_token.value}'"
             ))
@@ -198,66 +384,64 @@ class Parser:
             array_size = None
             array_values = []
 
-            res.register(self.advance())
-
-            self.symbol_table[id_tok.value] = type_tok.type
+            self.advance()
 
             if self.current_token.type == TT_LBRACKET:
                 is_array = True
-                res.register(self.advance())
+                self.advance()
 
                 if self.current_token.type != TT_INT_LITERAL:
-                    return res.failure(InvalidSyntaxError(
+                    raise ParseAbort(InvalidSyntaxError(
                         self.current_token.pos_start, self.current_token.pos_end,
                         "Expected a Numeral literal for Ledger size"
                     ))
 
                 array_size = self.current_token
-                res.register(self.advance())
+                self.advance()
 
                 if self.current_token.type != TT_RBRACKET:
-                    return res.failure(InvalidSyntaxError(
+                    raise ParseAbort(InvalidSyntaxError(
                         self.current_token.pos_start, self.current_token.pos_end,
                         "Expected ']' after array size"
                     ))
 
-                res.register(self.advance())
+                self.advance()
 
             if self.current_token.type == TT_EQUAL:
-                res.register(self.advance())
+                self.advance()
 
                 if is_array:
                     if self.current_token.type != TT_LBRACE:
-                        return res.failure(InvalidSyntaxError(
+                        raise ParseAbort(InvalidSyntaxError(
                             self.current_token.pos_start, self.current_token.pos_end,
                             "Expected '{' to initialize array"
                         ))
 
-                    res.register(self.advance())
+                    self.advance()
 
                     while self.current_token.type != TT_RBRACE:
                         if (type_tok.type == TT_INT and self.current_token.type != TT_INT_LITERAL) or \
                         (type_tok.type == TT_FLOAT and self.current_token.type != TT_FLOAT_LITERAL) or \
                         (type_tok.type == TT_CHAR and self.current_token.type != TT_CHAR_LITERAL):
-                            return res.failure(InvalidSyntaxError(
+                            raise ParseAbort(InvalidSyntaxError(
                                 self.current_token.pos_start, self.current_token.pos_end,
                                 f"Type mismatch in Ledger '{id_tok.value}', expected {type_tok.value}"
                             ))
                         array_values.append(self.current_token)
-                        res.register(self.advance())
+                        self.advance()
 
                         if self.current_token.type == TT_COMMA:
-                            res.register(self.advance())
+                            self.advance()
                         elif self.current_token.type != TT_RBRACE:
-                            return res.failure(InvalidSyntaxError(
+                            raise ParseAbort(InvalidSyntaxError(
                                 self.current_token.pos_start, self.current_token.pos_end,
                                 "Expected ',' or '}'"
                             ))
 
-                    res.register(self.advance())
+                    self.advance()
 
                     if array_size and len(array_values) > int(array_size.value):
-                        return res.failure(InvalidSyntaxError(
+                        raise ParseAbort(InvalidSyntaxError(
                             pos_start, self.current_token.pos_end,
                             f"Ledger '{id_tok.value}' has too many elements (expected {array_size.value}, got {len(array_values)})"
                         ))
@@ -266,30 +450,24 @@ class Parser:
                 else:
                     if type_tok.type == TT_STRING and self.current_token.type == TT_STRING_LITERAL:
                         var_value = self.current_token
-                        res.register(self.advance())
+                        self.advance()
                     elif type_tok.type == TT_CHAR and self.current_token.type == TT_CHAR_LITERAL:
                         var_value = self.current_token
-                        res.register(self.advance())
+                        self.advance()
                     else:
-                        var_value = res.register(self.expr())
+                        # A value that fails to parse is reported as missing
+                        try:
+                            var_value = self.expr()
+                        except ParseAbort:
+                            var_value = None
                     if var_value is None:
-                        return res.failure(InvalidSyntaxError(
+                        raise ParseAbort(InvalidSyntaxError(
                             self.current_token.pos_start, self.current_token.pos_end,
                             "Invalid assignment: Expected a value but got nothing."
                         ))
 
-                    if (type_tok.type == TT_INT and not isinstance(var_value, (NumeralNode, BinOpNode))) or \
-                    (type_tok.type == TT_FLOAT and not isinstance(var_value, (DecimalNode, BinOpNode))) or \
-                    (type_tok.type == TT_BOOL and not isinstance(var_value, VeracityNode)) or \
-                    (type_tok.type == TT_STRING and var_value.type != TT_STRING_LITERAL) or \
-                    (type_tok.type == TT_CHAR and var_value.type != TT_CHAR_LITERAL):
-                        return res.failure(InvalidSyntaxError(
-                            var_value.pos_start, var_value.pos_end,
-                            f"Type mismatch: '{id_tok.value}' is {type_tok.value}, but got {var_value}"
-                        ))
-
             if is_constant and var_value is None:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     id_tok.pos_start, id_tok.pos_end,
                     "Constants must be initialized"
                 ))
@@ -297,9 +475,9 @@ class Parser:
             identifiers.append((id_tok, var_value, is_array, array_size))
 
             if self.current_token.type == TT_COMMA:
-                res.register(self.advance())
+                self.advance()
                 if self.current_token.type != TT_IDENTIFIER:
-                    return res.failure(InvalidSyntaxError(
+                    raise ParseAbort(InvalidSyntaxError(
                         self.current_token.pos_start, self.current_token.pos_end,
                         "Expected an identifier after ','"
                     ))
@@ -307,35 +485,33 @@ class Parser:
                 break
 
         if self.current_token.type != TT_TERMINATE:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected ';' at the end of declaration"
             ))
 
         pos_end = self.current_token.pos_end
-        res.register(self.advance())
+        self.advance()
 
 
-        return res.success(GlobalDeclareNode(type_tok, identifiers, pos_start, pos_end, is_constant, constant_tok))
+        return GlobalDeclareNode(type_tok, identifiers, pos_start, pos_end, is_constant, constant_tok)
 
     def declaration_statement(self, is_constant=False, constant_tok=None):
-        res = ParseResult()
-
         while self.current_token.type == TT_NEWLINE:
-            res.register(self.advance())
+            self.advance()
 
         type_tok = self.current_token
 
-        if type_tok.type not in (TT_INT, TT_FLOAT, TT_CHAR, TT_STRING, TT_BOOL):
-            return res.failure(InvalidSyntaxError(
+        if type_tok.type not in DATA_TYPES:
+            raise ParseAbort(InvalidSyntaxError(
                 type_tok.pos_start, type_tok.pos_end,
                 "Expected data type (Numeral, Decimal, Letter, Missive, Veracity)"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         if self.current_token.type != TT_IDENTIFIER:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 f"Unexpected token '{self.current_token.value}'"
             ))
@@ -350,66 +526,64 @@ class Parser:
             array_size = None
             array_values = []
 
-            res.register(self.advance())
-
-            self.symbol_table[id_tok.value] = type_tok.type
+            self.advance()
 
             if self.current_token.type == TT_LBRACKET:
                 is_array = True
-                res.register(self.advance())
+                self.advance()
 
                 if self.current_token.type != TT_INT_LITERAL:
-                    return res.failure(InvalidSyntaxError(
+                    raise ParseAbort(InvalidSyntaxError(
                         self.current_token.pos_start, self.current_token.pos_end,
                         "Expected a Numeral literal for Ledger size"
                     ))
 
                 array_size = self.current_token
-                res.register(self.advance())
+                self.advance()
 
                 if self.current_token.type != TT_RBRACKET:
-                    return res.failure(InvalidSyntaxError(
+                    raise ParseAbort(InvalidSyntaxError(
                         self.current_token.pos_start, self.current_token.pos_end,
                         "Expected ']' after array size"
                     ))
 
-                res.register(self.advance())
+                self.advance()
 
             if self.current_token.type == TT_EQUAL:
-                res.register(self.advance())
+                self.advance()
 
                 if is_array:
                     if self.current_token.type != TT_LBRACE:
-                        return res.failure(InvalidSyntaxError(
+                        raise ParseAbort(InvalidSyntaxError(
                             self.current_token.pos_start, self.current_token.pos_end,
                             "Expected '{' to initialize array"
                         ))
 
-                    res.register(self.advance())
+                    self.advance()
 
                     while self.current_token.type != TT_RBRACE:
                         if (type_tok.type == TT_INT and self.current_token.type != TT_INT_LITERAL) or \
                         (type_tok.type == TT_FLOAT and self.current_token.type != TT_FLOAT_LITERAL) or \
                         (type_tok.type == TT_CHAR and self.current_token.type != TT_CHAR_LITERAL):
-                            return res.failure(InvalidSyntaxError(
+                            raise ParseAbort(InvalidSyntaxError(
                                 self.current_token.pos_start, self.current_token.pos_end,
                                 f"Type mismatch in Ledger '{id_tok.value}', expected {type_tok.value}"
                             ))
                         array_values.append(self.current_token)
-                        res.register(self.advance())
+                        self.advance()
 
                         if self.current_token.type == TT_COMMA:
-                            res.register(self.advance())
+                            self.advance()
                         elif self.current_token.type != TT_RBRACE:
-                            return res.failure(InvalidSyntaxError(
+                            raise ParseAbort(InvalidSyntaxError(
                                 self.current_token.pos_start, self.current_token.pos_end,
                                 "Expected ',' or '}'"
                             ))
 
-                    res.register(self.advance())
+                    self.advance()
 
                     if array_size and len(array_values) > int(array_size.value):
-                        return res.failure(InvalidSyntaxError(
+                        raise ParseAbort(InvalidSyntaxError(
                             pos_start, self.current_token.pos_end,
                             f"Ledger '{id_tok.value}' has too many elements (expected {array_size.value}, got {len(array_values)})"
                         ))
@@ -418,30 +592,24 @@ class Parser:
                 else:
                     if type_tok.type == TT_STRING and self.current_token.type == TT_STRING_LITERAL:
                         var_value = self.current_token
-                        res.register(self.advance())
+                        self.advance()
                     elif type_tok.type == TT_CHAR and self.current_token.type == TT_CHAR_LITERAL:
                         var_value = self.current_token
-                        res.register(self.advance())
+                        self.advance()
                     else:
-                        var_value = res.register(self.expr())
+                        # A value that fails to parse is reported as missing
+                        try:
+                            var_value = self.expr()
+                        except ParseAbort:
+                            var_value = None
                     if var_value is None:
-                        return res.failure(InvalidSyntaxError(
+                        raise ParseAbort(InvalidSyntaxError(
                             self.current_token.pos_start, self.current_token.pos_end,
                             "Invalid assignment: Expected a value but got nothing."
                         ))
 
-                    if (type_tok.type == TT_INT and not isinstance(var_value, (NumeralNode, BinOpNode))) or \
-                    (type_tok.type == TT_FLOAT and not isinstance(var_value, (DecimalNode, BinOpNode))) or \
-                    (type_tok.type == TT_BOOL and not isinstance(var_value, VeracityNode)) or \
-                    (type_tok.type == TT_STRING and var_value.type != TT_STRING_LITERAL) or \
-                    (type_tok.type == TT_CHAR and var_value.type != TT_CHAR_LITERAL):
-                        return res.failure(InvalidSyntaxError(
-                            var_value.pos_start, var_value.pos_end,
-                            f"Type mismatch: '{id_tok.value}' is {type_tok.value}, but got {var_value}"
-                        ))
-
             if is_constant and var_value is None:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     id_tok.pos_start, id_tok.pos_end,
                     "Constants must be initialized"
                 ))
@@ -449,9 +617,9 @@ class Parser:
             identifiers.append((id_tok, var_value, is_array, array_size))
 
             if self.current_token.type == TT_COMMA:
-                res.register(self.advance())
+                self.advance()
                 if self.current_token.type != TT_IDENTIFIER:
-                    return res.failure(InvalidSyntaxError(
+                    raise ParseAbort(InvalidSyntaxError(
                         self.current_token.pos_start, self.current_token.pos_end,
                         "Expected an identifier after ','"
                     ))
@@ -459,636 +627,584 @@ class Parser:
                 break
 
         if self.current_token.type != TT_TERMINATE:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected ';' at the end of declaration"
             ))
 
         pos_end = self.current_token.pos_end
-        res.register(self.advance())
+        self.advance()
 
-        return res.success(DeclareNode(type_tok, identifiers, pos_start, pos_end, is_constant, constant_tok))
+        return DeclareNode(type_tok, identifiers, pos_start, pos_end, is_constant, constant_tok)
 
     def assignment_statement(self):
-        res = ParseResult()
-
         while self.current_token.type == TT_NEWLINE:
-            res.register(self.advance())
+            self.advance()
 
         if self.current_token.type != TT_IDENTIFIER:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected an identifier"
             ))
 
         id_tok = self.current_token
+        self.advance()
 
-        if id_tok.value not in self.symbol_table:
-            return res.failure(InvalidSyntaxError(
-                id_tok.pos_start, id_tok.pos_end,
-                f"Undeclared variable '{id_tok.value}'"
-            ))
-
-        declared_type = self.symbol_table[id_tok.value]
-
-        res.register(self.advance())
-
-        if self.current_token.type not in (TT_PLUSAND, TT_MINUSAND, TT_MULAND, TT_DIVAND, TT_MODAND, TT_EQUAL):
-            return res.failure(InvalidSyntaxError(
+        if self.current_token.type not in ASSIGN_OPS:
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected an assignment operator"
             ))
 
         assign_op = self.current_token
-        res.register(self.advance())
-
-        expr = None
-        if self.current_token.type in (TT_CHAR_LITERAL, TT_STRING_LITERAL, TT_TRUE, TT_FALSE, TT_NULL):
-            expr = self.current_token
-            res.register(self.advance())
-
-            if (declared_type == TT_INT or declared_type == TT_FLOAT):
-                return res.failure(InvalidSyntaxError(
-                    expr.pos_start, expr.pos_end,
-                    f"Type mismatch: '{id_tok.value}' is {declared_type}, but got {expr.type}"
-                ))
-
-            if (declared_type == TT_CHAR and expr.type != TT_CHAR_LITERAL) or \
-            (declared_type == TT_STRING and expr.type != TT_STRING_LITERAL) or \
-            (declared_type == TT_BOOL and expr.type not in (TT_TRUE, TT_FALSE, TT_NULL)):
-                return res.failure(InvalidSyntaxError(
-                    expr.pos_start, expr.pos_end,
-                    f"Type mismatch: '{id_tok.value}' is {declared_type}, but got {expr.type}"
-                ))
+        self.advance()
 
-        elif self.current_token.type in (TT_INT_LITERAL, TT_FLOAT_LITERAL):
+        # Checking the value against the variable's type is left to the
+        # semantic analyzer
+        if self.current_token.type in VALUE_LITERALS or self.current_token.type in NUMERIC_LITERALS:
             expr = self.current_token
-            res.register(self.advance())
-
-            if (declared_type == TT_INT and expr.type == TT_FLOAT_LITERAL):
-                return res.failure(InvalidSyntaxError(
-                    expr.pos_start, expr.pos_end,
-                    f"Type mismatch: '{id_tok.value}' is {declared_type}, but got {expr.type}"
-                ))
-
-            if (declared_type == TT_FLOAT and expr.type != TT_FLOAT_LITERAL):
-                return res.failure(InvalidSyntaxError(
-                    expr.pos_start, expr.pos_end,
-                    f"Type mismatch: '{id_tok.value}' is {declared_type}, but got {expr.type}"
-                ))
-
+            self.advance()
         else:
-            expr = res.register(self.arith_expr())
-            if res.error:
-                return res
-
-            if declared_type not in (TT_INT, TT_FLOAT):
-                return res.failure(InvalidSyntaxError(
-                    expr.pos_start, expr.pos_end,
-                    f"Type mismatch: Cannot assign a numerical expression to '{id_tok.value}' of type {declared_type}"
-                ))
+            expr = self.arith_expr()
 
         if self.current_token.type != TT_TERMINATE:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected ';' at the end of assignment"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         if assign_op.type == TT_EQUAL:
-            return res.success(AssignNode(id_tok, assign_op, expr))
+            return AssignNode(id_tok, assign_op, expr)
         else:
-            return res.success(CompoundAssignNode(id_tok, assign_op, expr))
+            return CompoundAssignNode(id_tok, assign_op, expr)
 
     def expr_statement(self):
-        res = ParseResult()
         expr = None
 
-        if self.current_token.type in (TT_TRUE, TT_FALSE, TT_NULL):
+        if self.current_token.type in VERACITY_LITERALS:
             expr = VeracityNode(self.current_token)
-            res.register(self.advance())
+            self.advance()
 
-        elif self.current_token.type in (TT_INT_LITERAL, TT_FLOAT_LITERAL):
+        elif self.current_token.type in NUMERIC_LITERALS:
             expr = NumeralNode(self.current_token)
-            res.register(self.advance())
+            self.advance()
 
         # Function Call
         elif self.current_token.type == TT_IDENTIFIER and self.peek(1).type == TT_LPAREN:
-            expr = res.register(self.func_call())
-            if res.error: return res
+            expr = self.func_call()
 
         # Update expressions
-        elif self.current_token.type == TT_IDENTIFIER and self.peek(1).type in (TT_INC, TT_DEC):
-            expr = res.register(self.update_expr())
-            if res.error: return res
+        elif self.current_token.type == TT_IDENTIFIER and self.peek(1).type in UPDATE_OPS:
+            expr = self.update_expr()
 
         # Logical expressions
-        elif self.current_token.type in (TT_AND, TT_OR, TT_NOT) or self.peek(1).type in (TT_AND, TT_OR, TT_NOT):
-            expr = res.register(self.expr())
-            if res.error: return res
+        elif self.current_token.type in LOGICAL_OPS or self.peek(1).type in LOGICAL_OPS:
+            expr = self.expr()
 
         # Comparison expressions
-        elif self.current_token.type in (TT_LESSTHAN, TT_GREATERTHAN, TT_LESSTHANEQUAL, TT_GREATERTHANEQUAL) or \
-            self.peek(1).type in (TT_LESSTHAN, TT_GREATERTHAN, TT_LESSTHANEQUAL, TT_GREATERTHANEQUAL):
-            expr = res.register(self.comp_expr())
-            if res.error: return res
+        elif self.current_token.type in RELATIONAL_OPS or \
+            self.peek(1).type in RELATIONAL_OPS:
+            expr = self.comp_expr()
 
         # Arithmetic expressions
         else:
-            expr = res.register(self.arith_expr())
-            if res.error: return res
+            expr = self.arith_expr()
 
         if self.current_token.type == TT_TERMINATE:
-            res.register(self.advance())
-            return res.success(expr)
+            self.advance()
+            return expr
 
-        return res.success(expr) if expr else res.failure(InvalidSyntaxError(
-        self.current_token.pos_start, self.current_token.pos_end,
-        "Invalid expression"
-    ))
+        if expr:
+            return expr
+
+        raise ParseAbort(InvalidSyntaxError(
+            self.current_token.pos_start, self.current_token.pos_end,
+            "Invalid expression"
+        ))
 
     def factor(self):
-        res = ParseResult()
+        # Signs and parentheses are handled by binary_expr
         tok = self.current_token
 
-        if tok.type in (TT_PLUS, TT_MINUS):
-            res.register(self.advance())
-            factor = res.register(self.factor())
-            if res.error: return res
-
-            if not isinstance(factor, (NumeralNode, DecimalNode)):
-                return res.failure(InvalidSyntaxError(
-                    factor.pos_start, factor.pos_end,
-                    "+ and - can only be applied to Numeral or Decimal types"
-                ))
-
-            return res.success(UnaryOpNode(tok, factor))
-
-        elif tok.type == TT_INT_LITERAL:
-            res.register(self.advance())
-            return res.success(NumeralNode(tok))
+        if tok.type == TT_INT_LITERAL:
+            self.advance()
+            return NumeralNode(tok)
 
         elif tok.type == TT_FLOAT_LITERAL:
-            res.register(self.advance())
-            return res.success(DecimalNode(tok))
+            self.advance()
+            return DecimalNode(tok)
 
         elif tok.type == TT_IDENTIFIER:
-            if tok.value not in self.symbol_table:
-                return res.failure(InvalidSyntaxError(
-                    tok.pos_start, tok.pos_end,
-                    f"Undeclared variable '{tok.value}'"
-                ))
-
-            var_access = AccessNode(tok)
-            res.register(self.advance())
-
-            if tok.value not in self.symbol_table:
-                return res.failure(InvalidSyntaxError(
-                    tok.pos_start, tok.pos_end,
-                    f"Undeclared variable '{tok.value}'"
-                ))
-
-            var_type = self.symbol_table.get(tok.value)
-
-            if var_type not in (TT_INT, TT_FLOAT):
-                return res.failure(InvalidSyntaxError(
-                    tok.pos_start, tok.pos_end,
-                    f"Invalid operand '{tok.value}': Expected Numeral or Decimal but got {var_type}"
-                ))
-
-            var_value = self.symbol_table.get(tok.value)
-            if var_value is not None:
-                return res.success(NumeralNode(tok) if var_type == TT_INT else DecimalNode(tok))
-
-            return res.success(var_access)
-
-        elif tok.type == TT_LPAREN:
-            res.register(self.advance())
-
-            expr = res.register(self.expr())
-            if res.error: return res
+            if self.peek(1).type == TT_LPAREN:
+                return self.func_call()
+            self.advance()
+            return AccessNode(tok)
 
-            if self.current_token.type == TT_RPAREN:
-                res.register(self.advance())
-                return res.success(expr)
-
-            return res.failure(InvalidSyntaxError(
-                self.current_token.pos_start, self.current_token.pos_end,
-                "Expected closing ')'"
-            ))
-
-        return res.failure(InvalidSyntaxError(
+        raise ParseAbort(InvalidSyntaxError(
             tok.pos_start, tok.pos_end,
             "Expected Numeral, Decimal values, or a valid Identifier"
         ))
 
-    def arith_expr(self):
-        return self.bin_op(self.term, (TT_PLUS, TT_MINUS))
-
-    def term(self):
-        return self.bin_op(self.factor, (TT_MUL, TT_DIV))
-
-    def bin_op(self, func, ops):
-        res = ParseResult()
-        left = res.register(func())
-        if res.error: return res
-
-        while self.current_token.type in ops:
-            op_tok = self.current_token
-            res.register(self.advance())
-            right = res.register(func())
-            if res.error: return res
-
-            if not isinstance(left, (NumeralNode, DecimalNode)) or not isinstance(right, (NumeralNode, DecimalNode)):
-                return res.failure(InvalidSyntaxError(
-                    left.pos_start, right.pos_end,
-                    f"Type mismatch: Cannot perform '{op_tok.value}' between {type(left).__name__} and {type(right).__name__}"
-                ))
-
-            left = BinOpNode(left, op_tok, right)
-
-        return res.success(left)
-
     def expr(self):
-        return self.logic_or_expr()
-
-    def logic_or_expr(self):
-        res = ParseResult()
-        left = res.register(self.logic_and_expr())
-        if res.error: return res
-
-        while self.current_token.type == TT_OR:
-            op_tok = self.current_token
-            res.register(self.advance())
-            right = res.register(self.logic_and_expr())
-            if res.error: return res
-            left = BinOpNode(left, op_tok, right)
+        return self.binary_expr()
 
-        return res.success(left)
+    def comp_expr(self):
+        return self.binary_expr(LOGIC_AND_PRECEDENCE)
 
-    def logic_and_expr(self):
-        res = ParseResult()
-        left = res.register(self.comp_expr())
-        if res.error: return res
+    def arith_expr(self):
+        return self.binary_expr(COMP_PRECEDENCE)
+
+    def binary_expr(self, min_precedence=0):
+        """Parses factors joined by operators that bind tighter than
+        min_precedence in one loop over the BINARY_OPERATORS table, keeping
+        pending operators on a stack instead of descending through one
+        method per precedence level.
+
+        Parentheses and + or - signs do not recurse either: an open '('
+        saves the current level on `levels` and starts a new one, so the
+        nesting depth is only limited by memory.
+        """
+        levels = []
+        operands = []
+        operators = []
+        signs = []
+
+        while True:
+            tok = self.current_token
+
+            if tok.type in SIGN_OPS:
+                signs.append(tok)
+                self.advance()
+                continue
 
-        while self.current_token.type == TT_AND:
-            op_tok = self.current_token
-            res.register(self.advance())
-            right = res.register(self.comp_expr())
-            if res.error: return res
-            left = BinOpNode(left, op_tok, right)
+            if tok.type == TT_LPAREN:
+                levels.append((min_precedence, operands, operators, signs))
+                min_precedence, operands, operators, signs = 0, [], [], []
+                self.advance()
+                continue
 
-        return res.success(left)
+            operand = self.factor()
 
-    def comp_expr(self):
-        res = ParseResult()
-        left = res.register(self.arith_expr())
-        if res.error: return res
+            while True:
+                # Signs apply to the operand they precede, innermost first
+                while signs:
+                    operand = UnaryOpNode(signs.pop(), operand)
 
-        while self.current_token.type in (TT_EQUALTO, TT_NOTEQUAL, TT_LESSTHAN, TT_GREATERTHAN, TT_LESSTHANEQUAL, TT_GREATERTHANEQUAL):
-            op_tok = self.current_token
-            res.register(self.advance())
-            right = res.register(self.arith_expr())
-            if res.error: return res
-            left = BinOpNode(left, op_tok, right)
+                operands.append(operand)
 
-        return res.success(left)
+                op_tok = self.current_token
+                operator = BINARY_OPERATORS.get(op_tok.type)
+                precedence = operator[0] if operator is not None and operator[0] > min_precedence else min_precedence
+
+                # Everything stacked that binds at least as tightly is complete
+                while operators and BINARY_OPERATORS[operators[-1].type][0] >= precedence:
+                    right = operands.pop()
+                    left = operands.pop()
+                    operands.append(BinOpNode(left, operators.pop(), right))
+
+                if precedence != min_precedence:
+                    operators.append(op_tok)
+                    self.advance()
+                    break
 
-    def update_expr(self):
-        res = ParseResult()
+                if not levels:
+                    return operands[0]
 
-        if self.current_token.type == TT_IDENTIFIER:
-            id_tok = self.current_token
+                # A finished level inside parentheses is the operand of the
+                # level that opened them
+                if self.current_token.type != TT_RPAREN:
+                    raise ParseAbort(InvalidSyntaxError(
+                        self.current_token.pos_start, self.current_token.pos_end,
+                        "Expected closing ')'"
+                    ))
 
-            if id_tok.value not in self.symbol_table:
-                return res.failure(InvalidSyntaxError(
-                    id_tok.pos_start, id_tok.pos_end,
-                    f"Undeclared variable '{id_tok.value}'"
-                ))
+                self.advance()
+                operand = operands[0]
+                min_precedence, operands, operators, signs = levels.pop()
 
-            var_type = self.symbol_table[id_tok.value]
+    def update_expr(self):
+        id_tok = self.current_token
 
-            if var_type not in (TT_INT, TT_FLOAT):
-                return res.failure(InvalidSyntaxError(
-                    id_tok.pos_start, id_tok.pos_end,
-                    f"Invalid operation on '{id_tok.value}': Only Numeral and Decimal types can be updated"
-                ))
+        if id_tok.type != TT_IDENTIFIER:
+            raise ParseAbort(InvalidSyntaxError(
+                id_tok.pos_start, id_tok.pos_end,
+                "Expected an identifier"
+            ))
 
-            res.register(self.advance())
+        self.advance()
 
-            if self.current_token.type in (TT_INC, TT_DEC):
-                op_tok = self.current_token
-                res.register(self.advance())
+        if self.current_token.type in UPDATE_OPS:
+            op_tok = self.current_token
+            self.advance()
 
-                return res.success(UnaryOpNode(op_tok, AccessNode(id_tok), is_post=True))
+            return UnaryOpNode(op_tok, AccessNode(id_tok), is_post=True)
 
-            elif self.current_token.type != TT_RPAREN:
-                return res.failure(InvalidSyntaxError(
-                    self.current_token.pos_start, self.current_token.pos_end,
-                    "Expected ')'"
-                ))
+        elif self.current_token.type != TT_RPAREN:
+            raise ParseAbort(InvalidSyntaxError(
+                self.current_token.pos_start, self.current_token.pos_end,
+                "Expected ')'"
+            ))
 
-        return res.success(AccessNode(id_tok))
+        return AccessNode(id_tok)
 
     def func_call(self):
-        res = ParseResult()
         func_name = self.current_token
-        res.register(self.advance())
+        self.advance()
 
         if self.current_token.type != TT_LPAREN:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected '(' after function name"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         args = []
 
         while self.current_token.type != TT_RPAREN:
             arg = self.current_token
 
-            if arg.type in (TT_IDENTIFIER, TT_INT_LITERAL, TT_FLOAT_LITERAL, TT_STRING_LITERAL, TT_CHAR_LITERAL, TT_TRUE, TT_FALSE):
+            if arg.type in ARGUMENT_TOKENS:
                 args.append(AccessNode(arg) if arg.type == TT_IDENTIFIER else LiteralNode(arg))
-                res.register(self.advance())
+                self.advance()
             else:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     f"Invalid function argument '{arg.value}': Expected Numeral, Decimal, Missive, Letter, or Veracity but got {arg.type}"
                 ))
 
             if self.current_token.type == TT_COMMA:
-                res.register(self.advance())
+                self.advance()
             elif self.current_token.type != TT_RPAREN:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected ',' or ')'"
                 ))
 
-        res.register(self.advance())
+        self.advance()
 
-        return res.success(FuncCallNode(func_name, args))
+        return FuncCallNode(func_name, args)
 
     def func_dec_def(self):
-        res = ParseResult()
         return_type = self.current_token
-        res.register(self.advance())
+        self.advance()
         pos_start = self.current_token.pos_start
 
         if self.current_token.type != TT_IDENTIFIER:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected function name"
             ))
 
         id_tok = self.current_token
-        res.register(self.advance())
+        self.advance()
 
         if self.current_token.type != TT_LPAREN:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected '('"
             ))
 
-        res.register(self.advance())
+        self.advance()
         args = []
 
-        while self.current_token.type in (TT_INT, TT_FLOAT, TT_CHAR, TT_STRING, TT_BOOL):
+        while self.current_token.type in DATA_TYPES:
             type_tok = self.current_token
-            res.register(self.advance())
+            self.advance()
 
             if self.current_token.type != TT_IDENTIFIER:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected parameter name"
                 ))
 
             param_id = self.current_token
-            res.register(self.advance())
-
-            self.symbol_table[param_id.value] = type_tok.type
+            self.advance()
 
             args.append((type_tok, param_id))
 
             if self.current_token.type == TT_COMMA:
-                res.register(self.advance())
+                self.advance()
             elif self.current_token.type != TT_RPAREN:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected ',' or ')'"
                 ))
 
         if self.current_token.type != TT_RPAREN:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected ')'"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         if self.current_token.type == TT_TERMINATE:
-            res.register(self.advance())
+            self.advance()
             pos_end = self.current_token.pos_end
-            return res.success(FuncDecNode(return_type, id_tok, args, pos_start, pos_end))
+            return FuncDecNode(id_tok, args, return_type, pos_start, pos_end)
 
         elif self.current_token.type == TT_LBRACE:
-            res.register(self.advance())
-
-            statements = []
+            self.advance()
 
-            while self.current_token.type != TT_RBRACE and self.current_token.type != TT_EOF:
-                stmt = res.register(self.statement())
-                if res.error:
-                    return res
-                statements.append(stmt)
-
-                while self.current_token.type == TT_NEWLINE:
-                    res.register(self.advance())
+            if self.lazy_bodies:
+                statements = LazyBody(self.skip_body())
+                self.skipped_bodies.append(statements)
+            else:
+                statements = yield self.func_body()
 
             if self.current_token.type != TT_RBRACE:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected '}'"
                 ))
 
-            res.register(self.advance())
+            self.advance()
 
             if self.current_token.type == TT_NEWLINE:
-                res.register(self.advance())
+                self.advance()
 
             pos_end = self.current_token.pos_end
-            return res.success(FuncDefNode(return_type, id_tok, args, statements, pos_start, pos_end))
+            return FuncDefNode(id_tok, args, return_type, statements, pos_start, pos_end)
 
-        return res.failure(InvalidSyntaxError(
+        raise ParseAbort(InvalidSyntaxError(
             self.current_token.pos_start, self.current_token.pos_end,
             "Expected ';' or '{'"
         ))
 
+    def func_body(self):
+        statements = []
+
+        while self.current_token.type != TT_RBRACE and self.current_token.type != TT_EOF:
+            stmt = yield self.block_statement()
+            if stmt is not None:
+                statements.append(stmt)
+
+            while self.current_token.type == TT_NEWLINE:
+                self.advance()
+
+        return statements
+
+    def skip_body(self):
+        """Collects the tokens up to the '}' that closes a function body,
+        without parsing them, and ends them with an EOF at that '}'.
+        """
+        if self.buffer is not None and not self.lookahead:
+            return self.skip_buffered_body()
+
+        tokens = []
+        depth = 0
+
+        while self.current_token.type != TT_EOF:
+            tok = self.current_token
+            if tok.type == TT_LBRACE:
+                depth += 1
+            elif tok.type == TT_RBRACE:
+                if depth == 0:
+                    tokens.append(Tokens(TT_EOF, start=tok.start, end=tok.end, source=tok.source))
+                    return tokens
+                depth -= 1
+
+            tokens.append(tok)
+            self.advance()
+
+        raise ParseAbort(InvalidSyntaxError(
+            self.current_token.pos_start, self.current_token.pos_end,
+            "Expected '}'"
+        ))
+
+    def skip_buffered_body(self):
+        # Finds the closing '}' on the type column, so the skipped tokens
+        # never get a view, and hands the body out as a slice of the buffer
+        buffer = self.buffer
+        lo = buffer.index_at(self.current_token.start)
+        lbrace = TYPE_IDS[TT_LBRACE]
+        rbrace = TYPE_IDS[TT_RBRACE]
+        depth = 0
+
+        types = buffer.types
+        for idx in range(lo, len(types)):
+            type_id = types[idx]
+            if type_id == lbrace:
+                depth += 1
+            elif type_id == rbrace:
+                if depth == 0:
+                    break
+                depth -= 1
+        else:
+            # Unclosed, so the body runs into EOF and is reported from there
+            self.tokens = buffer.without(*TRIVIA, start=len(buffer) - 1)
+            self.advance()
+            raise ParseAbort(InvalidSyntaxError(
+                self.current_token.pos_start, self.current_token.pos_end,
+                "Expected '}'"
+            ))
+
+        body = buffer[lo:idx]
+        body.add(TT_EOF, None, buffer.start_at(idx), buffer.end_at(idx))
+
+        self.tokens = buffer.without(*TRIVIA, start=idx)
+        self.advance()
+        return body
+
     def main_prog(self):
-        res = ParseResult()
         pos_start = self.current_token.pos_start
         embark_tok = self.current_token
 
 
         if embark_tok.type != TT_MAIN:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 embark_tok.pos_start, embark_tok.pos_end,
                 "Expected 'Embark()'"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         if self.current_token.type != TT_LPAREN:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected '('"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         if self.current_token.type != TT_RPAREN:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected ')'"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         if self.current_token.type != TT_LBRACE:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected '{'"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         while self.current_token.type == TT_NEWLINE:
-            res.register(self.advance())
+            self.advance()
 
         statements = []
 
         while self.current_token.type != TT_RBRACE and self.current_token.type != TT_EOF:
-            stmt = res.register(self.statement())
-
-            if res.error:
-                return res
-            statements.append(stmt)
+            stmt = yield self.block_statement()
+            if stmt is not None:
+                statements.append(stmt)
 
             if self.current_token.type == TT_NEWLINE:
-                res.register(self.advance())
+                self.advance()
 
         if self.current_token.type != TT_RBRACE:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected '}'"
             ))
 
         pos_end = self.current_token.pos_end
-        res.register(self.advance())
+        self.advance()
 
         if self.current_token.type == TT_NEWLINE:
-            res.register(self.advance())
+            self.advance()
 
-        return res.success(EmbarkNode(embark_tok, statements, pos_start, pos_end))
+        return EmbarkNode(embark_tok, statements, pos_start, pos_end)
 
     def return_statement(self):
-        res = ParseResult()
         return_tok = self.current_token
-        res.register(self.advance())
+        self.advance()
 
-        expr = res.register(self.expr())
-        if res.error: return res
+        expr = self.expr()
 
         if self.current_token.type != TT_TERMINATE:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected ';'"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
-        return res.success(ReturnNode(return_tok, expr))
+        return ReturnNode(return_tok, expr)
 
     def condition_statement(self):
-        res = ParseResult()
         thou_tok = self.current_token
-        res.register(self.advance())
+        self.advance()
 
         if thou_tok.type == TT_ELSE:
             if self.current_token.type == TT_IF:
                 thou_tok = self.current_token
-                res.register(self.advance())
+                self.advance()
             else:
                 condition = None
 
         if thou_tok.type == TT_IF:
             if self.current_token.type != TT_LPAREN:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected '('"
                 ))
 
-            res.register(self.advance())
-            condition = res.register(self.expr())
-            if res.error: return res
+            self.advance()
+            condition = self.expr()
 
             if self.current_token.type != TT_RPAREN:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected ')'"
                 ))
 
-            res.register(self.advance())
+            self.advance()
         else:
             condition = None
 
         if self.current_token.type != TT_LBRACE:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected '{'"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         statements = []
         while self.current_token.type != TT_RBRACE and self.current_token.type != TT_EOF:
-            stmt = res.register(self.statement())
-            if res.error: return res
-            statements.append(stmt)
+            stmt = yield self.block_statement()
+            if stmt is not None:
+                statements.append(stmt)
 
             if self.current_token.type == TT_NEWLINE:
-                res.register(self.advance())
+                self.advance()
 
         if self.current_token.type != TT_RBRACE:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected '}'"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         else_stmt = None
         if self.current_token.type == TT_ELSE:
-            else_stmt = res.register(self.condition_statement())
+            else_stmt = yield self.condition_statement()
 
-        return res.success(ThouNode(thou_tok, condition, statements, else_stmt))
+        return ThouNode(thou_tok, condition, statements, else_stmt)
 
     def input_statement(self):
-        res = ParseResult()
         seek_tok = self.current_token
-        res.register(self.advance())
+        self.advance()
 
         if self.current_token.type != TT_LPAREN:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected '('"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         if self.current_token.type != TT_STRING_LITERAL: # Format specifier
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected format specifier"
             ))
@@ -1096,66 +1212,65 @@ class Parser:
         format_specifier = self.current_token
         pos_start = self.current_token.pos_start
 
-        res.register(self.advance())
+        self.advance()
 
         if self.current_token.type != TT_COMMA:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected ','"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         addresses =[]
 
         while self.current_token.type == TT_ADDRESS:
-            res.register(self.advance())
+            self.advance()
 
             if self.current_token.type != TT_IDENTIFIER:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected identifier"
                 ))
 
             addresses.append(self.current_token)
-            res.register(self.advance())
+            self.advance()
 
             if self.current_token.type == TT_COMMA:
-                res.register(self.advance())
+                self.advance()
             else:
                 break
 
         if self.current_token.type != TT_RPAREN:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected ')'"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         if self.current_token.type != TT_TERMINATE:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected ';'"
             ))
 
-        return res.success(InputNode(seek_tok, format_specifier, addresses, pos_start, self.current_token.pos_end))
+        return InputNode(seek_tok, format_specifier, addresses, pos_start, self.current_token.pos_end)
 
     def output_statement(self):
-        res = ParseResult()
         emit_tok = self.current_token
-        res.register(self.advance())
+        self.advance()
 
         if self.current_token.type != TT_LPAREN:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected '('"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
-        if self.current_token.type not in (TT_STRING_LITERAL, TT_IDENTIFIER ): # Missive with format specifier
-            return res.failure(InvalidSyntaxError(
+        if self.current_token.type not in (TT_STRING_LITERAL, TT_IDENTIFIER): # Missive with format specifier
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected Missive literal"
             ))
@@ -1163,316 +1278,279 @@ class Parser:
         missive_literal = self.current_token
         pos_start = self.current_token.pos_start
 
-        res.register(self.advance())
+        self.advance()
 
         identifiers_expr = []
 
         if self.current_token.type == TT_COMMA:
-            res.register(self.advance())
+            self.advance()
 
-            while self.current_token.type in (TT_IDENTIFIER, TT_INT_LITERAL, TT_FLOAT_LITERAL, TT_PLUS, TT_MINUS, TT_MUL, TT_DIV, TT_LPAREN, TT_CHAR_LITERAL, TT_STRING_LITERAL, TT_TRUE, TT_FALSE, TT_NULL):
+            while self.current_token.type in OUTPUT_OPERAND_TOKENS:
                 if self.current_token.type == TT_IDENTIFIER:
-                    var_name = self.current_token.value
-                    res.register(self.advance())
-
-                    if var_name not in self.symbol_table:
-                        return res.failure(InvalidSyntaxError(
-                            self.current_token.pos_start, self.current_token.pos_end,
-                            f"Undeclared variable '{var_name}'"
-                        ))
-
-                    if self.symbol_table[var_name] not in (TT_INT, TT_FLOAT, TT_CHAR, TT_STRING, TT_BOOL):
-                        return res.failure(InvalidSyntaxError(
-                            self.current_token.pos_start, self.current_token.pos_end,
-                            f"Invalid operand '{var_name}': Expected Numeral, Decimal, Letter, Missive, or Veracity"
-                        ))
-
                     identifiers_expr.append(AccessNode(self.current_token))
+                    self.advance()
                 else:
-                    expr = res.register(self.expr())
-                    if res.error: return res
+                    expr = self.expr()
                     identifiers_expr.append(expr)
 
                 if self.current_token.type == TT_COMMA:
-                    res.register(self.advance())
+                    self.advance()
                 else:
                     break
 
         if self.current_token.type != TT_RPAREN:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected ')'"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         if self.current_token.type != TT_TERMINATE:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected ';'"
                 ))
 
-        return res.success(OutputNode(emit_tok, missive_literal, identifiers_expr, pos_start, self.current_token.pos_end))
+        return OutputNode(emit_tok, missive_literal, identifiers_expr, pos_start, self.current_token.pos_end)
 
     def loop_statement(self):
-        res = ParseResult()
         type_tok = self.current_token
 
         if type_tok.type == TT_FOR:
-            res.register(self.advance())
+            self.advance()
 
             if self.current_token.type != TT_LPAREN:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected '('"
                 ))
 
-            res.register(self.advance())
+            self.advance()
 
             # Initialization
             init = None
             if self.current_token.type != TT_TERMINATE:
-                init = res.register(self.statement())
-                if res.error: return res
+                init = yield self.statement()
 
             # Condition
             condition = None
             if self.current_token.type != TT_TERMINATE:
-                condition = res.register(self.comp_expr())
-                if res.error: return res
+                condition = self.comp_expr()
 
                 if self.current_token.type != TT_TERMINATE:
-                    return res.failure(InvalidSyntaxError(
+                    raise ParseAbort(InvalidSyntaxError(
                         self.current_token.pos_start, self.current_token.pos_end,
                         f"Expected ';'"
                     ))
 
-            res.register(self.advance())
+            self.advance()
 
             # Update
             update = None
             if self.current_token.type != TT_RPAREN:
-                update = res.register(self.update_expr())
+                # A missing ')' is reported over an invalid update
+                try:
+                    update = self.update_expr()
+                except ParseAbort:
+                    if self.current_token.type == TT_RPAREN:
+                        raise
                 if self.current_token.type != TT_RPAREN:
-                    return res.failure(InvalidSyntaxError(
+                    raise ParseAbort(InvalidSyntaxError(
                         self.current_token.pos_start, self.current_token.pos_end,
                         "Expected ')'"
                     ))
-                if res.error: return res
 
-            res.register(self.advance())
+            self.advance()
 
             if self.current_token.type != TT_LBRACE:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected '{'"
                 ))
 
-            res.register(self.advance())
+            self.advance()
 
             statements = []
 
             while self.current_token.type != TT_RBRACE and self.current_token.type != TT_EOF:
-                stmt = res.register(self.statement())
-
-                if res.error:
-                    return res
-                statements.append(stmt)
+                stmt = yield self.block_statement()
+                if stmt is not None:
+                    statements.append(stmt)
 
                 if self.current_token.type == TT_NEWLINE:
-                    res.register(self.advance())
+                    self.advance()
 
             if self.current_token.type != TT_RBRACE:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected '}'"
                 ))
 
-            res.register(self.advance())
+            self.advance()
 
-            return res.success(PerNode(type_tok, init, condition, update, statements))
+            return PerNode(type_tok, init, condition, update, statements)
 
         elif type_tok.type == TT_WHILE:
-            res.register(self.advance())
+            self.advance()
 
             if self.current_token.type != TT_LPAREN:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected '('"
                 ))
 
-            res.register(self.advance())
+            self.advance()
 
-            expression = res.register(self.expr_statement())
+            try:
+                expression = self.expr_statement()
+            except ParseAbort:
+                expression = None
 
             if expression is None:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected valid expression'"
                 ))
 
             if self.current_token.type != TT_RPAREN:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected ')'"
                 ))
 
-            res.register(self.advance())
+            self.advance()
 
             if self.current_token.type != TT_LBRACE:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected '{'"
                 ))
 
-            res.register(self.advance())
+            self.advance()
 
             statements = []
 
             while self.current_token.type != TT_RBRACE and self.current_token.type != TT_EOF:
-                stmt = res.register(self.statement())
-
-                if res.error:
-                    return res
-                statements.append(stmt)
+                stmt = yield self.block_statement()
+                if stmt is not None:
+                    statements.append(stmt)
 
                 if self.current_token.type == TT_NEWLINE:
-                    res.register(self.advance())
+                    self.advance()
 
             if self.current_token.type != TT_RBRACE:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected '}'"
                 ))
 
-            res.register(self.advance())
+            self.advance()
 
-            return res.success(UntilNode(type_tok, expression, statements))
+            return UntilNode(type_tok, expression, statements)
 
         elif type_tok.type == TT_DO:
-            res.register(self.advance())
+            self.advance()
 
             if self.current_token.type != TT_LBRACE:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected '{'"
                 ))
 
-            res.register(self.advance())
+            self.advance()
 
             statements = []
 
             while self.current_token.type != TT_RBRACE and self.current_token.type != TT_EOF:
-                stmt = res.register(self.statement())
-
-                if res.error:
-                    return res
-                statements.append(stmt)
+                stmt = yield self.block_statement()
+                if stmt is not None:
+                    statements.append(stmt)
 
                 if self.current_token.type == TT_NEWLINE:
-                    res.register(self.advance())
+                    self.advance()
 
             if self.current_token.type != TT_RBRACE:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected '}'"
                 ))
 
-            res.register(self.advance())
+            self.advance()
 
             if self.current_token.type != TT_WHILE:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected 'Until'"
                 ))
 
             until_tok = self.current_token
 
-            res.register(self.advance())
+            self.advance()
 
             if self.current_token.type != TT_LPAREN:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected '('"
                 ))
 
-            res.register(self.advance())
-
-            expression = res.register(self.expr_statement())
+            self.advance()
 
-            if res.error:
-                return res
+            expression = self.expr_statement()
 
             if self.current_token.type != TT_RPAREN:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected ')'"
                 ))
 
-            res.register(self.advance())
+            self.advance()
 
             if self.current_token.type != TT_TERMINATE:
-                return res.failure(InvalidSyntaxError(
+                raise ParseAbort(InvalidSyntaxError(
                     self.current_token.pos_start, self.current_token.pos_end,
                     "Expected ';'"
                 ))
 
-            res.register(self.advance())
+            self.advance()
 
-        return res.success(ActNode(type_tok, statements,until_tok, expression))
+        return ActNode(type_tok, statements,until_tok, expression)
 
     def switch_statement(self):
-        res = ParseResult()
         switch_tok = self.current_token
-        res.register(self.advance())
+        self.advance()
 
         while self.current_token.type == TT_NEWLINE:
-            res.register(self.advance())
+            self.advance()
 
         if self.current_token.type != TT_LPAREN:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected '('"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
+        expression = None
         if self.current_token.type == TT_IDENTIFIER:
-            if self.current_token.value not in self.symbol_table:
-                return res.failure(InvalidSyntaxError(
-                    self.current_token.pos_start, self.current_token.pos_end,
-                    f"Undeclared variable '{self.current_token.value}'"
-                ))
-
-            var_type = self.symbol_table[self.current_token.value]
-
-            if var_type not in (TT_INT, TT_FLOAT, TT_CHAR, TT_BOOL):
-                return res.failure(InvalidSyntaxError(
-                    self.current_token.pos_start, self.current_token.pos_end,
-                    f"Invalid Shift argument: Expected Numeral, Decimal, Veracity, or Letter but got {var_type}"
-                ))
-
             expression = AccessNode(self.current_token)
-            res.register(self.advance())
-
-
-        if res.error: return res
+            self.advance()
 
         if self.current_token.type != TT_RPAREN:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected ')'"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         if self.current_token.type != TT_LBRACE:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected '{'"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         cases = []
         cases_tok =[]
@@ -1480,90 +1558,110 @@ class Parser:
         default_tok = None
 
         while self.current_token.type != TT_RBRACE and self.current_token.type != TT_EOF:
-            while self.current_token.type == TT_NEWLINE:
-                res.register(self.advance())
-            if self.current_token.type == TT_CASE:
-                case_tok = self.current_token
-                cases_tok.append(case_tok)
-                res.register(self.advance())
-
-                if self.current_token.type not in (TT_INT_LITERAL, TT_FLOAT_LITERAL, TT_CHAR_LITERAL, TT_TRUE, TT_FALSE):
-                    return res.failure(InvalidSyntaxError(
-                        self.current_token.pos_start, self.current_token.pos_end,
-                        f"Expected {var_type} literal"
-                    ))
-
-                case_expr = self.current_token
-                res.register(self.advance())
+            if self.current_token.type == TT_NEWLINE:
+                self.advance()
+                continue
 
-                if self.current_token.type != TT_COLON:
-                    return res.failure(InvalidSyntaxError(
-                        self.current_token.pos_start, self.current_token.pos_end,
-                        "Expected ':'"
-                    ))
+            try:
+                label_tok, case_expr = self.case_label()
+            except ParseAbort as abort:
+                # A broken label is skipped up to the ':' or ';' it ends
+                # at; the statements after a ':' are still checked
+                self.add_error(abort.error)
+                label_tok = None
 
-                res.register(self.advance())
+                while self.current_token.type not in CASE_LABEL_ENDS:
+                    self.advance()
 
-                statements = []
+                if self.current_token.type == TT_TERMINATE:
+                    self.advance()
+                    continue
+                if self.current_token.type != TT_COLON:
+                    continue
+                self.advance()
 
-                while self.current_token.type != TT_CASE and self.current_token.type != TT_DEFAULT and self.current_token.type != TT_RBRACE:
-                    stmt = res.register(self.statement())
-                    if res.error: return res
-                    statements.append(stmt)
+            statements = yield self.case_body()
 
-                    if self.current_token.type == TT_NEWLINE:
-                        res.register(self.advance())
+            if label_tok is None:
+                continue
+            if label_tok.type == TT_CASE:
+                cases_tok.append(label_tok)
+                cases.append((label_tok, case_expr, statements))
+            else:
+                default_tok = label_tok
+                default_case = statements
 
-                cases.append((case_tok,case_expr, statements))
+        if self.current_token.type != TT_RBRACE:
+            raise ParseAbort(InvalidSyntaxError(
+                self.current_token.pos_start, self.current_token.pos_end,
+                "Expected '}'"
+            ))
 
-            elif self.current_token.type == TT_DEFAULT:
-                default_tok = self.current_token
-                res.register(self.advance())
+        self.advance()
 
-                if self.current_token.type != TT_COLON:
-                    return res.failure(InvalidSyntaxError(
-                        self.current_token.pos_start, self.current_token.pos_end,
-                        "Expected ':'"
-                    ))
+        return ShiftNode(switch_tok, expression, cases_tok, cases, default_tok, default_case)
 
-                res.register(self.advance())
+    def case_label(self):
+        # 'Opt <literal>:' or 'Usual:', as the label token and the literal,
+        # which is None for Usual
+        label_tok = self.current_token
+        case_expr = None
 
-                statements = []
+        if label_tok.type not in (TT_CASE, TT_DEFAULT):
+            raise ParseAbort(InvalidSyntaxError(
+                label_tok.pos_start, label_tok.pos_end,
+                "Expected 'Opt' or 'Usual'"
+            ))
 
-                while self.current_token.type != TT_RBRACE:
-                    stmt = res.register(self.statement())
-                    if res.error: return res
-                    statements.append(stmt)
+        self.advance()
 
-                    if self.current_token.type == TT_NEWLINE:
-                        res.register(self.advance())
+        if label_tok.type == TT_CASE:
+            if self.current_token.type not in CASE_LITERALS:
+                raise ParseAbort(InvalidSyntaxError(
+                    self.current_token.pos_start, self.current_token.pos_end,
+                    "Expected a Numeral, Decimal, Veracity, or Letter literal"
+                ))
 
-                default_case = statements
+            case_expr = self.current_token
+            self.advance()
 
-        if self.current_token.type != TT_RBRACE:
-            return res.failure(InvalidSyntaxError(
+        if self.current_token.type != TT_COLON:
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
-                "Expected '}'"
+                "Expected ':'"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
-        return res.success(ShiftNode(switch_tok, expression, case_tok, cases, default_tok, default_case))
+        return label_tok, case_expr
+
+    def case_body(self):
+        # The statements after a label, up to the next label or the '}'
+        statements = []
+
+        while self.current_token.type not in CASE_BODY_ENDS:
+            stmt = yield self.block_statement()
+            if stmt is not None:
+                statements.append(stmt)
+
+            if self.current_token.type == TT_NEWLINE:
+                self.advance()
+
+        return statements
 
     def jump_statement(self):
-        res = ParseResult()
         jump_tok = self.current_token
-        res.register(self.advance())
+        self.advance()
 
         if self.current_token.type != TT_TERMINATE:
-            return res.failure(InvalidSyntaxError(
+            raise ParseAbort(InvalidSyntaxError(
                 self.current_token.pos_start, self.current_token.pos_end,
                 "Expected ';'"
             ))
 
-        res.register(self.advance())
+        self.advance()
 
         if jump_tok.type == TT_BREAK:
-            return res.success(HaltNode(jump_tok))
+            return HaltNode(jump_tok)
         elif jump_tok.type == TT_CONTINUE:
-            return res.success(ExtendNode(jump_tok))
+            return ExtendNode(jump_tok)
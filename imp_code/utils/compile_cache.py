@@ -0,0 +1,190 @@
+import hashlib
+import operator
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+from .node_arena import NodeArena
+from .position import SourceFile
+from .token_buffer import TokenBuffer
+from .tokens import TOKEN_TYPES
+
+
+#######################################
+# COMPILE CACHE
+#######################################
+
+CACHE_DIR = '.ic_cache'
+CACHE_MAGIC = b'ICAC'
+CACHE_FORMAT = 2
+
+# Magic, format, byte order, then the token, value, comment and row counts
+HEADER = struct.Struct('<4sBB4I')
+# A CRC-32 of everything before it, so a damaged file reads as a miss
+TRAILER = struct.Struct('<I')
+BYTE_ORDERS = {'little': 0, 'big': 1}
+
+_compiler_version = None
+
+
+def compiler_version():
+    """A hash of the compiler's own source, so any change to the lexer,
+    parser or nodes makes every cached program stale.
+    """
+    global _compiler_version
+    if _compiler_version is None:
+        package = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        digest = hashlib.sha256()
+        for root, dirs, files in os.walk(package):
+            dirs[:] = sorted(folder for folder in dirs if folder != '__pycache__')
+            for name in sorted(files):
+                if name.endswith('.py'):
+                    digest.update(os.path.relpath(os.path.join(root, name), package).encode())
+                    with open(os.path.join(root, name), 'rb') as file:
+                        digest.update(file.read())
+        _compiler_version = digest.hexdigest()
+    return _compiler_version
+
+
+def cache_key(text):
+    digest = hashlib.sha256(f'{compiler_version()}:{CACHE_FORMAT}:'.encode())
+    digest.update(text.encode('utf-8', 'surrogatepass'))
+    return digest.hexdigest()
+
+
+def cache_path(fn, text):
+    # Next to the source file; names that are not files go in the working
+    # directory
+    folder = os.path.dirname(os.path.abspath(fn)) if os.path.isfile(fn) else os.getcwd()
+    return os.path.join(folder, CACHE_DIR, cache_key(text))
+
+
+def dump_program(tokens, arena):
+    """Packs a TokenBuffer and the NodeArena over it into bytes: a header,
+    the token columns, the interned values as lengths and one UTF-8 blob,
+    the comment spans and the arena columns, then a checksum. Columns are
+    written in this machine's byte order, which the header records.
+    """
+    if tokens.shift:
+        tokens = tokens[:]
+        tokens.settle()
+
+    values = [value.encode('utf-8', 'surrogatepass') for value in tokens.values]
+    comments = array('I', [offset for comment in tokens.comments for offset in comment])
+    header = HEADER.pack(CACHE_MAGIC, CACHE_FORMAT, BYTE_ORDERS[sys.byteorder],
+                         len(tokens), len(values), len(tokens.comments), len(arena))
+
+    data = b''.join([
+        header,
+        tokens.types.tobytes(), tokens.starts.tobytes(), tokens.ends.tobytes(), tokens.value_ids.tobytes(),
+        array('I', map(len, values)).tobytes(), *values,
+        comments.tobytes(),
+        arena.kinds.tobytes(), arena.first_children.tobytes(), arena.next_siblings.tobytes(), arena.token_ids.tobytes(),
+    ])
+    return data + TRAILER.pack(zlib.crc32(data))
+
+
+def tokens_in_range(tokens):
+    # Whether every token has a known type, a value in the table and a
+    # span inside the source
+    if not len(tokens):
+        return True
+    return (
+        max(tokens.types) < len(TOKEN_TYPES)
+        and -1 <= min(tokens.value_ids) and max(tokens.value_ids) < len(tokens.values)
+        and max(tokens.ends) <= len(tokens.source.text)
+        and all(map(operator.le, tokens.starts, tokens.ends))
+    )
+
+
+def load_program(data, fn, text):
+    """Reads back what dump_program wrote for `text` as a TokenBuffer and
+    the node tree. Returns None for data in another format or byte order,
+    cut short or damaged, or whose columns do not make a tree over the
+    tokens.
+    """
+    if len(data) < HEADER.size + TRAILER.size:
+        return None
+    magic, version, byte_order, n_tokens, n_values, n_comments, n_rows = HEADER.unpack_from(data)
+    if magic != CACHE_MAGIC or version != CACHE_FORMAT or byte_order != BYTE_ORDERS[sys.byteorder]:
+        return None
+
+    checksum, = TRAILER.unpack_from(data, len(data) - TRAILER.size)
+    data = data[:-TRAILER.size]
+    if zlib.crc32(data) != checksum:
+        return None
+
+    offset = HEADER.size
+
+    def chunk(size):
+        nonlocal offset
+        if offset + size > len(data):
+            raise EOFError
+        offset += size
+        return data[offset - size:offset]
+
+    def column(typecode, count):
+        items = array(typecode)
+        items.frombytes(chunk(items.itemsize * count))
+        return items
+
+    tokens = TokenBuffer(SourceFile(fn, text))
+    arena = NodeArena(tokens)
+
+    try:
+        tokens.types = column('B', n_tokens)
+        tokens.starts = column('I', n_tokens)
+        tokens.ends = column('I', n_tokens)
+        tokens.value_ids = column('i', n_tokens)
+
+        for length in column('I', n_values):
+            tokens.intern(chunk(length).decode('utf-8', 'surrogatepass'))
+
+        comments = column('I', 2 * n_comments)
+        tokens.comments = list(zip(comments[::2], comments[1::2]))
+
+        arena.kinds = column('B', n_rows)
+        arena.first_children = column('i', n_rows)
+        arena.next_siblings = column('i', n_rows)
+        arena.token_ids = column('i', n_rows)
+    except (EOFError, UnicodeDecodeError):
+        return None
+
+    if offset != len(data) or not tokens_in_range(tokens) or not arena.is_well_formed():
+        return None
+
+    try:
+        return tokens, arena.to_node()
+    except (TypeError, AttributeError):
+        # Rows that make a tree but hold the wrong kind of value for a
+        # field, such as a list where a derived field reads a token
+        return None
+
+
+def load(fn, text):
+    """Returns the (tokens, node) cached for this text of fn, or None."""
+    try:
+        with open(cache_path(fn, text), 'rb') as file:
+            return load_program(file.read(), fn, text)
+    except (OSError, ValueError, LookupError, TypeError, AttributeError, struct.error):
+        return None
+
+
+def store(fn, text, tokens, node):
+    """Caches an error-free parse of text. Written to a temporary file and
+    renamed, so a concurrent run never reads half of it. A cache that
+    cannot be written is skipped.
+    """
+    path = cache_path(fn, text)
+    data = dump_program(tokens, NodeArena.from_node(node, tokens))
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(data)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
@@ -0,0 +1,52 @@
+import mmap
+import os
+
+#######################################
+# MAPPED FILE
+#######################################
+
+class MappedFile:
+    """A read-only text stream over a memory-mapped file, for
+    Lexer.iter_tokens. Only the window being read is decoded, so a large
+    file is never held as one string.
+
+    Newlines are translated the way open() does in text mode.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        if os.fstat(self.file.fileno()).st_size:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                self.map.madvise(mmap.MADV_SEQUENTIAL)
+        else:
+            self.map = b''
+        self.pos = 0
+
+    def read(self, size=-1):
+        length = len(self.map)
+        end = length if size is None or size < 0 else min(length, self.pos + size)
+
+        # Never end inside a UTF-8 sequence or between \r and \n
+        while self.pos < end < length and (self.map[end] & 0xC0 == 0x80 or self.map[end - 1] == 0x0D):
+            end += 1
+
+        chunk = self.map[self.pos:end]
+        self.pos = end
+
+        # ASCII is the common case and decodes with a plain copy
+        text = chunk.decode('ascii') if chunk.isascii() else chunk.decode('utf-8')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+
+    def close(self):
+        if isinstance(self.map, mmap.mmap):
+            self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
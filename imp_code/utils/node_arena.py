@@ -0,0 +1,292 @@
+from array import array
+
+from . import nodes
+from .nodes import Node
+from .tokens import Tokens
+
+
+#######################################
+# NODE ARENA
+#######################################
+
+# Rows that are not nodes: the values node fields hold
+NONE_KIND = 0
+BOOL_KIND = 1
+TOKEN_KIND = 2
+LIST_KIND = 3
+TUPLE_KIND = 4
+POS_START_KIND = 5
+POS_END_KIND = 6
+
+NODE_CLASSES = [cls for cls in vars(nodes).values() if isinstance(cls, type) and issubclass(cls, Node)]
+KIND_NAMES = ['None', 'Bool', 'Token', 'List', 'Tuple', 'PosStart', 'PosEnd'] + [cls.__name__ for cls in NODE_CLASSES]
+NODE_KINDS = {cls: kind for kind, cls in enumerate(NODE_CLASSES, POS_END_KIND + 1)}
+
+# Spans are stored as the offset of their Position; an end is read back
+# with end_position, which keeps it on the line of the last character
+POSITION_FIELDS = {'pos_start': POS_START_KIND, 'pos_end': POS_END_KIND}
+
+# Fields worked out from another one are not stored
+DERIVED_FIELDS = {'id': 'id_tok', 'value': 'token', 'body_errors': None}
+
+
+def node_fields(cls):
+    fields = []
+    for base in reversed(cls.__mro__):
+        fields += [field for field in base.__dict__.get('__slots__', ()) if field not in DERIVED_FIELDS]
+    return tuple(fields)
+
+NODE_FIELDS = {NODE_KINDS[cls]: node_fields(cls) for cls in NODE_CLASSES}
+FIELD_INDEX = {kind: {field: idx for idx, field in enumerate(fields)} for kind, fields in NODE_FIELDS.items()}
+
+
+class NodeArena:
+    """An AST kept as rows of parallel array columns instead of one object
+    per node: kind, the row of the first child, the row of the next sibling
+    and a token column. Rows are in preorder, so a pass that does not care
+    about nesting can walk them in order.
+
+    A node's fields are its children, in the order of its __slots__. Values
+    that are not nodes get rows too: tokens hold their index in the
+    TokenBuffer, booleans 0 or 1, and stored positions their offset in the
+    source. NodeView reads a row back through the node class's own
+    properties and __repr__.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.kinds = array('B')
+        self.first_children = array('i')
+        self.next_siblings = array('i')
+        self.token_ids = array('i')
+
+    @classmethod
+    def from_node(cls, root, tokens):
+        """Flattens the tree under root, whose tokens must come from the
+        TokenBuffer `tokens`. Function bodies a lazy parse skipped are
+        parsed one at a time and not kept on their nodes, so the tree never
+        has to be held whole.
+        """
+        arena = cls(tokens)
+        # The last child added under each row so far, -1 for none
+        last_children = array('i')
+        # (value, parent row, field), children pushed last to first
+        stack = [(root, -1, None)]
+
+        while stack:
+            value, parent, field = stack.pop()
+            row, children = arena.add(value, field)
+            last_children.append(-1)
+
+            if parent >= 0:
+                previous = last_children[parent]
+                if previous < 0:
+                    arena.first_children[parent] = row
+                else:
+                    arena.next_siblings[previous] = row
+                last_children[parent] = row
+
+            stack.extend((child, row, child_field) for child_field, child in reversed(children))
+
+        return arena
+
+    def add(self, value, field=None):
+        # Appends the row for value, the value of a node's field if given,
+        # and returns it with the (field, value) pairs of its children
+        children = ()
+
+        if field in POSITION_FIELDS and value is not None:
+            kind, token_id = POSITION_FIELDS[field], value.idx
+        elif value is None:
+            kind, token_id = NONE_KIND, -1
+        elif isinstance(value, bool):
+            kind, token_id = BOOL_KIND, int(value)
+        elif isinstance(value, Tokens):
+            kind, token_id = TOKEN_KIND, self.token_index(value)
+        elif isinstance(value, list):
+            kind, token_id, children = LIST_KIND, -1, [(None, item) for item in value]
+        elif isinstance(value, tuple):
+            kind, token_id, children = TUPLE_KIND, -1, [(None, item) for item in value]
+        elif isinstance(value, Node):
+            kind, token_id = NODE_KINDS[type(value)], -1
+            children = [(node_field, self.field_value(value, node_field)) for node_field in NODE_FIELDS[kind]]
+        else:
+            raise TypeError(f"Cannot store a {type(value).__name__} in a node arena")
+
+        self.kinds.append(kind)
+        self.first_children.append(-1)
+        self.next_siblings.append(-1)
+        self.token_ids.append(token_id)
+        return len(self.kinds) - 1, children
+
+    def field_value(self, node, field):
+        # Reading body would keep the parsed statements on the node
+        if field == '_body' and callable(node._body):
+            return node._body()[0]
+        return getattr(node, field)
+
+    def token_index(self, token):
+        idx = self.tokens.index_at(token.start) if token.start is not None else len(self.tokens)
+        if idx >= len(self.tokens) or self.tokens.type_at(idx) != token.type:
+            raise ValueError(f"Token {token!r} is not in the arena's token buffer")
+        return idx
+
+    def to_node(self):
+        """Builds the object tree back from the rows. A child's row always
+        comes after its parent's, so going from the last row to the first
+        finds every child already built.
+        """
+        values = [None] * len(self)
+
+        for row in range(len(self) - 1, -1, -1):
+            kind = self.kinds[row]
+
+            if kind == LIST_KIND:
+                values[row] = [values[child] for child in self.children(row)]
+            elif kind == TUPLE_KIND:
+                values[row] = tuple(values[child] for child in self.children(row))
+            elif kind in NODE_FIELDS:
+                node_class = NODE_CLASSES[kind - POS_END_KIND - 1]
+                node = values[row] = node_class.__new__(node_class)
+                for field, child in zip(NODE_FIELDS[kind], self.children(row)):
+                    setattr(node, field, values[child])
+                for field, source_field in DERIVED_FIELDS.items():
+                    if field in node_class.__slots__:
+                        setattr(node, field, getattr(node, source_field).value if source_field else None)
+            else:
+                values[row] = self.value(row)
+
+        return values[0] if values else None
+
+    def is_well_formed(self):
+        """Whether the rows are a tree to_node can build: every kind is
+        known, every row but the first hangs under exactly one parent that
+        comes before it, a node row has a child for each of its fields, and
+        token and position rows point inside the buffer and the source.
+        Columns read from outside (a cache file) are checked with this
+        before they are trusted.
+        """
+        n_rows = len(self)
+        n_tokens = len(self.tokens)
+        text_size = len(self.tokens.source.text)
+        if not len(self.first_children) == len(self.next_siblings) == len(self.token_ids) == n_rows:
+            return False
+
+        has_parent = bytearray(n_rows)
+
+        for row, kind in enumerate(self.kinds):
+            n_children = 0
+            child = self.first_children[row]
+            while child >= 0:
+                if child <= row or child >= n_rows or has_parent[child]:
+                    return False
+                has_parent[child] = 1
+                n_children += 1
+                child = self.next_siblings[child]
+
+            if kind in NODE_FIELDS:
+                if n_children != len(NODE_FIELDS[kind]):
+                    return False
+            elif kind > POS_END_KIND or (n_children and kind not in (LIST_KIND, TUPLE_KIND)):
+                return False
+            elif kind == TOKEN_KIND and not 0 <= self.token_ids[row] < n_tokens:
+                return False
+            elif kind in (POS_START_KIND, POS_END_KIND) and not 0 <= self.token_ids[row] <= text_size:
+                return False
+
+        return has_parent.count(0) == min(n_rows, 1)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def children(self, row):
+        child = self.first_children[row]
+        while child >= 0:
+            yield child
+            child = self.next_siblings[child]
+
+    def view(self, row):
+        return NodeView(self, row)
+
+    def find(self, node_class):
+        # Every node of a class, in source order, from one scan of the kinds
+        kind = NODE_KINDS[node_class]
+        for row, row_kind in enumerate(self.kinds):
+            if row_kind == kind:
+                yield NodeView(self, row)
+
+    @property
+    def root(self):
+        return self.value(0) if len(self) else None
+
+    def value(self, row):
+        """Reads back the value a row stands for: a NodeView for a node and
+        the token, list, tuple, position or plain value for the rest.
+        """
+        kind = self.kinds[row]
+
+        if kind == NONE_KIND:
+            return None
+        if kind == BOOL_KIND:
+            return bool(self.token_ids[row])
+        if kind == TOKEN_KIND:
+            return self.tokens[self.token_ids[row]]
+        if kind == LIST_KIND:
+            return [self.value(child) for child in self.children(row)]
+        if kind == TUPLE_KIND:
+            return tuple(self.value(child) for child in self.children(row))
+        if kind == POS_START_KIND:
+            return self.tokens.source.position(self.token_ids[row])
+        if kind == POS_END_KIND:
+            return self.tokens.source.end_position(self.token_ids[row])
+        return NodeView(self, row)
+
+
+class NodeView:
+    """A node row of a NodeArena. Fields are read from the row's children,
+    and everything else (pos_start, pos_end, __repr__) goes through the node
+    class the row was flattened from, so a view reads like that node.
+    """
+    __slots__ = ('arena', 'row')
+
+    def __init__(self, arena, row):
+        self.arena = arena
+        self.row = row
+
+    @property
+    def kind(self):
+        return KIND_NAMES[self.arena.kinds[self.row]]
+
+    @property
+    def node_class(self):
+        return NODE_CLASSES[self.arena.kinds[self.row] - POS_END_KIND - 1]
+
+    def field(self, name):
+        idx = FIELD_INDEX[self.arena.kinds[self.row]][name]
+        for child_idx, child in enumerate(self.arena.children(self.row)):
+            if child_idx == idx:
+                return self.arena.value(child)
+
+    def __getattr__(self, name):
+        if name in FIELD_INDEX[self.arena.kinds[self.row]]:
+            return self.field(name)
+
+        if name in DERIVED_FIELDS:
+            source_field = DERIVED_FIELDS[name]
+            return getattr(self, source_field).value if source_field else None
+
+        attr = getattr(self.node_class, name)
+        if isinstance(attr, property):
+            return attr.fget(self)
+        if callable(attr):
+            return attr.__get__(self)
+        return attr
+
+    def __eq__(self, other):
+        return isinstance(other, NodeView) and other.arena is self.arena and other.row == self.row
+
+    def __hash__(self):
+        return hash((id(self.arena), self.row))
+
+    def __repr__(self):
+        return self.node_class.__repr__(self)
@@ -2,147 +2,242 @@
 # NODES
 #######################################
 
+class Node:
+    """Base of every node. Fields live in __slots__, so a node carries no
+    instance dict.
+
+    Every node answers pos_start and pos_end: nodes the parser gives a span
+    to store it, nodes over a token take it from that token, and the rest
+    report None.
+    """
+    __slots__ = ()
+
+    pos_start = None
+    pos_end = None
+
+    def __repr__(self):
+        return render(self)
+
+    def repr_parts(self):
+        # The text and values this node's repr is made of, in order
+        return ()
+
+def render(value):
+    """The repr of a node, written off a stack so deep nesting does not
+    recurse. A node is written as its repr_parts(), and a list or tuple as
+    Python writes one; anything else is written by its repr inside a list
+    or tuple and by str elsewhere, as an f-string of the parts would.
+    """
+    out = []
+    stack = [(value, False)]
+
+    while stack:
+        value, in_container = stack.pop()
+
+        if isinstance(value, str) and not in_container:
+            out.append(value)
+            continue
+
+        repr_parts = getattr(value, 'repr_parts', None)
+        if repr_parts is not None:
+            stack += [(part, False) for part in reversed(repr_parts())]
+        elif isinstance(value, (list, tuple)):
+            opening, closing = ('[', ']') if isinstance(value, list) else ('(', ',)' if len(value) == 1 else ')')
+            items = [(closing, False)]
+            for idx in range(len(value) - 1, -1, -1):
+                items.append((value[idx], True))
+                if idx:
+                    items.append((', ', False))
+            items.append((opening, False))
+            stack += items
+        else:
+            out.append(repr(value) if in_container else str(value))
+
+    return ''.join(out)
+
+class TokenNode(Node):
+    # A node for one token, spanning just that token
+    __slots__ = ('tok',)
+
+    def __init__(self, tok):
+        self.tok = tok
+
+    @property
+    def pos_start(self):
+        return self.tok.pos_start
+
+    @property
+    def pos_end(self):
+        return self.tok.pos_end
+
+    def repr_parts(self):
+        return self.tok,
+
 # Program Node
-class ProgramNode:
+class ProgramNode(Node):
+    __slots__ = ('global_statements', 'embark_node', 'pos_start', 'pos_end')
+
     def __init__(self, global_statements, embark_node, pos_start=None, pos_end=None):
         self.global_statements = global_statements if global_statements else []
         self.embark_node = embark_node
         self.pos_start = pos_start
         self.pos_end = pos_end
 
-    def __repr__(self):
-        return f"({self.global_statements},{self.embark_node})"
+    def repr_parts(self):
+        return '(', self.global_statements, ',', self.embark_node, ')'
+
+class EmbarkNode(Node):
+    __slots__ = ('embark_tok', 'statements', 'pos_start', 'pos_end')
 
-class EmbarkNode:
     def __init__(self, embark_tok, statements, pos_start=None, pos_end=None):
         self.embark_tok = embark_tok
         self.statements = statements
         self.pos_start = pos_start
         self.pos_end = pos_end
 
-    def __repr__(self):
-        return f'({self.embark_tok}, {self.statements})'
+    def repr_parts(self):
+        return '(', self.embark_tok, ', ', self.statements, ')'
 
 # Expression nodes
-class NumeralNode:
-    def __init__(self, tok, pos_start=None, pos_end=None):
-        self.tok = tok
-        self.pos_start = tok.pos_start
-        self.pos_end = tok.pos_end
+class NumeralNode(TokenNode):
+    __slots__ = ()
 
-    def __repr__(self):
-        return f'{self.tok}'
+class DecimalNode(TokenNode):
+    __slots__ = ()
 
-class DecimalNode:
-    def __init__(self, tok):
-        self.tok = tok
-        self.pos_start = tok.pos_start
-        self.pos_end = tok.pos_end
+class VeracityNode(TokenNode):
+    __slots__ = ()
 
-    def __repr__(self):
-        return f'{self.tok}'
+class BinOpNode(Node):
+    __slots__ = ('left_node', 'op_tok', 'right_node')
 
-class VeracityNode:
-    def __init__(self, tok):
-        self.tok = tok
-        self.pos_start = tok.pos_start
-        self.pos_end = tok.pos_end
-
-    def __repr__(self):
-        return f'{self.tok}'
-
-class BinOpNode:
-    def __init__(self, left_node, op_tok, right_node, pos_start=None, pos_end=None):
+    def __init__(self, left_node, op_tok, right_node):
         self.left_node = left_node
         self.op_tok = op_tok
         self.right_node = right_node
-        self.pos_start = pos_start
-        self.pos_end = pos_end
 
-    def __repr__(self):
-        return f'({self.left_node}, {self.op_tok}, {self.right_node})'
+    @property
+    def pos_start(self):
+        return expression_edge(self).pos_start
+
+    @property
+    def pos_end(self):
+        return expression_edge(self, last=True).pos_end
+
+    def repr_parts(self):
+        return '(', self.left_node, ', ', self.op_tok, ', ', self.right_node, ')'
+
+class UnaryOpNode(Node):
+    __slots__ = ('op_tok', 'node', 'is_post')
 
-class UnaryOpNode:
     def __init__(self, op_tok, node, is_post=False):
         self.op_tok = op_tok
         self.node = node
         self.is_post = is_post
 
-    def __repr__(self):
+    @property
+    def pos_start(self):
+        return expression_edge(self).pos_start
+
+    @property
+    def pos_end(self):
+        return expression_edge(self, last=True).pos_end
+
+    def repr_parts(self):
         if self.is_post:
-            return f'({self.node}, {self.op_tok})'
+            return '(', self.node, ', ', self.op_tok, ')'
         else:
-            return f'({self.op_tok}, {self.node})'
+            return '(', self.op_tok, ', ', self.node, ')'
+
+def expression_edge(node, last=False):
+    """The first token or operand of an expression, or its last. Walks
+    down the operators instead of asking each for its position, so a long
+    chain does not recurse.
+    """
+    while True:
+        if isinstance(node, BinOpNode):
+            node = node.right_node if last else node.left_node
+        elif isinstance(node, UnaryOpNode):
+            if node.is_post == last:
+                return node.op_tok
+            node = node.node
+        else:
+            return node
+
+class LiteralNode(Node):
+    __slots__ = ('token', 'value')
 
-class LiteralNode:
     def __init__(self, token):
         self.token = token
         self.value = token.value
-        self.pos_start = token.pos_start
-        self.pos_end = token.pos_end
 
-    def __repr__(self):
-        return f"{self.value}"
+    @property
+    def pos_start(self):
+        return self.token.pos_start
+
+    @property
+    def pos_end(self):
+        return self.token.pos_end
+
+    def repr_parts(self):
+        return self.value,
+
+class ReturnNode(Node):
+    __slots__ = ('return_tok', 'node')
 
-class ReturnNode:
     def __init__(self, return_tok, node):
         self.return_tok = return_tok
         self.node = node
 
-    def __repr__(self):
-        return f'({self.return_tok}, {self.node})'
+    def repr_parts(self):
+        return '(', self.return_tok, ', ', self.node, ')'
 
 # Declaration, Assignment, & Access (Local and Global)
-class AccessNode:
-    def __init__(self, id_tok, pos_start=None, pos_end=None):
+class AccessNode(Node):
+    __slots__ = ('id_tok', 'id')
+
+    def __init__(self, id_tok):
         self.id_tok = id_tok
         self.id = id_tok.value
-        self.pos_start = pos_start
-        self.pos_end = pos_end
 
-    def __repr__(self):
-        return f'{self.id_tok}'
+    @property
+    def pos_start(self):
+        return self.id_tok.pos_start
+
+    @property
+    def pos_end(self):
+        return self.id_tok.pos_end
+
+    def repr_parts(self):
+        return self.id_tok,
+
+class AssignNode(Node):
+    __slots__ = ('var_name_tok', 'assign_op', 'expr')
 
-class AssignNode:
     def __init__(self, var_name_tok, assign_op, expr):
         self.var_name_tok = var_name_tok
         self.assign_op = assign_op
         self.expr = expr
 
-    def __repr__(self):
-        return f'({self.var_name_tok.type}: {self.var_name_tok.value}, {self.assign_op.type}: {self.assign_op.value}, {self.expr})'
+    def repr_parts(self):
+        return '(', self.var_name_tok.type, ': ', self.var_name_tok.value, ', ', self.assign_op.type, ': ', self.assign_op.value, ', ', self.expr, ')'
+
+class CompoundAssignNode(Node):
+    __slots__ = ('var_name_tok', 'op_tok', 'id_value')
 
-class CompoundAssignNode:
     def __init__(self, var_name_tok, op_tok, id_value):
         self.var_name_tok = var_name_tok
         self.op_tok = op_tok
         self.id_value = id_value
 
-    def __repr__(self):
-        return f'({self.var_name_tok.type}: {self.var_name_tok.value}, {self.op_tok.type}: {self.op_tok.value}, {self.id_value})'
-
-class DeclareNode:
-    def __init__(self, var_type_tok, identifiers, pos_start=None, pos_end=None, is_constant=False, constant_tok=None, array_size=None, is_array=False):
-        self.constant_tok = constant_tok
-        self.var_type_tok = var_type_tok
-        self.identifiers = identifiers
-        self.pos_start = pos_start
-        self.pos_end = pos_end
-        self.is_constant = is_constant
-        self.array_size = array_size
-        self.is_array = is_array
+    def repr_parts(self):
+        return '(', self.var_name_tok.type, ': ', self.var_name_tok.value, ', ', self.op_tok.type, ': ', self.op_tok.value, ', ', self.id_value, ')'
 
-    def __repr__(self):
-        id_list = ", ".join(
-            f"({id_tok}, {val})" if val is not None else f"{id_tok}"
-            for id_tok, val, is_array, array_size in self.identifiers
-        )
-        if self.is_constant:
-            return f"({self.constant_tok}, {self.var_type_tok.value}, {id_list})"
-        else:
-            return f"({self.var_type_tok.value}, {id_list})"
+class DeclareNode(Node):
+    # identifiers holds an (id_tok, value, is_array, array_size) tuple for
+    # each name declared
+    __slots__ = ('constant_tok', 'var_type_tok', 'identifiers', 'pos_start', 'pos_end', 'is_constant', 'array_size', 'is_array')
 
-class GlobalDeclareNode:
     def __init__(self, var_type_tok, identifiers, pos_start=None, pos_end=None, is_constant=False, constant_tok=None, array_size=None, is_array=False):
         self.constant_tok = constant_tok
         self.var_type_tok = var_type_tok
@@ -153,18 +248,21 @@ class GlobalDeclareNode:
         self.array_size = array_size
         self.is_array = is_array
 
-    def __repr__(self):
-        id_list = ", ".join(
-            f"({id_tok}, {val})" if val is not None else f"{id_tok}"
-            for id_tok, val, is_array, array_size in self.identifiers
-        )
-        if self.is_constant:
-            return f"({self.constant_tok}, {self.var_type_tok.value}, {id_list})"
-        else:
-            return f"({self.var_type_tok.value}, {id_list})"
+    def repr_parts(self):
+        parts = ['(', self.constant_tok, ', '] if self.is_constant else ['(']
+        parts.append(self.var_type_tok.value)
+        for id_tok, val, is_array, array_size in self.identifiers:
+            parts += [', ', '(', id_tok, ', ', val, ')'] if val is not None else [', ', id_tok]
+        parts.append(')')
+        return parts
+
+class GlobalDeclareNode(DeclareNode):
+    __slots__ = ()
 
 # Input and Output
-class InputNode: # Scan statement
+class InputNode(Node): # Scan statement
+    __slots__ = ('type_tok', 'format_specifier', 'variables', 'pos_start', 'pos_end')
+
     def __init__(self, type_tok, format_specifier, variables, pos_start=None, pos_end=None):
         self.type_tok = type_tok
         self.format_specifier = format_specifier
@@ -172,10 +270,12 @@ class InputNode: # Scan statement
         self.pos_start = pos_start
         self.pos_end = pos_end
 
-    def __repr__(self):
-        return f"{self.type_tok}, {self.format_specifier}, {self.variables}"
+    def repr_parts(self):
+        return self.type_tok, ', ', self.format_specifier, ', ', self.variables
+
+class OutputNode(Node): # Print statement
+    __slots__ = ('type_tok', 'missive_lit', 'id_exp', 'pos_start', 'pos_end')
 
-class OutputNode: # Print statement
     def __init__(self, type_tok, missive_lit, id_exp, pos_start=None, pos_end=None):
         self.type_tok = type_tok
         self.missive_lit = missive_lit
@@ -184,33 +284,60 @@ class OutputNode: # Print statement
         self.pos_end = pos_end
 
 
-    def __repr__(self):
-        return f'({self.type_tok}: {self.missive_lit}, {self.id_exp})'
+    def repr_parts(self):
+        return '(', self.type_tok, ': ', self.missive_lit, ', ', self.id_exp, ')'
 
 # Function Declaration, Call, & Definition
-class FuncDefNode:
+class FuncDefNode(Node):
+    __slots__ = ('id_tok', 'id', 'args', 'return_type', '_body', 'body_errors', 'pos_start', 'pos_end')
+
     def __init__(self, id_tok, args, return_type, body, pos_start=None, pos_end=None):
         self.id_tok = id_tok
         self.id = id_tok.value
         self.args = args
         self.return_type = return_type
-        self.body = body
+        self._body = body
+        self.body_errors = None
         self.pos_start = pos_start
         self.pos_end = pos_end
 
-    def __repr__(self):
-        return f'({self.id_tok}, {self.args}, {self.return_type}, {self.body})'
+    @property
+    def body(self):
+        # A lazy parse leaves a callable that parses the body when it is
+        # read and returns its statements and syntax errors
+        if callable(self._body):
+            self._body, self.body_errors = self._body()
+        return self._body
+
+    @body.setter
+    def body(self, body):
+        self._body = body
+
+    def repr_parts(self):
+        return '(', self.id_tok, ', ', self.args, ', ', self.return_type, ', ', self._body, ')'
+
+class FuncCallNode(Node):
+    __slots__ = ('id_tok', 'id', 'args')
 
-class FuncCallNode:
     def __init__(self, id_tok, args):
         self.id_tok = id_tok
         self.id = id_tok.value
         self.args = args
 
-    def __repr__(self):
-        return f'({self.id_tok}, {self.args})'
+    @property
+    def pos_start(self):
+        return self.id_tok.pos_start
+
+    @property
+    def pos_end(self):
+        return self.id_tok.pos_end
+
+    def repr_parts(self):
+        return '(', self.id_tok, ', ', self.args, ')'
+
+class FuncDecNode(Node):
+    __slots__ = ('id_tok', 'id', 'args', 'return_type', 'pos_start', 'pos_end')
 
-class FuncDecNode:
     def __init__(self, id_tok, args, return_type, pos_start=None, pos_end=None):
         self.id_tok = id_tok
         self.id = id_tok.value
@@ -219,25 +346,30 @@ class FuncDecNode:
         self.pos_start = pos_start
         self.pos_end = pos_end
 
-    def __repr__(self):
-        return f'({self.id_tok}, {self.args}, {self.return_type})'
+    def repr_parts(self):
+        return '(', self.id_tok, ', ', self.args, ', ', self.return_type, ')'
 
 # Condition Statements
-class ThouNode: # If statement
+class ThouNode(Node): # If statement
+    __slots__ = ('type_tok', 'condition', 'statements', 'else_stmt')
+
     def __init__(self, type_tok, condition, statements, else_stmt=None):
         self.type_tok = type_tok
         self.condition = condition
         self.statements = statements
         self.else_stmt = else_stmt
 
-    def __repr__(self):
+    def repr_parts(self):
         if self.condition:
-            return f'({self.type_tok}: {self.condition}, {self.statements})' + (f' {self.else_stmt}' if self.else_stmt else '')
+            parts = ('(', self.type_tok, ': ', self.condition, ', ', self.statements, ')')
+            return parts + (' ', self.else_stmt) if self.else_stmt else parts
         else:
-            return f'({self.type_tok}: {self.statements})'
+            return '(', self.type_tok, ': ', self.statements, ')'
 
 # Loop Statements
-class PerNode: # For statement
+class PerNode(Node): # For statement
+    __slots__ = ('type_tok', 'init', 'condition', 'update', 'statements')
+
     def __init__(self, type_tok, init, condition, update, statements):
         self.type_tok = type_tok
         self.init = init
@@ -245,29 +377,35 @@ class PerNode: # For statement
         self.update = update
         self.statements = statements
 
-    def __repr__(self):
-        return f'({self.type_tok}, {self.init}, {self.condition}, {self.update}, {self.statements})'
+    def repr_parts(self):
+        return '(', self.type_tok, ', ', self.init, ', ', self.condition, ', ', self.update, ', ', self.statements, ')'
+
+class UntilNode(Node): # While statement
+    __slots__ = ('type_tok', 'condition', 'statements')
 
-class UntilNode: # While statement
     def __init__(self, type_tok, condition, statements):
         self.type_tok = type_tok
         self.condition = condition
         self.statements = statements
 
-    def __repr__(self):
-        return f'({self.type_tok}, {self.condition}, {self.statements})'
+    def repr_parts(self):
+        return '(', self.type_tok, ', ', self.condition, ', ', self.statements, ')'
+
+class ActNode(Node): # Do-While statement
+    __slots__ = ('type_tok', 'statements', 'until_tok', 'condition')
 
-class ActNode: # Do-While statement
     def __init__(self, type_tok, statements, until_tok, condition):
         self.type_tok = type_tok
         self.statements = statements
         self.until_tok = until_tok
         self.condition = condition
 
-    def __repr__(self):
-        return f'({self.type_tok}, {self.statements}, {self.until_tok}: {self.condition})'
+    def repr_parts(self):
+        return '(', self.type_tok, ', ', self.statements, ', ', self.until_tok, ': ', self.condition, ')'
+
+class ShiftNode(Node): # Switch statement
+    __slots__ = ('type_tok', 'condition', 'cases_tok', 'cases', 'default_tok', 'default_case')
 
-class ShiftNode: # Switch statement
     def __init__(self, type_tok, condition, cases_tok, cases, default_tok, default_case):
         self.type_tok = type_tok
         self.condition = condition
@@ -276,20 +414,24 @@ class ShiftNode: # Switch statement
         self.default_tok = default_tok
         self.default_case = default_case
 
-    def __repr__(self):
-        return f'({self.type_tok}, {self.condition}, {self.cases_tok}, {self.cases}, {self.default_tok}, {self.default_case})'
+    def repr_parts(self):
+        return '(', self.type_tok, ', ', self.condition, ', ', self.cases_tok, ', ', self.cases, ', ', self.default_tok, ', ', self.default_case, ')'
 
 # Loop Control Statements
-class HaltNode: # Break
+class HaltNode(Node): # Break
+    __slots__ = ('type_tok',)
+
     def __init__(self, type_tok):
         self.type_tok = type_tok
 
-    def __repr__(self):
-        return f'({self.type_tok})'
+    def repr_parts(self):
+        return '(', self.type_tok, ')'
+
+class ExtendNode(Node): # Continue
+    __slots__ = ('type_tok',)
 
-class ExtendNode: # Continue
     def __init__(self, type_tok):
         self.type_tok = type_tok
 
-    def __repr__(self):
-        return f'({self.type_tok})'
+    def repr_parts(self):
+        return '(', self.type_tok, ')'
@@ -1,17 +1,26 @@
+from bisect import bisect_right
+
 #######################################
 # POSITION 
 #######################################
 
 class Position:
-    def __init__(self, idx, ln, col, fn, ftxt):
+    # Nodes keep their spans as positions, so they carry no instance dict
+    __slots__ = ('idx', 'ln', 'col', 'fn', 'ftxt', 'offset')
+
+    def __init__(self, idx, ln, col, fn, ftxt, offset=None):
         self.idx = idx
         self.ln = ln
         self.col = col
         self.fn = fn
         self.ftxt = ftxt
+        # idx points into ftxt, which may be a window of the file; offset
+        # is the same place counted from the start of the whole file
+        self.offset = idx if offset is None else offset
 
     def advance(self, current_char=None):
         self.idx += 1
+        self.offset += 1
         self.col += 1
 
         if current_char == '\n':
@@ -21,4 +30,56 @@ class Position:
         return self
 
     def copy(self):
-        return Position(self.idx, self.ln, self.col, self.fn, self.ftxt)
+        return Position(self.idx, self.ln, self.col, self.fn, self.ftxt, self.offset)
+
+    def shift(self, offset_delta, line_delta):
+        # Moves the position after an edit earlier in the file, keeping
+        # the text it was reported against
+        return Position(self.idx, self.ln + line_delta, self.col, self.fn, self.ftxt, self.offset + offset_delta)
+
+#######################################
+# SOURCE FILE
+#######################################
+
+class SourceFile:
+    def __init__(self, fn, text, offset=0, line=0, column=0):
+        # A streamed file is lexed in windows; offset, line and column place
+        # this window's text inside the whole file
+        self.fn = fn
+        self.text = text
+        self.offset = offset
+        self.line = line
+        self.column = column
+        self._line_starts = None
+
+    @property
+    def line_starts(self):
+        # Built on the first lookup, so error-free runs never pay for it
+        if self._line_starts is None:
+            line_starts = [0]
+            idx = self.text.find('\n')
+            while idx >= 0:
+                line_starts.append(idx + 1)
+                idx = self.text.find('\n', idx + 1)
+            self._line_starts = line_starts
+        return self._line_starts
+
+    def position(self, idx):
+        ln = bisect_right(self.line_starts, idx) - 1
+        col = idx - self.line_starts[ln]
+        if ln == 0:
+            col += self.column
+        return Position(idx, ln + self.line, col, self.fn, self.text, self.offset + idx)
+
+    def end_position(self, idx):
+        # The end of a span stays on the line of its last character,
+        # the same place Position.advance() used to leave it
+        if idx <= 0:
+            return self.position(idx)
+        return self.position(idx - 1).advance()
+
+    def __getstate__(self):
+        # Line starts are cheap to rebuild, so only the text is pickled
+        state = self.__dict__.copy()
+        state['_line_starts'] = None
+        return state
@@ -0,0 +1,269 @@
+import sys
+from array import array
+from bisect import bisect_left
+
+from .tokens import DELIM_TABLES, TOKEN_TYPES, TT_NEWLINE, TT_SPACE, TYPE_IDS, Tokens
+
+
+#######################################
+# TOKEN BUFFER
+#######################################
+
+# Tokens each slice of the columns holds when streaming with without()
+STREAM_BLOCK = 4096
+
+def shifted(column, lo, hi, delta):
+    if not delta:
+        return column[lo:hi]
+    return array(column.typecode, [offset + delta for offset in column[lo:hi]])
+
+
+class TokenBuffer:
+    """The lexer's output, kept as parallel array columns instead of one
+    Tokens object per token: type id, start offset, end offset and an index
+    into a table of interned values (-1 for tokens without a value).
+
+    Indexing and iteration hand out Tokens views built on demand, so the
+    Parser and the IDE token table can treat it like the old list.
+
+    After an incremental relex the offsets from shift_from on are stored
+    before the edit and read with `shift` added, so an edit only rewrites
+    the columns between it and the previous one.
+    """
+
+    def __init__(self, source=None):
+        self.source = source
+        self.types = array('B')
+        self.starts = array('I')
+        self.ends = array('I')
+        self.value_ids = array('i')
+        self.values = []
+        self.value_index = {}
+        self.shift_from = 0
+        self.shift = 0
+        # (start, end) of each comment, filled by a lex without trivia
+        self.comments = []
+
+    def intern(self, value):
+        if value is None:
+            return -1
+
+        if self.value_index is None:
+            self.value_index = {value: value_id for value_id, value in enumerate(self.values)}
+
+        value_id = self.value_index.get(value)
+        if value_id is None:
+            # Interned so equal names from any buffer or stream window are
+            # the same object, and symbol table lookups match on identity
+            value = sys.intern(value)
+            value_id = self.value_index[value] = len(self.values)
+            self.values.append(value)
+        return value_id
+
+    def add(self, type_, value, start, end):
+        if self.shift:
+            self.settle()
+
+        self.types.append(TYPE_IDS[type_])
+        self.starts.append(start)
+        self.ends.append(end)
+        self.value_ids.append(self.intern(value))
+
+    def append(self, token):
+        self.add(token.type, token.value, token.start, token.end)
+
+    def extend(self, buffer, offset=0, stop=None):
+        # Appends another buffer's tokens, moved by offset, under this
+        # buffer's value table
+        if self.shift:
+            self.settle()
+
+        stop = len(buffer) if stop is None else stop
+        if buffer.shift:
+            buffer = buffer[:stop]
+            buffer.settle()
+
+        value_ids = [self.intern(value) for value in buffer.values]
+        self.types += buffer.types[:stop]
+        self.starts += shifted(buffer.starts, 0, stop, offset)
+        self.ends += shifted(buffer.ends, 0, stop, offset)
+        self.value_ids += array('i', [value_ids[value_id] if value_id >= 0 else -1 for value_id in buffer.value_ids[:stop]])
+        # A new list, as slices share theirs with the buffer they came from
+        self.comments = self.comments + [(start + offset, end + offset) for start, end in buffer.comments]
+
+    def settle(self):
+        # Writes the pending shift into the columns, so tokens can be added
+        self.starts[self.shift_from:] = shifted(self.starts, self.shift_from, len(self), self.shift)
+        self.ends[self.shift_from:] = shifted(self.ends, self.shift_from, len(self), self.shift)
+        self.shift_from = 0
+        self.shift = 0
+
+    def type_at(self, idx):
+        return TOKEN_TYPES[self.types[idx]]
+
+    def start_at(self, idx):
+        if idx < 0:
+            idx += len(self)
+        return self.starts[idx] + (self.shift if idx >= self.shift_from else 0)
+
+    def end_at(self, idx):
+        if idx < 0:
+            idx += len(self)
+        return self.ends[idx] + (self.shift if idx >= self.shift_from else 0)
+
+    def index_at(self, offset):
+        # The first token starting at or after offset
+        if not self.shift:
+            return bisect_left(self.starts, offset)
+
+        idx = bisect_left(self.starts, offset, 0, self.shift_from)
+        if idx < self.shift_from:
+            return idx
+        return bisect_left(self.starts, offset - self.shift, self.shift_from, len(self))
+
+    def replace(self, lo, hi, tokens, delta, source):
+        """Returns a new buffer over `source` with the tokens in [lo, hi)
+        swapped for `tokens` and every token from hi on moved by delta.
+        """
+        buffer = TokenBuffer(source)
+        buffer.values = self.values
+        buffer.value_index = self.value_index
+
+        # Offsets still waiting on the previous shift are settled only
+        # where they end up before the new one
+        pending_from, pending = (self.shift_from, self.shift) if self.shift else (0, 0)
+
+        buffer.types = self.types[:lo]
+        buffer.value_ids = self.value_ids[:lo]
+        buffer.starts = self.starts[:min(lo, pending_from)]
+        buffer.ends = self.ends[:min(lo, pending_from)]
+        if pending_from < lo:
+            buffer.starts += shifted(self.starts, pending_from, lo, pending)
+            buffer.ends += shifted(self.ends, pending_from, lo, pending)
+
+        for token in tokens:
+            buffer.add(token.type, token.value, token.start, token.end)
+
+        if pending_from > hi:
+            buffer.starts += shifted(self.starts, hi, pending_from, delta)
+            buffer.ends += shifted(self.ends, hi, pending_from, delta)
+            hi_settled = pending_from
+        else:
+            hi_settled = hi
+
+        buffer.shift_from = len(buffer.starts)
+        buffer.shift = pending + delta
+        buffer.types += self.types[hi:]
+        buffer.value_ids += self.value_ids[hi:]
+        buffer.starts += self.starts[hi_settled:]
+        buffer.ends += self.ends[hi_settled:]
+
+        return buffer
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            lo, hi, step = idx.indices(len(self))
+            sliced = TokenBuffer(self.source)
+            # Shared, so neither buffer changes the list in place
+            sliced.comments = self.comments
+            if step != 1:
+                for i in range(lo, hi, step):
+                    sliced.append(self[i])
+                return sliced
+
+            # Slices share the value table and only copy the columns
+            sliced.types = self.types[lo:hi]
+            sliced.starts = self.starts[lo:hi]
+            sliced.ends = self.ends[lo:hi]
+            sliced.value_ids = self.value_ids[lo:hi]
+            sliced.values = self.values
+            sliced.value_index = self.value_index
+            sliced.shift_from = min(max(self.shift_from - lo, 0), len(sliced))
+            sliced.shift = self.shift
+            return sliced
+
+        value_id = self.value_ids[idx]
+        return Tokens(
+            TOKEN_TYPES[self.types[idx]],
+            self.values[value_id] if value_id >= 0 else None,
+            self.start_at(idx),
+            self.end_at(idx),
+            self.source,
+        )
+
+    def __iter__(self):
+        values = self.values
+        source = self.source
+        shift_from = self.shift_from if self.shift else len(self)
+        for shift, lo, hi in ((0, 0, shift_from), (self.shift, shift_from, len(self))):
+            columns = zip(self.types[lo:hi], self.starts[lo:hi], self.ends[lo:hi], self.value_ids[lo:hi])
+            for type_id, start, end, value_id in columns:
+                yield Tokens(TOKEN_TYPES[type_id], values[value_id] if value_id >= 0 else None, start + shift, end + shift, source)
+
+    def bad_delimiters(self):
+        """Yields the index of every token followed by a character its
+        delimiter table rejects, in one pass over the type and end columns.
+        """
+        text = self.source.text
+        # The lexer checks spaces and newlines against their own character,
+        # so only the other types have a delimiter to look at
+        tables = [
+            None if token_type in (TT_SPACE, TT_NEWLINE) else DELIM_TABLES.get(token_type)
+            for token_type in TOKEN_TYPES
+        ]
+        shift_from = self.shift_from if self.shift else len(self)
+
+        for shift, lo, hi in ((0, 0, shift_from), (self.shift, shift_from, len(self))):
+            for idx, type_id, end in zip(range(lo, hi), self.types[lo:hi], self.ends[lo:hi]):
+                delimiters = tables[type_id]
+                end += shift
+                if delimiters is None or end >= len(text):
+                    continue
+
+                char = text[end]
+                code = ord(char)
+                if not (delimiters[0][code] if code < 128 else char in delimiters[1]):
+                    yield idx
+
+    def without(self, *types, start=0):
+        # Filters on the type column so skipped tokens never get a view, and
+        # makes each view only when it is pulled. The columns are sliced a
+        # block at a time, so a stream that starts deep in the buffer or
+        # is dropped early copies only what it reached
+        skipped = {TYPE_IDS[type_] for type_ in types}
+        values = self.values
+        source = self.source
+        shift_from = self.shift_from if self.shift else len(self)
+        for shift, lo, hi in ((0, 0, shift_from), (self.shift, shift_from, len(self))):
+            for block_lo in range(max(lo, start), hi, STREAM_BLOCK):
+                block_hi = min(block_lo + STREAM_BLOCK, hi)
+                columns = zip(
+                    self.types[block_lo:block_hi], self.starts[block_lo:block_hi],
+                    self.ends[block_lo:block_hi], self.value_ids[block_lo:block_hi],
+                )
+                for type_id, token_start, token_end, value_id in columns:
+                    if type_id not in skipped:
+                        yield Tokens(TOKEN_TYPES[type_id], values[value_id] if value_id >= 0 else None, token_start + shift, token_end + shift, source)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def __getstate__(self):
+        # The arrays pickle as raw bytes. A slice shares the whole program's
+        # value table, so only the values its tokens use are pickled, under
+        # new ids. The index is left out and built again by the first
+        # intern(); values are interned again when extend() takes them
+        # into a buffer
+        state = self.__dict__.copy()
+        state['value_index'] = None
+
+        used = sorted(set(self.value_ids).difference((-1,)))
+        if len(used) < len(self.values):
+            new_ids = {value_id: new_id for new_id, value_id in enumerate(used)}
+            new_ids[-1] = -1
+            state['values'] = [self.values[value_id] for value_id in used]
+            state['value_ids'] = array('i', map(new_ids.__getitem__, self.value_ids))
+        return state
@@ -121,6 +121,31 @@ TT_FORMAT_SPECIFIER = "FORMAT SPECIFIER"
 TT_ADDRESS = "ADDRESS"
 TT_EOF      = 'EOF'
 
+# Every token type in definition order; TokenBuffer stores the index
+TOKEN_TYPES = tuple(dict.fromkeys(
+    value for name, value in list(globals().items()) if name.startswith('TT_')
+))
+TYPE_IDS = {token_type: type_id for type_id, token_type in enumerate(TOKEN_TYPES)}
+
+# Token categories, as sets so the parser tests membership by hash
+DATA_TYPES = frozenset({TT_INT, TT_FLOAT, TT_CHAR, TT_STRING, TT_BOOL})
+RETURN_TYPES = DATA_TYPES | {TT_VOID}
+SHIFT_TYPES = frozenset({TT_INT, TT_FLOAT, TT_CHAR, TT_BOOL})
+NUMERIC_TYPES = frozenset({TT_INT, TT_FLOAT})
+NUMERIC_LITERALS = frozenset({TT_INT_LITERAL, TT_FLOAT_LITERAL})
+VERACITY_LITERALS = frozenset({TT_TRUE, TT_FALSE, TT_NULL})
+TEXT_LITERALS = frozenset({TT_CHAR_LITERAL, TT_STRING_LITERAL})
+VALUE_LITERALS = TEXT_LITERALS | VERACITY_LITERALS
+CASE_LITERALS = NUMERIC_LITERALS | {TT_CHAR_LITERAL, TT_TRUE, TT_FALSE}
+ARGUMENT_TOKENS = NUMERIC_LITERALS | TEXT_LITERALS | {TT_IDENTIFIER, TT_TRUE, TT_FALSE}
+OUTPUT_OPERAND_TOKENS = NUMERIC_LITERALS | TEXT_LITERALS | VERACITY_LITERALS | {TT_IDENTIFIER, TT_PLUS, TT_MINUS, TT_MUL, TT_DIV, TT_LPAREN}
+SIGN_OPS = frozenset({TT_PLUS, TT_MINUS})
+UPDATE_OPS = frozenset({TT_INC, TT_DEC})
+LOGICAL_OPS = frozenset({TT_AND, TT_OR, TT_NOT})
+RELATIONAL_OPS = frozenset({TT_LESSTHAN, TT_GREATERTHAN, TT_LESSTHANEQUAL, TT_GREATERTHANEQUAL})
+ASSIGN_OPS = frozenset({TT_EQUAL, TT_PLUSAND, TT_MINUSAND, TT_MULAND, TT_DIVAND, TT_MODAND})
+TRIVIA = frozenset({TT_SPACE, TT_SLINECOM, TT_MLINECOM})
+
 ESC_SEQ = {
     'n': '\n',
     't': '\t',
@@ -158,6 +183,50 @@ DD_MAIN = [" ", "("]
 DD_IDENTIFIER = [*ALPHA_NUM, '_', ' ', '\n', ';', *ARITH_OP, *REL_OP, "(", ")", "[" ,"]", "{", "}", "%", ",", "=", ":"]
 DD_VALUES = [" ", "\n", ";", ")"]
 
+KEYWORDS = {
+    # MAIN
+    TT_MAIN: TT_MAIN,
+
+    # DATA TYPES
+    TT_INT: TT_INT,
+    TT_FLOAT: TT_FLOAT,
+    TT_CHAR: TT_CHAR,
+    TT_STRING: TT_STRING,
+    TT_BOOL: TT_BOOL,
+    TT_VOID: TT_VOID,
+    TT_CONST: TT_CONST,
+
+    # INPUT/OUTPUT
+    TT_INPUT: TT_INPUT,
+    TT_OUTPUT: TT_OUTPUT,
+
+    # CONDITIONAL STATEMENTS
+    TT_CASE: TT_CASE,
+    TT_IF: TT_IF,
+    TT_ELSE: TT_ELSE,
+    TT_SWITCH: TT_SWITCH,
+    TT_DEFAULT: TT_DEFAULT,
+
+    # LOOP STATEMENTS
+    TT_WHILE: TT_WHILE,
+    TT_FOR: TT_FOR,
+    TT_DO: TT_DO,
+
+    # LOOP CONTROL
+    TT_BREAK: TT_BREAK,
+    TT_CONTINUE: TT_CONTINUE,
+    TT_RETURN: TT_RETURN,
+
+    # VALUES
+    TT_TRUE: TT_TRUE,
+    TT_FALSE: TT_FALSE,
+    TT_NULL: TT_NULL,
+}
+
+KEYWORD_PREFIXES = {
+    keyword[:i] for keyword in KEYWORDS for i in range(1, len(keyword) + 1)
+}
+
 DELIM_LIST = {
     # MAIN
     TT_MAIN: DD_MAIN,
@@ -260,18 +329,47 @@ DELIM_LIST = {
 }
 
 
+def delimiter_table(delimiters):
+    # A 128-entry table for ASCII characters, with the rest in a set;
+    # entries like "==" can never equal one character, so they are dropped
+    ascii_table = bytearray(128)
+    other = set()
+    for delimiter in delimiters:
+        if len(delimiter) != 1:
+            continue
+        if ord(delimiter) < 128:
+            ascii_table[ord(delimiter)] = 1
+        else:
+            other.add(delimiter)
+    return bytes(ascii_table), frozenset(other)
+
+DELIM_TABLES = {
+    token_type: None if delimiters is None else delimiter_table(delimiters)
+    for token_type, delimiters in DELIM_LIST.items()
+}
+
+
 class Tokens:
-    def __init__(self, type_, value=None, pos_start=None, pos_end=None):
+    __slots__ = ('type', 'value', 'start', 'end', 'source')
+
+    def __init__(self, type_, value=None, start=None, end=None, source=None):
         self.type = type_
         self.value = value
-
-        if pos_start:
-            self.pos_start = pos_start.copy()
-            self.pos_end = pos_start.copy()
-            self.pos_end.advance()
-
-        if pos_end:
-            self.pos_end = pos_end
+        self.start = start
+        self.end = start + 1 if end is None and start is not None else end
+        self.source = source
+
+    @property
+    def pos_start(self):
+        if self.start is None:
+            return None
+        return self.source.position(self.start)
+
+    @property
+    def pos_end(self):
+        if self.start is None:
+            return None
+        return self.source.end_position(self.end)
 
     def __repr__(self):
         if self.value:
@@ -0,0 +1,179 @@
+from operator import is_
+
+from .nodes import Node
+
+
+#######################################
+# NODE VISITOR
+#######################################
+
+# Slots that never hold a child: spans and fields copied from a token
+NON_CHILD_FIELDS = {'pos_start', 'pos_end', 'id', 'value', 'body_errors'}
+
+# Slots read through a property, so a lazily parsed body is parsed first
+FIELD_PROPERTIES = {'_body': 'body'}
+
+_child_fields = {}
+
+
+def child_fields(node_class):
+    """The fields of a node class that can hold child nodes, in the order
+    of its __slots__. A field may hold a node, a token, None, or a list or
+    tuple of those.
+    """
+    fields = _child_fields.get(node_class)
+    if fields is None:
+        fields = []
+        for base in reversed(node_class.__mro__):
+            fields += [FIELD_PROPERTIES.get(field, field) for field in base.__dict__.get('__slots__', ()) if field not in NON_CHILD_FIELDS]
+        fields = _child_fields[node_class] = tuple(fields)
+    return fields
+
+
+def iter_child_nodes(node):
+    # The nodes directly under node, in field order, looking inside lists
+    # and tuples
+    for field in child_fields(type(node)):
+        value = getattr(node, field)
+        if isinstance(value, Node):
+            yield value
+        elif isinstance(value, (list, tuple)):
+            items = [value]
+            while items:
+                item = items.pop()
+                if isinstance(item, Node):
+                    yield item
+                elif isinstance(item, (list, tuple)):
+                    items.extend(reversed(item))
+
+
+def unchanged(items, value):
+    return len(items) == len(value) and all(map(is_, items, value))
+
+
+def walk(node):
+    """Every node under node, node included, in preorder, kept on a stack
+    of its own rather than Python's.
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(list(iter_child_nodes(node))))
+
+
+class DispatchTable(dict):
+    # Maps a node class to the visitor function for it, looked up on the
+    # first node of that class: visit_<Class> for the class or its nearest
+    # base that has one, or generic_visit
+    def __init__(self, visitor_class):
+        self.visitor_class = visitor_class
+
+    def __missing__(self, node_class):
+        for base in node_class.__mro__:
+            handler = getattr(self.visitor_class, f'visit_{base.__name__}', None)
+            if handler is not None:
+                break
+        else:
+            handler = self.visitor_class.generic_visit
+        self[node_class] = handler
+        return handler
+
+
+class NodeVisitor:
+    """Walks a tree calling visit_<Class>(node) for each node, where Class
+    is the node's class or one of its bases (visit_TokenNode sees every
+    Numeral, Decimal and Veracity node). Nodes without a method go to
+    generic_visit, which visits their children.
+
+    Handlers are resolved once per node class and visitor class. Nodes that
+    only reach the base generic_visit are walked with an explicit stack, so
+    a pass recurses only through the handlers it defines.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.dispatch = DispatchTable(cls)
+
+    def visit(self, node):
+        return self.dispatch[type(node)](self, node)
+
+    def generic_visit(self, node):
+        dispatch = self.dispatch
+        stack = list(iter_child_nodes(node))
+        stack.reverse()
+
+        while stack:
+            node = stack.pop()
+            handler = dispatch[type(node)]
+            if handler is NodeVisitor.generic_visit:
+                children = list(iter_child_nodes(node))
+                children.reverse()
+                stack += children
+            else:
+                handler(self, node)
+
+NodeVisitor.dispatch = DispatchTable(NodeVisitor)
+
+
+class NodeTransformer(NodeVisitor):
+    """A NodeVisitor whose handlers return the node to put in place of the
+    one visited: the node itself to keep it, another node to replace it, or
+    None to drop it. In a list a handler may also return a list, which is
+    spliced in. generic_visit transforms the children and keeps the node.
+    """
+
+    def generic_visit(self, node):
+        dispatch = self.dispatch
+        # What each node visited below node was transformed into
+        results = {}
+        # (node, True) once its children are pushed, so it is rebuilt after
+        # them
+        stack = [(node, True)]
+        stack += [(child, False) for child in reversed(list(iter_child_nodes(node)))]
+
+        while stack:
+            current, expanded = stack.pop()
+
+            if expanded:
+                self.replace_children(current, results)
+                results[id(current)] = current
+                continue
+
+            handler = dispatch[type(current)]
+            if handler is NodeTransformer.generic_visit:
+                stack.append((current, True))
+                stack += [(child, False) for child in reversed(list(iter_child_nodes(current)))]
+            else:
+                results[id(current)] = handler(self, current)
+
+        return node
+
+    def replace_children(self, node, results):
+        for field in child_fields(type(node)):
+            value = getattr(node, field)
+            if isinstance(value, (Node, list, tuple)):
+                new_value = self.replaced(value, results)
+                if new_value is not value:
+                    setattr(node, field, new_value)
+
+    def replaced(self, value, results):
+        # value with each node in it swapped for what it was transformed into
+        if isinstance(value, Node):
+            return results.pop(id(value), value)
+
+        if isinstance(value, list):
+            items = []
+            for item in value:
+                new_item = self.replaced(item, results)
+                if isinstance(item, Node) and isinstance(new_item, list):
+                    items += new_item
+                elif new_item is not None:
+                    items.append(new_item)
+            return value if unchanged(items, value) else items
+
+        if isinstance(value, tuple):
+            items = tuple(self.replaced(item, results) for item in value)
+            return value if unchanged(items, value) else items
+
+        return value
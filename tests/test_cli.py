@@ -0,0 +1,62 @@
+import sys
+
+from imp_code import cli
+from imp_code.components import parallel_parser
+
+FUNCTION = '''Numeral f{n}(Numeral a) {{
+    Numeral c = a * {n} + 2;
+    Recede c;
+}}
+'''
+
+PROGRAM = ''.join(FUNCTION.format(n=n) for n in range(4)) + '''Embark() {
+    Numeral x = 1;
+    Recede 0;
+}
+'''
+
+
+def run_cli(monkeypatch, capsys, tmp_path, text, *options):
+    path = tmp_path / 'prog.ic'
+    path.write_text(text)
+    monkeypatch.setattr(sys, 'argv', ['ic', str(path), *options])
+    cli.main()
+    return capsys.readouterr().out
+
+
+def test_syntax_mode_prints_the_tree(monkeypatch, capsys, tmp_path):
+    out = run_cli(monkeypatch, capsys, tmp_path, PROGRAM, '-m', 'syntax')
+
+    assert 'AST:' in out
+
+
+def test_syntax_mode_with_jobs_checks_bodies_in_workers(monkeypatch, capsys, tmp_path):
+    monkeypatch.setattr(parallel_parser, 'PARALLEL_MIN_TOKENS', 0)
+    calls = []
+    check_syntax = cli.check_syntax
+    monkeypatch.setattr(cli, 'check_syntax', lambda *args: calls.append(args) or check_syntax(*args))
+
+    out = run_cli(monkeypatch, capsys, tmp_path, PROGRAM, '-m', 'syntax', '-j', '2')
+    assert len(calls) == 1
+    assert 'AST:' not in out and 'Invalid Syntax' not in out
+
+    out = run_cli(monkeypatch, capsys, tmp_path, PROGRAM.replace('Recede c;', 'Recede ;'), '-m', 'syntax', '-j', '2')
+    assert out.count('Invalid Syntax') == 4
+
+
+def test_syntax_mode_with_jobs_and_verbose_prints_the_tree(monkeypatch, capsys, tmp_path):
+    monkeypatch.setattr(cli, 'check_syntax', None)
+
+    out = run_cli(monkeypatch, capsys, tmp_path, PROGRAM, '-m', 'syntax', '-j', '2', '-v')
+
+    assert 'AST:' in out
+
+
+def test_syntax_mode_prints_deeply_nested_trees(monkeypatch, capsys, tmp_path):
+    chain = ' + '.join(['1'] * 3000)
+    text = f'Embark() {{ Numeral x = {chain}; {"Thou (x) { " * 1000}x = 1;{" }" * 1000} }}'
+
+    out = run_cli(monkeypatch, capsys, tmp_path, text, '-m', 'syntax')
+
+    assert 'Invalid Syntax' not in out
+    assert out.count('Numeral_Lit: 1') == 3001
@@ -0,0 +1,159 @@
+import os
+import struct
+import sys
+import zlib
+
+from imp_code.compiler import run_syntax
+from imp_code.utils import compile_cache
+from imp_code.utils.compile_cache import BYTE_ORDERS, CACHE_DIR, HEADER, TRAILER, dump_program, load_program
+from imp_code.utils.node_arena import NodeArena
+
+PROGRAM = '''Constant Numeral limit = 10;
+Numeral total = 0;
+
+Numeral add(Numeral a, Numeral b) {
+    Recede a + b;
+}
+
+Embark() {
+    Numeral i = 0;
+    Until (i < limit) {
+        total += i;
+        i++;
+    }
+    Thou (total > 5) {
+        Emit("%d", total);
+    } Or {
+        Emit("none");
+    }
+    // a comment
+    Recede 0;
+}
+'''
+
+
+def parse(fn, text=PROGRAM):
+    tokens, ast, errors = run_syntax(fn, text)
+    assert errors is None
+    return tokens, ast
+
+
+def dumped(fn='test.ic'):
+    tokens, ast = parse(fn)
+    return dump_program(tokens, NodeArena.from_node(ast, tokens))
+
+
+def test_store_and_load_round_trip(tmp_path):
+    path = tmp_path / 'prog.ic'
+    path.write_text(PROGRAM)
+    fn = str(path)
+
+    tokens, ast = parse(fn)
+    assert compile_cache.load(fn, PROGRAM) is None
+
+    compile_cache.store(fn, PROGRAM, tokens, ast)
+    assert os.listdir(tmp_path / CACHE_DIR)
+
+    cached_tokens, cached_ast = compile_cache.load(fn, PROGRAM)
+    assert repr(cached_ast) == repr(ast)
+    assert repr(cached_tokens) == repr(tokens)
+    assert cached_tokens.comments == tokens.comments
+
+
+def test_run_syntax_reads_back_its_own_cache(tmp_path):
+    path = tmp_path / 'prog.ic'
+    path.write_text(PROGRAM)
+
+    first = run_syntax(str(path), PROGRAM, cache=True)
+    second = run_syntax(str(path), PROGRAM, cache=True)
+
+    assert repr(second[1]) == repr(first[1])
+    assert repr(second[0]) == repr(first[0])
+
+
+def test_other_text_misses(tmp_path):
+    path = tmp_path / 'prog.ic'
+    path.write_text(PROGRAM)
+    tokens, ast = parse(str(path))
+    compile_cache.store(str(path), PROGRAM, tokens, ast)
+
+    assert compile_cache.load(str(path), PROGRAM.replace('10', '11')) is None
+
+
+def test_truncated_data_is_rejected():
+    data = dumped()
+
+    for size in range(len(data)):
+        assert load_program(data[:size], 'test.ic', PROGRAM) is None
+    assert load_program(data + b'\0', 'test.ic', PROGRAM) is None
+
+
+def test_wrong_magic_is_rejected():
+    data = dumped()
+
+    assert load_program(b'XXXX' + data[4:], 'test.ic', PROGRAM) is None
+
+
+def test_wrong_format_is_rejected():
+    data = bytearray(dumped())
+    data[4] += 1
+
+    assert load_program(bytes(data), 'test.ic', PROGRAM) is None
+
+
+def test_wrong_byte_order_is_rejected():
+    data = bytearray(dumped())
+    other = 'big' if sys.byteorder == 'little' else 'little'
+    struct.pack_into('<B', data, 5, BYTE_ORDERS[other])
+
+    assert load_program(bytes(data), 'test.ic', PROGRAM) is None
+
+
+def test_unreadable_cache_file_misses(tmp_path):
+    path = tmp_path / 'prog.ic'
+    path.write_text(PROGRAM)
+    cache_file = compile_cache.cache_path(str(path), PROGRAM)
+    os.makedirs(os.path.dirname(cache_file))
+    with open(cache_file, 'wb') as file:
+        file.write(dumped(str(path))[:10])
+
+    assert compile_cache.load(str(path), PROGRAM) is None
+
+
+
+def test_damaged_data_is_rejected():
+    data = dumped()
+
+    for idx in range(len(data)):
+        corrupt = bytearray(data)
+        corrupt[idx] ^= 0x10
+        assert load_program(bytes(corrupt), 'test.ic', PROGRAM) is None
+
+
+def test_corrupt_columns_are_rejected_or_read_back():
+    # Bytes changed before the checksum was taken still load without
+    # raising, as None or a tree
+    data = dumped()[:-TRAILER.size]
+
+    for idx in range(HEADER.size, len(data)):
+        for flip in (0x01, 0x80, 0xff):
+            corrupt = bytearray(data)
+            corrupt[idx] ^= flip
+            corrupt += TRAILER.pack(zlib.crc32(corrupt))
+            load_program(bytes(corrupt), 'test.ic', PROGRAM)
+
+
+def test_corrupt_cache_file_misses(tmp_path):
+    path = tmp_path / 'prog.ic'
+    path.write_text(PROGRAM)
+    data = bytearray(dumped(str(path))[:-TRAILER.size])
+    # The kind of the root row, the first of the arena's kind column
+    n_rows = HEADER.unpack_from(data)[-1]
+    data[-n_rows * 13] ^= 0xff
+    data += TRAILER.pack(zlib.crc32(data))
+    cache_file = compile_cache.cache_path(str(path), PROGRAM)
+    os.makedirs(os.path.dirname(cache_file))
+    with open(cache_file, 'wb') as file:
+        file.write(bytes(data))
+
+    assert compile_cache.load(str(path), PROGRAM) is None
@@ -0,0 +1,167 @@
+import operator
+import random
+from fractions import Fraction
+
+from imp_code.compiler import run_semantic
+from imp_code.components.optimizer import token_of
+from imp_code.utils.nodes import BinOpNode
+
+
+def optimize(body, globals_=''):
+    text = f'{globals_}\nEmbark() {{\n{body}\n    Recede 0;\n}}\n'
+    tokens, ast, analyzer, errors = run_semantic('test.ic', text)
+    assert errors is None
+    return run_semantic('test.ic', text, optimize=True)
+
+
+def folded(expression, var_type='Decimal'):
+    # The node the initializer of one declaration folds to
+    tokens, ast, analyzer, errors = optimize(f'    {var_type} v = {expression};')
+    assert errors is None, [error.as_string() for error in errors]
+    return ast.embark_node.statements[0].identifiers[0][1]
+
+
+def value_text(node):
+    return token_of(node).value
+
+
+def error_messages(expression, var_type='Decimal'):
+    tokens, ast, analyzer, errors = optimize(f'    {var_type} v = {expression};')
+    return [f'{error.error_name}: {error.details}' for error in errors or []]
+
+
+def test_decimals_fold_at_full_precision():
+    assert value_text(folded('1.0 / 3.0 * 3.0')) == '1.0'
+    assert value_text(folded('0.1 + 0.2')) == '0.3'
+    assert value_text(folded('1.0 / 3.0')) == '0.333333'
+    assert value_text(folded('2.0 / 3.0')) == '0.666667'
+
+
+def test_no_division_by_a_value_rounded_to_zero():
+    assert value_text(folded('1.0 / (0.000001 * 0.1)')) == '10000000.0'
+
+
+def test_a_decimal_rounding_to_zero_is_left_unfolded():
+    node = folded('0.000001 * 0.1')
+
+    assert isinstance(node, BinOpNode)
+    assert value_text(node.left_node) == '1e-06'
+
+
+def test_decimal_literals_are_fixed_point():
+    assert value_text(folded('0.000001 * 1.0')) == '0.000001'
+    assert value_text(folded('0.000002 / 2')) == '0.000001'
+    assert value_text(folded('123456.5 * 1000')) == '123456500.0'
+
+
+def test_numeral_division_truncates_toward_zero():
+    assert value_text(folded('-7 / 2', 'Numeral')) == '-3'
+    assert value_text(folded('7 / -2', 'Numeral')) == '-3'
+    assert value_text(folded('-7 / -2', 'Numeral')) == '3'
+    assert value_text(folded('7 / 2', 'Numeral')) == '3'
+
+
+def test_division_by_zero():
+    assert error_messages('5 / (3 - 3)', 'Numeral') == ['Semantic Error: Division by zero']
+    assert error_messages('1.5 / (0.5 - 0.5)') == ['Semantic Error: Division by zero']
+
+
+def test_numeral_past_int_lim():
+    assert error_messages('99999 * 99999', 'Numeral') == ['Exceed Numeral: 9999800001']
+    assert error_messages('-999999999 - 1', 'Numeral') == ['Exceed Numeral: -1000000000']
+    assert value_text(folded('999999998 + 1', 'Numeral')) == '999999999'
+
+
+def test_only_the_outermost_value_past_a_limit_is_reported():
+    assert error_messages('99999 * 99999 * 99999', 'Numeral') == ['Exceed Numeral: 999970000299999']
+
+
+def test_limits_apply_to_the_folded_value_only():
+    assert value_text(folded('99999 * 99999 / 99999', 'Numeral')) == '99999'
+
+
+def test_decimal_past_float_lim():
+    assert error_messages('99999999.5 * 100') == ['Exceed Decimal: 9999999950.0']
+    assert value_text(folded('99999999.5 * 10')) == '999999995.0'
+
+
+def test_operands_of_a_reported_operator_still_fold():
+    tokens, ast, analyzer, errors = optimize('    Numeral v = (2 + 3) * 99999 * 99999;')
+
+    node = ast.embark_node.statements[0].identifiers[0][1]
+    assert [error.error_name for error in errors] == ['Exceed Numeral']
+    assert isinstance(node, BinOpNode)
+    assert value_text(node.left_node) == '499995'
+    assert value_text(node.right_node) == '99999'
+
+
+def test_constants_are_propagated():
+    tokens, ast, analyzer, errors = optimize(
+        '    Numeral n = k * 2;\n    Decimal d = e / 4;\n    Numeral m = n + k;',
+        'Constant Numeral k = 3 + 4;\nConstant Decimal e = 2;',
+    )
+
+    assert errors is None
+    declared = [statement.identifiers[0][1] for statement in ast.embark_node.statements[:3]]
+    assert value_text(declared[0]) == '14'
+    assert value_text(declared[1]) == '0.5'
+    assert isinstance(declared[2], BinOpNode)
+    assert value_text(declared[2].right_node) == '7'
+
+
+def test_shadowing_variables_are_not_propagated():
+    tokens, ast, analyzer, errors = optimize(
+        '    Numeral k = 5;\n    Numeral z = k * 3;\n'
+        '    Thou (z > 1) {\n        Constant Numeral k = 4;\n        z = k + 1;\n    }\n    z = k + 1;',
+        'Constant Numeral k = 2;',
+    )
+
+    assert errors is None
+    statements = ast.embark_node.statements
+    assert isinstance(statements[1].identifiers[0][1], BinOpNode)
+    assert value_text(statements[2].statements[1].expr) == '5'
+    assert isinstance(statements[3].expr, BinOpNode)
+
+
+OPERATORS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': lambda left, right: Fraction(left) / right,
+}
+
+
+def expression(rng, depth=0):
+    # A random constant expression and its exact value, or None for a value
+    # that divides by zero
+    if depth > 3 or rng.random() < 0.3:
+        text = rng.choice(['0', '1', '7', '12', '0.5', '0.25', '2.5', '0.000001', '3.125'])
+        return text, Fraction(text) if '.' in text else int(text)
+
+    left, left_value = expression(rng, depth + 1)
+    right, right_value = expression(rng, depth + 1)
+    op = rng.choice('+-*/')
+    text = f'({left} {op} {right})'
+    if left_value is None or right_value is None or (op == '/' and right_value == 0):
+        return text, None
+    if op == '/' and isinstance(left_value, int) and isinstance(right_value, int):
+        quotient = abs(left_value) // abs(right_value)
+        return text, -quotient if (left_value < 0) != (right_value < 0) else quotient
+    return text, OPERATORS[op](left_value, right_value)
+
+
+def test_optimizing_adds_no_errors_to_a_valid_program():
+    rng = random.Random(0)
+    checked = 0
+
+    while checked < 200:
+        text, value = expression(rng)
+        if value is None or abs(value) >= 10 ** 9:
+            continue
+        checked += 1
+
+        node = folded(text)
+        if round(value, 6) == 0 != value:
+            assert isinstance(node, BinOpNode), text
+        else:
+            assert Fraction(value_text(node)) == round(value, 6), text
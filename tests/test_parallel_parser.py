@@ -0,0 +1,81 @@
+from imp_code import compiler
+from imp_code.compiler import LEXER_ENGINES, check_syntax, run_syntax
+from imp_code.components import parallel_parser
+from imp_code.components.parallel_parser import parse_parallel
+from imp_code.components.syntax import Parser
+from imp_code.utils.nodes import FuncDefNode
+
+FUNCTION = '''Numeral f{n}(Numeral a, Decimal b) {{
+    Numeral c = a * {n} + 2;
+    Thou (c > 3) {{
+        c = c - 1;
+    }} Or {{
+        Emit("%d", c);
+    }}
+    Recede c;
+}}
+'''
+
+PROGRAM = ''.join(FUNCTION.format(n=n) for n in range(12)) + '''Embark() {
+    Numeral x = 1;
+    Recede 0;
+}
+'''
+
+
+def lex(text):
+    tokens, errors = LEXER_ENGINES['state']('test.ic', text, trivia=False).make_tokens()
+    assert not errors
+    return tokens
+
+
+def read_bodies(program):
+    for statement in program.global_statements:
+        if isinstance(statement, FuncDefNode):
+            statement.body
+    return program
+
+
+def messages(errors):
+    return [error.as_string() for error in errors or []]
+
+
+def test_pool_parse_matches_serial_parse(monkeypatch):
+    monkeypatch.setattr(parallel_parser, 'PARALLEL_MIN_TOKENS', 0)
+
+    program, errors = parse_parallel(lex(PROGRAM), jobs=2)
+
+    assert errors is None
+    assert repr(read_bodies(program)) == repr(Parser(lex(PROGRAM)).parse().node)
+
+
+def test_pool_parse_reports_body_errors_in_source_order(monkeypatch):
+    monkeypatch.setattr(parallel_parser, 'PARALLEL_MIN_TOKENS', 0)
+    text = PROGRAM.replace('c = c - 1;', 'c = ;', 1).replace('Recede c;', 'Recede ;')
+
+    parser = Parser(lex(text))
+    parser.parse()
+    program, errors = parse_parallel(lex(text), jobs=2)
+
+    assert program is None
+    assert messages(errors) == messages(parser.errors)
+
+
+def test_check_syntax_matches_run_syntax(monkeypatch):
+    monkeypatch.setattr(parallel_parser, 'PARALLEL_MIN_TOKENS', 0)
+    text = PROGRAM.replace('Numeral c = a', 'Numeral c = ', 1)
+
+    assert check_syntax('test.ic', PROGRAM, jobs=2) is None
+    assert messages(check_syntax('test.ic', text, jobs=2)) == messages(run_syntax('test.ic', text)[2])
+
+
+def test_jobs_lex_in_parallel_and_keep_the_tree(monkeypatch):
+    monkeypatch.setattr(compiler, 'PARALLEL_MIN_SIZE', 0)
+
+    tokens, ast, errors = run_syntax('test.ic', PROGRAM, jobs=2)
+    serial_tokens, serial_ast, serial_errors = run_syntax('test.ic', PROGRAM)
+
+    assert errors is serial_errors is None
+    assert repr(tokens) == repr(serial_tokens)
+    assert repr(ast) == repr(serial_ast)
+    assert not any(callable(statement._body) for statement in ast.global_statements if isinstance(statement, FuncDefNode))
@@ -0,0 +1,112 @@
+from imp_code.compiler import run_semantic
+
+
+def details(text):
+    tokens, ast, analyzer, errors = run_semantic('test.ic', text)
+    for error in errors or []:
+        assert error.error_name == 'Semantic Error', error.as_string()
+    return [error.details for error in errors or []]
+
+
+def test_valid_program_has_no_errors():
+    assert details('''Constant Numeral limit = 3;
+Numeral f(Numeral a, Decimal b);
+
+Embark() {
+    Numeral x = 1 + 2 + 3;
+    Decimal d = x * 1.5 + 2;
+    Numeral r = f(x, d) + f(1, 2);
+    Per (Numeral i = 0; i < limit; i++) {
+        Thou (i == 1) {
+            Extend;
+        }
+        Halt;
+    }
+    Recede 0;
+}
+
+Numeral f(Numeral a, Decimal b) {
+    Recede a;
+}
+''') == []
+
+
+def test_undeclared_names():
+    assert details('Embark() { x = 1; Numeral y = z + 1; Numeral w = w + 1; }') == [
+        "Undeclared variable 'x'",
+        "Undeclared variable 'z'",
+        "Undeclared variable 'w'",
+    ]
+
+
+def test_undeclared_function():
+    assert details('Embark() { g(); Numeral r = h(1); }') == [
+        "Undeclared function 'g'",
+        "Undeclared function 'h'",
+    ]
+
+
+def test_names_do_not_leak_out_of_their_scope():
+    assert details('Numeral f(Numeral a) { Recede a; } Embark() { a = 1; }') == ["Undeclared variable 'a'"]
+    assert details('Embark() { Thou (1 < 2) { Numeral t = 1; } t = 2; }') == ["Undeclared variable 't'"]
+    assert details('Embark() { Per (Numeral i = 0; i < 3; i++) { Emit("%d", i); } i = 1; }') == ["Undeclared variable 'i'"]
+
+
+def test_inner_scopes_may_shadow():
+    assert details("Numeral y = 1; Embark() { Decimal y = 2.0; Thou (y > 1) { Letter y = 'a'; } }") == []
+
+
+def test_redeclaration_in_one_scope():
+    assert details('Embark() { Numeral y = 1; Decimal y = 2.0; }') == ["'y' is already declared in this scope"]
+
+
+def test_assignment_to_a_constant():
+    assert details('Embark() { Constant Numeral k = 1; k = 2; k += 1; k++; }') == [
+        "Cannot assign to the Constant 'k'",
+        "Cannot assign to the Constant 'k'",
+        "Cannot update the Constant 'k'",
+    ]
+
+
+def test_call_arity():
+    assert details('Numeral f(Numeral a, Decimal b); Embark() { f(1, 2); f(1); Numeral r = f(1, 2, 3); } '
+                   'Numeral f(Numeral a, Decimal b) { Recede a; }') == [
+        "Function 'f' takes 2 arguments but got 1",
+        "Function 'f' takes 2 arguments but got 3",
+    ]
+
+
+def test_call_argument_types():
+    assert details('Numeral f(Numeral a, Decimal b); Embark() { f(1.5, 2); f(1, "s"); } '
+                   'Numeral f(Numeral a, Decimal b) { Recede a; }') == [
+        "Type mismatch: argument 1 of 'f' is Numeral, but got Decimal",
+        "Type mismatch: argument 2 of 'f' is Decimal, but got Missive",
+    ]
+
+
+def test_call_result_type():
+    assert details('Numeral f(Numeral a) { Recede a; } Embark() { Missive m = f(1); Decimal d = f(1); }') == [
+        "Type mismatch: 'm' is Missive, but got Numeral",
+    ]
+
+
+def test_return_type():
+    assert details('Numeral f() { Recede 1.5; } Embark() { Recede 0; }') == [
+        'Type mismatch: function returns Numeral, but got Decimal',
+    ]
+
+
+def test_halt_and_extend_outside_a_loop():
+    assert details('Embark() { Halt; Extend; }') == [
+        "'Halt' can only be used inside a loop or Shift",
+        "'Extend' can only be used inside a loop",
+    ]
+    assert details('Embark() { Numeral n = 1; Until (n) { Thou (n) { Halt; } Extend; } }') == []
+
+
+def test_type_mismatch_at_the_end_of_a_long_chain():
+    chain = ' + '.join(['1'] * 3000)
+
+    assert details(f'Embark() {{ Missive s = "a"; Numeral x = {chain} + s; }}') == [
+        "Type mismatch: Cannot perform '+' between Numeral and Missive",
+    ]
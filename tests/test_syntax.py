@@ -0,0 +1,88 @@
+import pytest
+
+from imp_code.compiler import run_syntax
+
+
+def messages(text):
+    tokens, ast, errors = run_syntax('test.ic', text)
+    return [error.details for error in errors or []]
+
+
+@pytest.mark.parametrize('text', [
+    'Embark() { < Until (',
+    'Embark() { ; Until (',
+    'Embark() { x',
+    'Embark() { x <',
+    'Embark() { x ++',
+    'Embark() { f(',
+    'Embark() { Numeral',
+    'Numeral',
+    'Numeral f',
+])
+def test_truncated_input_is_a_syntax_error(text):
+    assert messages(text)
+
+
+def test_every_prefix_of_a_program_parses_or_fails_cleanly():
+    text = '''Numeral f(Numeral a) {
+    Recede a + 1;
+}
+
+Embark() {
+    Numeral x = f(1);
+    Per (Numeral i = 0; i < 3; i++) { Emit("%d", i); }
+    Act { x++; } Until (x < 4);
+    Thou (x > 1 && x < 9) { Emit("a"); } Or { Emit("c"); }
+}
+'''
+    assert messages(text) == []
+    for size in range(len(text)):
+        messages(text[:size])
+
+
+def shift(body):
+    return messages(f'Embark() {{ Numeral x = 1; Shift (x) {{ {body} }} x = ; }}')
+
+
+def test_shift_reports_a_stray_token_and_goes_on():
+    assert shift('1: Halt; Usual: Halt;') == [
+        "Expected 'Opt' or 'Usual'",
+        'Expected Numeral, Decimal values, or a valid Identifier',
+    ]
+    assert shift('Pure Opt 1: Halt; Opt 2: Halt;') == [
+        "Expected 'Opt' or 'Usual'",
+        'Expected Numeral, Decimal values, or a valid Identifier',
+    ]
+
+
+def test_shift_reports_broken_labels_and_checks_their_statements():
+    assert shift('Opt 1: x = ; Halt; Opt 2 Halt; Opt x: x = ; Usual: Halt;') == [
+        'Expected Numeral, Decimal values, or a valid Identifier',
+        "Expected ':'",
+        'Expected a Numeral, Decimal, Veracity, or Letter literal',
+        'Expected Numeral, Decimal values, or a valid Identifier',
+        'Expected Numeral, Decimal values, or a valid Identifier',
+    ]
+
+
+def test_shift_with_only_usual():
+    tokens, ast, errors = run_syntax('test.ic', 'Embark() { Numeral x = 1; Shift (x) { Usual: Halt; } }')
+
+    assert errors is None
+    node = ast.embark_node.statements[1]
+    assert node.cases == [] and node.cases_tok == []
+    assert len(node.default_case) == 1
+
+
+def test_shift_keeps_every_case_token():
+    tokens, ast, errors = run_syntax('test.ic', 'Embark() { Numeral x = 1; Shift (x) { Opt 1: Halt; Usual: Halt; Opt 2: Halt; } }')
+
+    assert errors is None
+    node = ast.embark_node.statements[1]
+    assert [case_tok for case_tok, case_expr, statements in node.cases] == node.cases_tok
+    assert [case_expr.value for case_tok, case_expr, statements in node.cases] == ['1', '2']
+
+
+@pytest.mark.parametrize('body', ['Opt 1: Halt;', 'Opt 1', 'Opt', 'Usual', 'Usual:'])
+def test_truncated_shift_is_a_syntax_error(body):
+    assert messages(f'Embark() {{ Numeral x = 1; Shift (x) {{ {body}')
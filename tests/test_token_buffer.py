@@ -0,0 +1,57 @@
+import pickle
+
+from imp_code.compiler import LEXER_ENGINES
+
+TEXT = '''Numeral alpha = 1; // first
+Numeral beta = 2; // second
+Embark() {
+    Missive gamma = "text";
+    alpha = beta;
+}
+'''
+
+
+def lex(text=TEXT):
+    tokens, errors = LEXER_ENGINES['state']('test.ic', text, trivia=False).make_tokens()
+    assert not errors
+    return tokens
+
+
+def test_extending_a_slice_leaves_the_buffer_alone():
+    tokens = lex()
+    comments = list(tokens.comments)
+
+    sliced = tokens[:5]
+    sliced.extend(lex(), offset=len(TEXT))
+
+    assert tokens.comments == comments
+    assert len(sliced.comments) == 2 * len(comments)
+
+
+def test_a_pickled_slice_carries_only_its_own_values():
+    tokens = lex()
+    body = [idx for idx, token in enumerate(tokens) if token.value == 'gamma'][0]
+
+    sliced = pickle.loads(pickle.dumps(tokens[body:body + 3]))
+
+    assert sorted(sliced.values) == ['"text"', '=', 'gamma']
+    assert len(tokens.values) > 3
+    assert repr(sliced) == repr(tokens[body:body + 3])
+
+
+def test_an_unpickled_buffer_interns_new_values():
+    tokens = lex()
+    sliced = pickle.loads(pickle.dumps(tokens[:3]))
+
+    assert sliced.intern('alpha') == sliced.values.index('alpha')
+    assert sliced.intern('delta') == len(sliced.values) - 1
+    assert sliced.values[-1] == 'delta'
+
+
+def test_a_pickled_buffer_round_trips():
+    tokens = lex()
+    loaded = pickle.loads(pickle.dumps(tokens))
+
+    assert repr(loaded) == repr(tokens)
+    assert loaded.values == tokens.values
+    assert loaded.comments == tokens.comments